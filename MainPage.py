@@ -10,8 +10,22 @@ import time
 import threading
 import subprocess
 import sys
+import glob
 import math
 
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(APP_DIR, "Modes"))
+sys.path.append(os.path.join(APP_DIR, "Modes", "Drills"))
+from grading import format_alignment
+from event_log import EventLog, EventTail, DRILL_LOG, TRANSLATION_LOG, SYSTEM_LOG
+from model_host import launch_hosted, stop_host
+from timing import read_stats as read_stage_timings
+from ui_watchdog import install_from_env as install_ui_watchdog
+
+# Status/clear/control events written by the GUI itself
+translation_log = EventLog(TRANSLATION_LOG)
+drill_log = EventLog(DRILL_LOG)
+
 
 ctk.set_appearance_mode("light")  
 ctk.set_default_color_theme("blue")
@@ -42,37 +56,131 @@ COLOR_THEMES = {
 }
 
 CURRENT_THEME = "Blue"
+SETTINGS_PATH = os.path.join(APP_DIR, "theme_settings.json")
 
 def get_current_theme():
     global CURRENT_THEME
     return COLOR_THEMES[CURRENT_THEME]
 
+def load_theme():
+    """Restore the saved theme; called once before the first page is built."""
+    global CURRENT_THEME
+    try:
+        with open(SETTINGS_PATH, "r") as f:
+            saved_theme = json.load(f).get("theme", "Blue")
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        print(f"No saved theme found or error loading theme: {e}")
+        return
+    if saved_theme in COLOR_THEMES:
+        CURRENT_THEME = saved_theme
+
+def save_settings(settings):
+    try:
+        tmp_path = f"{SETTINGS_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(settings, f)
+        os.replace(tmp_path, SETTINGS_PATH)
+    except OSError as e:
+        print(f"Error saving theme: {e}")
+
 def set_theme(theme_name):
     global CURRENT_THEME
-    if theme_name in COLOR_THEMES:
+    if theme_name in COLOR_THEMES and theme_name != CURRENT_THEME:
         CURRENT_THEME = theme_name
-        # Save theme to file
-        try:
-            with open("theme_settings.json", "w") as f:
-                json.dump({"theme": theme_name}, f)
-        except Exception as e:
-            print(f"Error saving theme: {e}") 
+        save_settings({"theme": theme_name})
+        themes.recolor()
+
+class ThemeRegistry:
+    """Widget options tied to COLOR_THEMES roles, recolored in one pass when the theme changes.
+
+    A page subscribes the options it colors from the theme, naming the role
+    each one plays, e.g. themes.subscribe(self.title, fg_color="primary"), so
+    set_theme() can recolor the page on screen instead of rebuilding it.
+    Colors that are not subscribed stay as the page set them.
+    """
+
+    def __init__(self):
+        self.subscriptions = {}   # widget -> {option: role}
+
+    def subscribe(self, widget, **roles):
+        theme = get_current_theme()
+        for option, role in roles.items():
+            if role not in theme:
+                raise KeyError(f"Unknown theme role {role!r} for {option}")
+        self.subscriptions.setdefault(widget, {}).update(roles)
+        restyle(widget, **{option: theme[role] for option, role in roles.items()})
+        return widget
+
+    def forget_destroyed(self):
+        for widget in [w for w in self.subscriptions if not w.winfo_exists()]:
+            del self.subscriptions[widget]
+
+    def recolor(self):
+        self.forget_destroyed()
+        theme = get_current_theme()
+        # All in one callback, so Tk redraws once when it is next idle
+        for widget, roles in self.subscriptions.items():
+            restyle(widget, **{option: theme[role] for option, role in roles.items()})
+
+themes = ThemeRegistry()
+
+SCALE_STEP = 0.05          # Fonts and images only change when the scale crosses a step
+IMAGE_HEIGHT_STEP = int(1080 * SCALE_STEP)   # The same step in pixels of page height, for images
+RESIZE_DEBOUNCE_MS = 100   # Quiet time after the last <Configure> before pages relayout
+RESIZE_MAX_WAIT = 0.5      # ...but a continuous resize still relayouts this often (seconds)
+
+def scale_bucket(width, height):
+    return round(min(width / 1920, height / 1080) / SCALE_STEP)
 
 def get_relative_size(base_size, widget):
     try:
-        window_width = widget.winfo_width()
-        window_height = widget.winfo_height()
-        scale_factor = min(window_width / 1920, window_height / 1080)
+        scale_factor = scale_bucket(widget.winfo_width(), widget.winfo_height()) * SCALE_STEP
         return max(int(base_size * scale_factor), base_size // 2)
     except:
         return base_size
 
+class FontRegistry:
+    """One shared CTkFont per (family, base size, weight), sized for the current scale bucket.
+
+    Widgets given the same relative font share the same CTkFont, so a scale
+    change resizes each font once and CustomTkinter updates every widget
+    using it; restyle() then sees an unchanged font and skips the widget.
+    """
+
+    def __init__(self):
+        self.fonts = {}
+        self.bucket = None
+
+    def get(self, base_size, widget, family, weight):
+        try:
+            width, height = widget.winfo_width(), widget.winfo_height()
+        except Exception:
+            width = height = 1
+        # A page that is still being built has no size yet; it will be shown at the current scale
+        if width > 1 and height > 1:
+            bucket = scale_bucket(width, height)
+            if bucket != self.bucket:
+                self.rescale(bucket)
+
+        key = (family, base_size, weight)
+        if key not in self.fonts:
+            self.fonts[key] = ctk.CTkFont(family=family, size=self.size(base_size), weight=weight)
+        return self.fonts[key]
+
+    def size(self, base_size):
+        if self.bucket is None:
+            return base_size
+        return max(int(base_size * self.bucket * SCALE_STEP), base_size // 2)
+
+    def rescale(self, bucket):
+        self.bucket = bucket
+        for (family, base_size, weight), font in self.fonts.items():
+            font.configure(size=self.size(base_size))
+
+fonts = FontRegistry()
+
 def get_relative_font(base_size, widget, family="League Spartan", weight="bold"):
-    size = get_relative_size(base_size, widget)
-    try:
-        return (family, size, weight)
-    except:
-        return ("Helvetica", size, weight)
+    return fonts.get(base_size, widget, family, weight)
 
 def load_ctk_image(image_path, widget, height_percentage=0.25):
     """Load image as CTkImage for CustomTkinter widgets"""
@@ -80,15 +188,25 @@ def load_ctk_image(image_path, widget, height_percentage=0.25):
         if not os.path.exists(image_path):
             print(f"Image not found: {image_path}")
             return None
-        original = Image.open(image_path)
         widget_height = widget.winfo_height() if widget.winfo_height() > 1 else 600
+        # Sized by step like fonts, so most resizes reuse the cached image
+        widget_height = max(round(widget_height / IMAGE_HEIGHT_STEP), 1) * IMAGE_HEIGHT_STEP
         target_height = int(widget_height * height_percentage)
+        # The same image at the same size is the same CTkImage, so restyle() can skip it
+        key = (image_path, target_height)
+        if key in resized_images:
+            return resized_images[key]
+        original = Image.open(image_path)
         aspect_ratio = original.width / original.height
         target_width = int(target_height * aspect_ratio)
         target_width = max(target_width, 50)
         target_height = max(target_height, 50)
         resized_image = original.resize((target_width, target_height), Image.Resampling.LANCZOS)
-        return ctk.CTkImage(light_image=resized_image, dark_image=resized_image, size=(target_width, target_height))
+        if len(resized_images) >= RESIZED_IMAGES_KEPT:
+            resized_images.clear()
+        resized_images[key] = ctk.CTkImage(light_image=resized_image, dark_image=resized_image,
+                                           size=(target_width, target_height))
+        return resized_images[key]
     except Exception as e:
         print(f"Error loading CTkImage {image_path}: {e}")
         return None
@@ -106,28 +224,366 @@ root.attributes("-fullscreen", True)
 
 
 resized_images = {}
+RESIZED_IMAGES_KEPT = 256
+
+def restyle(widget, **options):
+    """configure() only the options whose value actually changes."""
+    changed = {}
+    for key, value in options.items():
+        try:
+            if widget.cget(key) == value:
+                continue
+        except Exception:
+            pass
+        changed[key] = value
+    if changed:
+        widget.configure(**changed)
+
+HIDDEN_CHECK_MS = 1000   # How often a paused timer checks whether its page is visible again
+
+class UITimers:
+    """Periodic UI tasks, each tied to the page that owns it.
+
+    every() runs a callback every interval_ms while its frame is on screen;
+    while the frame is not viewable the callback is skipped and the timer
+    only checks back every HIDDEN_CHECK_MS. A callback returning False, or
+    the frame being destroyed, ends the timer, so nothing keeps firing for
+    a page show_frame() has torn down. live() counts them for diagnostics.
+    """
+
+    def __init__(self):
+        self.timers = {}   # frame -> list of timers
+        self.suspended = False
+        self.resumed_at = 0.0
+
+    def every(self, frame, interval_ms, callback):
+        timer = {"frame": frame, "interval": interval_ms, "callback": callback, "job": None, "paused": False}
+        self.timers.setdefault(frame, []).append(timer)
+        if self.suspended:
+            timer["paused"] = True   # Started by resume()
+        else:
+            timer["job"] = frame.after(interval_ms, self._tick, timer)
+        return timer
+
+    def cancel(self, frame):
+        for timer in self.timers.pop(frame, []):
+            if timer["job"] is not None:
+                frame.after_cancel(timer["job"])
+                timer["job"] = None
+
+    def suspend(self):
+        """Stop every timer until resume(), e.g. while the kiosk is idle."""
+        self.suspended = True
+        for frame, frame_timers in self.timers.items():
+            for timer in frame_timers:
+                if timer["job"] is not None:
+                    frame.after_cancel(timer["job"])
+                    timer["job"] = None
+                timer["paused"] = True
+
+    def resume(self):
+        self.suspended = False
+        self.resumed_at = time.monotonic()
+        for frame, frame_timers in self.timers.items():
+            for timer in frame_timers:
+                if timer["job"] is None:
+                    timer["job"] = frame.after(0, self._tick, timer)
+
+    def live(self):
+        timers = [timer for frame_timers in self.timers.values() for timer in frame_timers]
+        return len(timers), sum(timer["paused"] for timer in timers)
+
+    def _tick(self, timer):
+        frame = timer["frame"]
+        timer["job"] = None
+        if not frame.winfo_exists():
+            self._drop(timer)
+            return
+        timer["paused"] = not frame.winfo_viewable()
+        if timer["paused"]:
+            timer["job"] = frame.after(HIDDEN_CHECK_MS, self._tick, timer)
+            return
+        try:
+            keep = timer["callback"]()
+        except Exception as e:
+            print(f"[!] UI timer {timer['callback'].__name__} failed: {e}")
+            keep = True
+        if keep is False:
+            self._drop(timer)
+            return
+        timer["job"] = frame.after(timer["interval"], self._tick, timer)
+
+    def _drop(self, timer):
+        frame_timers = self.timers.get(timer["frame"], [])
+        if timer in frame_timers:
+            frame_timers.remove(timer)
+        if not frame_timers:
+            self.timers.pop(timer["frame"], None)
+
+timers = UITimers()
 
 class DynamicFrame(ctk.CTkFrame):
+    """A page that lays itself out again when its size changes.
+
+    A burst of <Configure> events (fullscreen startup, children settling)
+    is coalesced into one relayout RESIZE_DEBOUNCE_MS after the last of
+    them, and update_elements() only runs when the size has actually
+    changed. Widths and heights follow the exact size; fonts and images
+    only change when the scale crosses a step, and restyle() skips the
+    widgets whose values come out the same.
+    """
+
     def __init__(self, parent, bg_color="#6096ba"):
         super().__init__(parent, fg_color=bg_color)
         self.bg_color = bg_color
-        self.update_scheduled = False
+        self.resize_job = None
+        self.resize_pending_since = 0.0
+        self.applied_size = None
         self.bind('<Configure>', self.on_resize)
 
     def on_resize(self, event=None):
-        if not self.update_scheduled:
-            self.update_scheduled = True
-            self.after(100, self.update_elements)
+        now = time.monotonic()
+        if self.resize_job is None:
+            self.resize_pending_since = now
+        elif now - self.resize_pending_since < RESIZE_MAX_WAIT:
+            self.after_cancel(self.resize_job)
+        else:
+            return  # The pending relayout is overdue and will see this size too
+        self.resize_job = self.after(RESIZE_DEBOUNCE_MS, self.apply_resize)
+
+    def apply_resize(self):
+        self.resize_job = None
+        size = (self.winfo_width(), self.winfo_height())
+        if size == self.applied_size:
+            return
+        self.applied_size = size
+        self.update_elements()
+
+    def every(self, interval_ms, callback):
+        """Run callback every interval_ms while this page is shown; return False from it to stop."""
+        return timers.every(self, interval_ms, callback)
+
+    def destroy(self):
+        if self.resize_job is not None:
+            self.after_cancel(self.resize_job)
+            self.resize_job = None
+        timers.cancel(self)
+        super().destroy()
 
     def update_elements(self):
         """Override this method in subclasses"""
-        self.update_scheduled = False
 
 
 
 frame_container = ctk.CTkFrame(root)
 frame_container.pack(fill="both", expand=True)
 
+# The model host (Modes/model_host.py) preloads the shared models and runs the
+# boot-time warm-up while the main page is showing
+warmup_tail = EventTail(SYSTEM_LOG)
+warmup_status = {"models": [], "ready": [], "failed": [], "done": False}
+
+def start_model_host():
+    try:
+        subprocess.Popen(["python3", os.path.join(APP_DIR, "Modes", "model_host.py")])
+    except Exception as e:
+        print(f"Could not start model host: {e}")
+        warmup_status["done"] = True
+        return
+    poll_warmup()
+
+# One translator worker (Modes/Translation/TranslatorWorker.py) serves all six
+# directions; pages switch it with control events instead of restarting it
+translator_worker = {"process": None, "listening": False, "direction": None}
+
+def start_translation(source, target):
+    process = translator_worker["process"]
+    if process is None or process.poll() is not None:
+        # The worker reads control events from its launch on, so this start is not missed
+        # while it is still loading
+        translator_worker["process"] = launch_script(os.path.join("Modes", "Translation", "TranslatorWorker.py"),
+                                                     ["--since", repr(time.time())])
+    translator_worker["listening"] = True
+    translator_worker["direction"] = (source, target)
+    translation_log.append("control", command="start", source=source, target=target)
+
+def pause_translation():
+    translator_worker["listening"] = False
+    translation_log.append("control", command="pause")
+
+STOP_GRACE = 1.0  # Seconds a drill gets to stop cooperatively before it is killed
+DRILL_PANDA_FLIP = 1.0  # Seconds between panda frames while a drill asks its question
+
+def stop_drill_process(process):
+    """Ask a drill to stop; it cuts off recording/TTS, releases the audio device and exits."""
+    drill_log.append("control", command="stop", target_pid=process.pid)
+    try:
+        process.wait(timeout=STOP_GRACE)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+def launch_script(script_path, args=()):
+    """Start a mode script, forked from the model host when it is running so the
+    preloaded models are shared instead of loaded again."""
+    return launch_hosted(script_path, args) or subprocess.Popen(["python3", script_path, *args])
+
+def close_app():
+    """Shut down the translator worker and the model host with the window."""
+    process = translator_worker["process"]
+    if process is not None and process.poll() is None:
+        translation_log.append("control", command="exit")
+    stop_host()
+    root.destroy()
+
+def poll_warmup():
+    for event in warmup_tail.poll():
+        if event.get("type") != "warmup":
+            continue
+        state = event.get("state")
+        if state == "started":
+            warmup_status.update(models=event.get("models", []), ready=[], failed=[], done=False)
+        elif state == "ready":
+            warmup_status["ready"].append(event.get("model"))
+        elif state == "failed":
+            warmup_status["failed"].append(event.get("model"))
+        elif state == "done":
+            warmup_status["done"] = True
+    if not warmup_status["done"]:
+        root.after(500, poll_warmup)
+
+def warmup_text():
+    if warmup_status["done"]:
+        return "Ready"
+    total = len(warmup_status["models"])
+    if not total:
+        return "Preparing models..."
+    finished = len(warmup_status["ready"]) + len(warmup_status["failed"])
+    return f"Preparing models... {finished}/{total}"
+
+# Debug overlay with the translator's and drills' per-stage timings (Modes/timing.py).
+# F12 toggles it; DEBUG_OVERLAY=1 shows it from the start.
+timing_overlay = {"label": None}
+
+def toggle_timing_overlay(event=None):
+    if timing_overlay["label"] is not None:
+        timing_overlay["label"].destroy()
+        timing_overlay["label"] = None
+        return
+    timing_overlay["label"] = ctk.CTkLabel(root, text="", font=("Courier", 12),
+                                           fg_color="black", text_color="#7CFC00",
+                                           justify="left", anchor="nw")
+    timing_overlay["label"].place(relx=1.0, rely=0.0, anchor="ne")
+    update_timing_overlay()
+
+def update_timing_overlay():
+    label = timing_overlay["label"]
+    if label is None:
+        return
+    lines = [f"{'stage':<26}{'last':>8}{'p50':>8}{'p95':>8}  ms"]
+    for key, stage in sorted(read_stage_timings().items()):
+        lines.append(f"{key:<26}{stage['last_ms']:>8.0f}{stage['p50_ms']:>8.0f}{stage['p95_ms']:>8.0f}")
+    if len(lines) == 1:
+        lines.append("No timings yet")
+    live, paused = timers.live()
+    lines.append(f"ui timers: {live} live, {paused} paused")
+    label.configure(text="\n".join(lines))
+    label.lift()  # Pages are rebuilt underneath it on every show_frame
+    root.after(1000, update_timing_overlay)
+
+# Low-power idle mode: after IDLE_TIMEOUT seconds without a touch, key press or
+# translator/drill activity the translator is paused (it keeps its models loaded
+# but closes the microphone), page timers stop and the screen is covered and
+# dimmed. Never while a drill is running. Any input brings everything back.
+# IDLE_TIMEOUT=0 disables it.
+IDLE_TIMEOUT = float(os.environ.get("IDLE_TIMEOUT", 300))
+# Events that mean someone is talking to the translator or answering a drill
+ACTIVITY_EVENTS = {"partial", "translation", "status", "throughput", "drill"}
+IDLE_CHECK_MS = 5000
+IDLE_BRIGHTNESS = 0.1   # Fraction of full backlight while idle
+BACKLIGHT_DIRS = "/sys/class/backlight/*"
+
+class IdleManager:
+    def __init__(self, timeout=IDLE_TIMEOUT):
+        self.timeout = timeout
+        self.last_activity = time.monotonic()
+        self.idle = False
+        self.resume_direction = None
+        self.curtain = None
+        self.brightness = {}   # backlight dir -> brightness before dimming
+
+    def install(self, root):
+        if self.timeout <= 0:
+            return
+        for sequence in ("<KeyPress>", "<ButtonPress>", "<Motion>"):
+            root.bind_all(sequence, self.activity, add="+")
+        root.after(IDLE_CHECK_MS, self.check)
+
+    def activity(self, event=None):
+        self.last_activity = time.monotonic()
+        if self.idle:
+            self.wake()
+
+    def check(self):
+        if drill_running():
+            self.last_activity = time.monotonic()  # A drill holds the microphone until it ends
+        if not self.idle and time.monotonic() - self.last_activity >= self.timeout:
+            self.sleep()
+        root.after(IDLE_CHECK_MS, self.check)
+
+    def sleep(self):
+        self.idle = True
+        print("💤 No activity, entering low-power mode")
+        if translator_worker["listening"]:
+            self.resume_direction = translator_worker["direction"]
+            pause_translation()
+        timers.suspend()
+
+        self.curtain = ctk.CTkFrame(root, fg_color="black", corner_radius=0)
+        ctk.CTkLabel(self.curtain, text="Touch the screen to continue", text_color="#404040",
+                     font=("Helvetica", 24)).place(relx=0.5, rely=0.5, anchor="center")
+        self.curtain.place(relx=0, rely=0, relwidth=1, relheight=1)
+        self.curtain.lift()
+        self.set_backlight(dim=True)
+
+    def wake(self):
+        self.idle = False
+        print("Waking from low-power mode")
+        self.set_backlight(dim=False)
+        if self.curtain is not None:
+            self.curtain.destroy()
+            self.curtain = None
+        timers.resume()
+        if self.resume_direction:
+            start_translation(*self.resume_direction)
+            self.resume_direction = None
+
+    def set_backlight(self, dim):
+        """Dim the display's backlight (e.g. the Pi touchscreen) when sysfs lets us."""
+        for path in glob.glob(BACKLIGHT_DIRS):
+            try:
+                if dim:
+                    with open(os.path.join(path, "brightness"), "r") as f:
+                        self.brightness[path] = f.read().strip()
+                    with open(os.path.join(path, "max_brightness"), "r") as f:
+                        level = max(1, int(int(f.read()) * IDLE_BRIGHTNESS))
+                elif path in self.brightness:
+                    level = self.brightness.pop(path)
+                else:
+                    continue
+                with open(os.path.join(path, "brightness"), "w") as f:
+                    f.write(str(level))
+            except (OSError, ValueError) as e:
+                print(f"[!] Could not set backlight {path}: {e}")
+
+idle = IdleManager()
+
+def drill_running():
+    for page in frame_container.winfo_children():
+        process = getattr(page, "drill_process", None)
+        if process is not None and process.poll() is None:
+            return True
+    return False
+
 def show_frame(frame_class):
     
     for key in ["1", "2", "3", "4", "5", "6"]:
@@ -178,6 +634,16 @@ class MainPage(DynamicFrame):
         )
         self.title.place(relx=0.5, rely=0.5, anchor="center")
 
+        self.warmup_label = ctk.CTkLabel(
+            self,
+            text=warmup_text(),
+            font=get_relative_font(18, self, weight="normal"),
+            text_color="white",
+            fg_color=get_current_theme()["primary"]
+        )
+        self.warmup_label.place(relx=0.5, rely=0.85, anchor="center")
+        self.every(500, self.update_warmup_label)
+
         theme = get_current_theme()
         self.button_bg = theme["button_bg"]
         self.button_fg = theme["button_fg"]
@@ -278,13 +744,13 @@ class MainPage(DynamicFrame):
         btn_width = max(int(self.winfo_width() * 0.15), 120)
         btn_height = max(int(self.winfo_height() * 0.06), 35)
         
-        self.start_btn.configure(width=btn_width, height=btn_height)
-        self.about_btn.configure(width=btn_width, height=btn_height)
+        restyle(self.start_btn, width=btn_width, height=btn_height)
+        restyle(self.about_btn, width=btn_width, height=btn_height)
         
         try:
             power_icon = load_ctk_image("icons/power_icon.png", self, height_percentage=0.012)
             if power_icon:
-                self.shutdown_btn.configure(image=power_icon)
+                restyle(self.shutdown_btn, image=power_icon)
         except:
             pass
         
@@ -294,18 +760,22 @@ class MainPage(DynamicFrame):
         self.shutdown_btn.place(relx=1.0, x=-10, y=10, anchor="ne")
         self.settings_btn.place(relx=0.0, x=10, y=10, anchor="nw")
     
+    def update_warmup_label(self):
+        self.warmup_label.configure(text=warmup_text())
+        return not warmup_status["done"]
+
     def update_elements(self):
         super().update_elements()
         try:
             self.logo_image = load_ctk_image("logo.png", self, height_percentage=0.25)
             if self.logo_image:
-                self.logo_label.configure(image=self.logo_image)
+                restyle(self.logo_label, image=self.logo_image)
         except:
-            self.logo_label.configure(font=get_relative_font(36, self))
+            restyle(self.logo_label, font=get_relative_font(36, self))
         
-        self.title.configure(font=get_relative_font(50, self))
-        self.start_btn.configure(font=get_relative_font(28, self))
-        self.about_btn.configure(font=get_relative_font(28, self))
+        restyle(self.title, font=get_relative_font(50, self))
+        restyle(self.start_btn, font=get_relative_font(28, self))
+        restyle(self.about_btn, font=get_relative_font(28, self))
         self.update_button_sizes()
 
 class AboutUs(DynamicFrame):
@@ -365,13 +835,16 @@ class AboutUs(DynamicFrame):
         
         theme = get_current_theme()
         try:
-            self.configure(fg_color=theme["primary"])
+            restyle(self, fg_color=theme["primary"])
             if hasattr(self, 'title'):
-                self.title.configure(fg_color=theme["primary"])
+                restyle(self.title, fg_color=theme["primary"])
             if hasattr(self, 'description'):
-                self.description.configure(fg_color=theme["primary"])
+                restyle(self.description, fg_color=theme["primary"])
         except Exception:
             pass
+# Darker swatch shown for the theme in use
+SWATCH_SELECTED = {"Blue": "#5a7fa3", "Pink": "#9b5a8a", "Green": "#6b9a7e"}
+
 class SettingsPage(DynamicFrame):
     def __init__(self, parent):
         theme = get_current_theme()
@@ -409,7 +882,7 @@ class SettingsPage(DynamicFrame):
             self,
             text="Blue",
             command=lambda: self.apply_theme("Blue"),
-            fg_color="#8abee6" if CURRENT_THEME != "Blue" else "#5a7fa3",
+            fg_color=COLOR_THEMES["Blue"]["button_bg"] if CURRENT_THEME != "Blue" else SWATCH_SELECTED["Blue"],
             text_color="#35495e",
             font=get_relative_font(32, self),
             width=button_width,
@@ -422,7 +895,7 @@ class SettingsPage(DynamicFrame):
             self,
             text="Pink",
             command=lambda: self.apply_theme("Pink"),
-            fg_color="#e8a5d8" if CURRENT_THEME != "Pink" else "#9b5a8a",
+            fg_color=COLOR_THEMES["Pink"]["button_bg"] if CURRENT_THEME != "Pink" else SWATCH_SELECTED["Pink"],
             text_color="#4a3d4a",
             font=get_relative_font(32, self),
             width=button_width,
@@ -435,7 +908,7 @@ class SettingsPage(DynamicFrame):
             self,
             text="Green",
             command=lambda: self.apply_theme("Green"),
-            fg_color="#a8d5ba" if CURRENT_THEME != "Green" else "#6b9a7e",
+            fg_color=COLOR_THEMES["Green"]["button_bg"] if CURRENT_THEME != "Green" else SWATCH_SELECTED["Green"],
             text_color="#4a5a4a",
             font=get_relative_font(32, self),
             width=button_width,
@@ -444,6 +917,9 @@ class SettingsPage(DynamicFrame):
         )
         self.green_btn.place(relx=0.75, rely=0.40, anchor="center")
 
+        # Swatches keep their own colors whatever the theme
+        self.swatches = {"Blue": self.blue_btn, "Pink": self.pink_btn, "Green": self.green_btn}
+
         # Current theme display
         self.current_theme_label = ctk.CTkLabel(
             self,
@@ -454,6 +930,10 @@ class SettingsPage(DynamicFrame):
         )
         self.current_theme_label.place(relx=0.5, rely=0.55, anchor="center")
 
+        # The page stays on screen while the theme changes, so its background follows it
+        for widget in (self, self.title, self.theme_label, self.current_theme_label):
+            themes.subscribe(widget, fg_color="primary")
+
         # Back button
         self.back_button = ctk.CTkButton(
             self,
@@ -471,22 +951,27 @@ class SettingsPage(DynamicFrame):
     
     def apply_theme(self, theme_name):
         set_theme(theme_name)
-        
-        show_frame(SettingsPage)
+        self.update_swatches()
+
+    def update_swatches(self):
+        """Highlight the swatch of the current theme."""
+        for name, button in self.swatches.items():
+            restyle(button, fg_color=SWATCH_SELECTED[name] if name == CURRENT_THEME else COLOR_THEMES[name]["button_bg"])
+        restyle(self.current_theme_label, text=f"Current Theme: {CURRENT_THEME}")
     
     def update_elements(self):
         """Update all elements on resize"""
         super().update_elements()
         theme = get_current_theme()
-        self.configure(fg_color=theme["primary"])
-        self.title.configure(font=get_relative_font(72, self), fg_color=theme["primary"])
-        self.theme_label.configure(font=get_relative_font(36, self), fg_color=theme["primary"])
-        self.current_theme_label.configure(
+        restyle(self, fg_color=theme["primary"])
+        restyle(self.title, font=get_relative_font(72, self), fg_color=theme["primary"])
+        restyle(self.theme_label, font=get_relative_font(36, self), fg_color=theme["primary"])
+        restyle(self.current_theme_label,
             text=f"Current Theme: {CURRENT_THEME}",
             font=get_relative_font(24, self),
             fg_color=theme["primary"]
         )
-        self.back_button.configure(font=get_relative_font(28, self))
+        restyle(self.back_button, font=get_relative_font(28, self))
 
 class ChooseModePage(DynamicFrame):
     def __init__(self, parent):
@@ -583,16 +1068,16 @@ class ChooseModePage(DynamicFrame):
 
         for btn_name, relx in positions.items():
             frame = self.frames[btn_name]
-            frame.configure(width=btn_width, height=btn_height)
+            restyle(frame, width=btn_width, height=btn_height)
             frame.place(relx=relx, rely=0.48, anchor="center")
 
             icon = load_ctk_image(os.path.join("icons", f"{btn_name}_icon.png"), self, height_percentage=0.15)
             if icon:
-                self.buttons[btn_name].configure(image=icon)
+                restyle(self.buttons[btn_name], image=icon)
                 self.buttons[btn_name].image = icon
 
             label = self.buttons[f"{btn_name}_label"]
-            label.configure(font=get_relative_font(label_font_size, self))
+            restyle(label, font=get_relative_font(label_font_size, self))
             label.place(relx=relx, rely=0.70, anchor="center")
 
         self.back_button.place(relx=0.5, rely=0.9, anchor="center")
@@ -603,17 +1088,17 @@ class ChooseModePage(DynamicFrame):
         
         theme = get_current_theme()
         try:
-            self.configure(fg_color=theme["primary"])
+            restyle(self, fg_color=theme["primary"])
             if hasattr(self, 'title'):
-                self.title.configure(fg_color=theme["primary"])
+                restyle(self.title, fg_color=theme["primary"])
         except Exception:
             pass
         
         theme = get_current_theme()
         try:
-            self.configure(fg_color=theme["primary"])
+            restyle(self, fg_color=theme["primary"])
             if hasattr(self, 'title'):
-                self.title.configure(fg_color=theme["primary"])
+                restyle(self.title, fg_color=theme["primary"])
         except Exception:
             pass
 
@@ -622,9 +1107,9 @@ class ChooseModePage(DynamicFrame):
         
         theme = get_current_theme()
         try:
-            self.configure(fg_color=theme["primary"])
+            restyle(self, fg_color=theme["primary"])
             if hasattr(self, 'title'):
-                self.title.configure(fg_color=theme["primary"])
+                restyle(self.title, fg_color=theme["primary"])
         except Exception:
             pass
 
@@ -722,16 +1207,16 @@ class JapModePage(DynamicFrame):
 
         for btn_name, relx in positions.items():
             frame = self.frames[btn_name]
-            frame.configure(width=btn_width, height=btn_height)
+            restyle(frame, width=btn_width, height=btn_height)
             frame.place(relx=relx, rely=0.48, anchor="center")
 
             icon = load_ctk_image(os.path.join("icons", f"{btn_name}_icon.png"), self, height_percentage=0.15)
             if icon:
-                self.buttons[btn_name].configure(image=icon)
+                restyle(self.buttons[btn_name], image=icon)
                 self.buttons[btn_name].image = icon
 
             label = self.buttons[f"{btn_name}_label"]
-            label.configure(font=get_relative_font(label_font_size, self))
+            restyle(label, font=get_relative_font(label_font_size, self))
             label.place(relx=relx, rely=0.70, anchor="center")
 
         self.back_button.place(relx=0.5, rely=0.9, anchor="center")
@@ -744,11 +1229,19 @@ class JapTranslate(DynamicFrame):
     def __init__(self, parent):
         theme = get_current_theme()
         super().__init__(parent, theme["primary"])
-        self.translator_process = None
+        self.direction = ("tl", "ja")
         self.running = True
         self.is_listening = False
+        self.translation_tail = EventTail(TRANSLATION_LOG)
+        self.translator_state = ""
+        self.translation_data = {}
+        self.partial_data = {}
         self.create_ui_elements()
 
+        # Arriving here from a swap while listening: the worker just changes direction
+        if translator_worker["listening"]:
+            self.toggle_listening()
+
     def create_ui_elements(self):
         theme = get_current_theme()
         self.title = ctk.CTkLabel(self, text="Translate", 
@@ -824,19 +1317,16 @@ class JapTranslate(DynamicFrame):
         root.bind("2", lambda event: self.swap_button.invoke())
         root.bind("3", lambda event: self.back_button.invoke())
 
-        self.after(250, self.check_translator_output)
+        self.every(250, self.check_translator_output)
 
     def toggle_listening(self):
         self.is_listening = not self.is_listening
-        status_file = os.path.join("Modes", "Translation", "status.json")
         if self.is_listening:
-            with open(status_file, "w") as f:
-                json.dump({"status": "LOADING"}, f)
+            translation_log.append("status", status="LOADING")
             self.start_translator()
         else:
             self.stop_translator()
-            with open(status_file, "w") as f:
-                json.dump({"status": "IDLE"}, f)
+            translation_log.append("status", status="IDLE")
 
     def on_back(self):
         self.running = False
@@ -852,39 +1342,21 @@ class JapTranslate(DynamicFrame):
             show_frame(ChiTranslate)
 
     def start_translator(self):
-        if self.translator_process is None or self.translator_process.poll() is not None:
-            script_path = os.path.join("Modes", "Translation", "JapTranslator.py")
-            self.translator_process = subprocess.Popen(["python3", script_path])
+        start_translation(*self.direction)
 
     def stop_translator(self):
-        if self.translator_process and self.translator_process.poll() is None:
-            self.translator_process.terminate()
-            stop_path = os.path.join("Modes", "Translation", "stop.json")
-            with open(stop_path, "w") as f:
-                json.dump({"stop": True}, f)
-
+        pause_translation()
 
         self.panda_label.configure(image=self.pandaA_img)
         self.placeholder_label.configure(text="Press START to begin")
         self.panda_toggle = False
 
-        translation_file = os.path.join("Modes", "Translation", "translation_data.json")
-        try:
-            with open(translation_file, "w") as f:
-                json.dump({
-                    "transcription": "",
-                    "translated_text": "",
-                    "romanized_text": ""
-                }, f)
-        except Exception as e:
-            print("Error clearing translation file:", e)
-
-        status_file = os.path.join("Modes", "Translation", "status.json")
+        # Clear the bubble and reset the status for anything tailing the log
         try:
-            with open(status_file, "w") as f:
-                json.dump({"status": "IDLE"}, f)
+            translation_log.append("translation", transcription="", translated_text="", romanized_text="")
+            translation_log.append("status", status="IDLE")
         except Exception as e:
-            print("Failed to reset status:", e)
+            print("Failed to reset translation events:", e)
 
     def set_panda(self, state):
         if state == "pandaA":
@@ -895,56 +1367,65 @@ class JapTranslate(DynamicFrame):
             self.panda_label.configure(image=self.pandaC_img)
 
     def check_translator_output(self):
-        status_file = os.path.join("Modes", "Translation", "status.json")
-        translation_file = os.path.join("Modes", "Translation", "translation_data.json")
         try:
-            if os.path.exists(status_file):
-                with open(status_file, "r") as f:
-                    data = json.load(f)
-                    state = data.get("status", "")
-                    if state == "SPEAKING":
-                        if getattr(self, "panda_toggle", False):
-                            self.set_panda("pandaB")
-                        else:
-                            self.set_panda("pandaC")
-                        self.panda_toggle = not getattr(self, "panda_toggle", False)
-
-                    elif state == "IDLE":
-                        self.set_panda("pandaA")
-                        self.panda_toggle = False
-                        
-                    elif state == "LOADING":
-                        self.placeholder_label.configure(text="Loading Model...")
-                        self.set_panda("pandaA")
-                        
-                    elif state == "LOADED":
-                        self.placeholder_label.configure(text="Listening speak now")
-                        self.set_panda("pandaA")
-                        
-            if os.path.exists(translation_file):
-                with open (translation_file, "r") as f:
-                    trans_data = json.load(f)
-
-                translated = trans_data.get("translated_text", "").strip()
-                romanized = trans_data.get("romanized_text", "").strip()
+            for event in self.translation_tail.poll():
+                if event.get("type") in ACTIVITY_EVENTS:
+                    idle.activity()
+                if event.get("type") == "status":
+                    self.translator_state = event.get("status", "")
+                elif event.get("type") == "translation":
+                    self.translation_data = event
+                    self.partial_data = {}
+                elif event.get("type") == "partial":
+                    self.partial_data = event
+
+            state = self.translator_state
+            if state == "SPEAKING":
+                if getattr(self, "panda_toggle", False):
+                    self.set_panda("pandaB")
+                else:
+                    self.set_panda("pandaC")
+                self.panda_toggle = not getattr(self, "panda_toggle", False)
 
-                if translated or romanized:
-                    display_text = f"{romanized}\n{translated}"
-                    self.placeholder_label.configure(text=display_text, justify="center")
+            elif state == "IDLE":
+                self.set_panda("pandaA")
+                self.panda_toggle = False
+                
+            elif state == "LOADING":
+                self.placeholder_label.configure(text="Loading Model...")
+                self.set_panda("pandaA")
+                
+            elif state == "LOADED":
+                self.placeholder_label.configure(text="Listening speak now")
+                self.set_panda("pandaA")
+
+            trans_data = self.translation_data
+            translated = trans_data.get("translated_text", "").strip()
+            romanized = trans_data.get("romanized_text", "").strip()
+
+            if translated or romanized:
+                display_text = f"{romanized}\n{translated}"
+                self.placeholder_label.configure(text=display_text, justify="center")
+
+            # What is being heard so far, shown until the final translation arrives
+            partial = self.partial_data
+            if partial.get("text"):
+                display_text = f"{partial['text']}…"
+                if partial.get("translated_text"):
+                    display_text += f"\n{partial['translated_text']}"
+                self.placeholder_label.configure(text=display_text, justify="center")
 
         except Exception as e:
-            print("error reading status.json", e)
-
-        self.after(250, self.check_translator_output)
+            print("error reading translation events", e)
 
     def update_elements(self):
         super().update_elements()
-        self.title.configure(font=get_relative_font(48, self))
-        self.tagalog_label.configure(font=get_relative_font(28, self, weight="bold"))
-        self.japanese_label.configure(font=get_relative_font(28, self, weight="bold"))
-        self.placeholder_label.configure(font=get_relative_font(22, self))
-        self.start_button.configure(font=get_relative_font(22, self))
-        self.back_button.configure(font=get_relative_font(18, self))
+        restyle(self.title, font=get_relative_font(48, self))
+        restyle(self.tagalog_label, font=get_relative_font(28, self, weight="bold"))
+        restyle(self.japanese_label, font=get_relative_font(28, self, weight="bold"))
+        restyle(self.placeholder_label, font=get_relative_font(22, self))
+        restyle(self.start_button, font=get_relative_font(22, self))
+        restyle(self.back_button, font=get_relative_font(18, self))
 
         pandaA_path = os.path.join("assets", "pandaA.png")
         self.pandaA_img = load_ctk_image(pandaA_path, self, height_percentage=0.72)
@@ -953,31 +1434,39 @@ class JapTranslate(DynamicFrame):
         pandaC_path = os.path.join("assets", "pandaC.png")
         self.pandaC_img = load_ctk_image(pandaC_path, self, height_percentage=0.72)
         if self.pandaA_img:
-            self.panda_label.configure(image=self.pandaA_img)
+            restyle(self.panda_label, image=self.pandaA_img)
         elif self.pandaB_img:
-            self.panda_label.configure(image=self.pandaB_img)
+            restyle(self.panda_label, image=self.pandaB_img)
         elif self.pandaC_img:
-            self.panda_label.configure(image=self.pandaC_img)
+            restyle(self.panda_label, image=self.pandaC_img)
         bubble_width = max(int(self.winfo_width() * 0.28), 400)
         bubble_height = max(int(self.winfo_height() * 0.20), 150)
-        self.bubble_frame.configure(width=bubble_width, height=bubble_height)
+        restyle(self.bubble_frame, width=bubble_width, height=bubble_height)
         
 
         swap_path = os.path.join("assets", "swap.png")
         self.swap_img = load_ctk_image(swap_path, self, height_percentage=0.06)
         if self.swap_img:
-            self.swap_button.configure(image=self.swap_img)
+            restyle(self.swap_button, image=self.swap_img)
 
 
 class JapTranslateJaptoEnglish(DynamicFrame):
     def __init__(self, parent):
         theme = get_current_theme()
         super().__init__(parent, theme["primary"])
-        self.translator_process = None
+        self.direction = ("ja", "tl")
         self.running = True
         self.is_listening = False
+        self.translation_tail = EventTail(TRANSLATION_LOG)
+        self.translator_state = ""
+        self.translation_data = {}
+        self.partial_data = {}
         self.create_ui_elements()
 
+        # Arriving here from a swap while listening: the worker just changes direction
+        if translator_worker["listening"]:
+            self.toggle_listening()
+
     def create_ui_elements(self):
         theme = get_current_theme()
         self.title = ctk.CTkLabel(self, text="Translate", 
@@ -1052,7 +1541,7 @@ class JapTranslateJaptoEnglish(DynamicFrame):
         root.bind("2", lambda event: show_frame(JapTranslate))
         root.bind("3", lambda event: self.back_button.invoke())
 
-        self.after(250, self.check_translator_output)
+        self.every(250, self.check_translator_output)
 
     def toggle_listening(self):
         self.is_listening = not self.is_listening
@@ -1073,39 +1562,20 @@ class JapTranslateJaptoEnglish(DynamicFrame):
         show_frame(ChooseModePage)
 
     def start_translator(self):
-        if self.translator_process is None or self.translator_process.poll() is not None:
-            script_path = os.path.join("Modes", "Translation", "JapToFilTranslator.py")
-            self.translator_process = subprocess.Popen(["python3", script_path])
+        start_translation(*self.direction)
 
     def stop_translator(self):
-        if self.translator_process and self.translator_process.poll() is None:
-            self.translator_process.terminate()
-            try:
-                self.translator_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.translator_process.kill()
-            print("Translator Process Terminated")
+        pause_translation()
 
         self.panda_label.configure(image=self.pandaA_img)
         self.panda_toggle = False
 
-        translation_file = os.path.join("Modes", "Translation", "translation_data.json")
-        try:
-            with open(translation_file, "w") as f:
-                json.dump({
-                    "transcription": "",
-                    "translated_text": "",
-                    "romanized_text": ""
-                }, f)
-        except Exception as e:
-            print("Error clearing translation file:", e)
-
-        status_file = os.path.join("Modes", "Translation", "status.json")
+        # Clear the bubble and reset the status for anything tailing the log
         try:
-            with open(status_file, "w") as f:
-                json.dump({"status": "IDLE"}, f)
+            translation_log.append("translation", transcription="", translated_text="", romanized_text="")
+            translation_log.append("status", status="IDLE")
         except Exception as e:
-            print("Failed to reset status:", e)
+            print("Failed to reset translation events:", e)
 
     def set_panda(self, state):
         if state == "pandaA":
@@ -1116,47 +1586,56 @@ class JapTranslateJaptoEnglish(DynamicFrame):
             self.panda_label.configure(image=self.pandaC_img)
 
     def check_translator_output(self):
-        status_file = os.path.join("Modes", "Translation", "status.json")
-        translation_file = os.path.join("Modes", "Translation", "translation_data.json")
         try:
-            if os.path.exists(status_file):
-                with open(status_file, "r") as f:
-                    data = json.load(f)
-                    state = data.get("status", "")
-                    if state == "SPEAKING":
-                        if getattr(self, "panda_toggle", False):
-                            self.set_panda("pandaB")
-                        else:
-                            self.set_panda("pandaC")
-                        self.panda_toggle = not getattr(self, "panda_toggle", False)
+            for event in self.translation_tail.poll():
+                if event.get("type") in ACTIVITY_EVENTS:
+                    idle.activity()
+                if event.get("type") == "status":
+                    self.translator_state = event.get("status", "")
+                elif event.get("type") == "translation":
+                    self.translation_data = event
+                    self.partial_data = {}
+                elif event.get("type") == "partial":
+                    self.partial_data = event
+
+            state = self.translator_state
+            if state == "SPEAKING":
+                if getattr(self, "panda_toggle", False):
+                    self.set_panda("pandaB")
+                else:
+                    self.set_panda("pandaC")
+                self.panda_toggle = not getattr(self, "panda_toggle", False)
 
-                    elif state == "IDLE":
-                        self.set_panda("pandaA")
-                        self.panda_toggle = False
-                        
-            if os.path.exists(translation_file):
-                with open (translation_file, "r") as f:
-                    trans_data = json.load(f)
+            elif state == "IDLE":
+                self.set_panda("pandaA")
+                self.panda_toggle = False
 
-                translated = trans_data.get("translated_text", "").strip()
+            trans_data = self.translation_data
+            translated = trans_data.get("translated_text", "").strip()
 
-                if translated:
-                    display_text = f"{translated}"
-                    self.placeholder_label.configure(text=display_text, justify="center")
+            if translated:
+                display_text = f"{translated}"
+                self.placeholder_label.configure(text=display_text, justify="center")
 
-        except Exception as e:
-            print("error reading statsu.json", e)
+            # What is being heard so far, shown until the final translation arrives
+            partial = self.partial_data
+            if partial.get("text"):
+                display_text = f"{partial['text']}…"
+                if partial.get("translated_text"):
+                    display_text += f"\n{partial['translated_text']}"
+                self.placeholder_label.configure(text=display_text, justify="center")
 
-        self.after(250, self.check_translator_output)
+        except Exception as e:
+            print("error reading translation events", e)
 
     def update_elements(self):
         super().update_elements()
-        self.title.configure(font=get_relative_font(48, self))
-        self.tagalog_label.configure(font=get_relative_font(28, self, weight="bold"))
-        self.japanese_label.configure(font=get_relative_font(28, self, weight="bold"))
-        self.placeholder_label.configure(font=get_relative_font(22, self))
-        self.start_button.configure(font=get_relative_font(22, self))
-        self.back_button.configure(font=get_relative_font(18, self))
+        restyle(self.title, font=get_relative_font(48, self))
+        restyle(self.tagalog_label, font=get_relative_font(28, self, weight="bold"))
+        restyle(self.japanese_label, font=get_relative_font(28, self, weight="bold"))
+        restyle(self.placeholder_label, font=get_relative_font(22, self))
+        restyle(self.start_button, font=get_relative_font(22, self))
+        restyle(self.back_button, font=get_relative_font(18, self))
 
         pandaA_path = os.path.join("assets", "pandaA.png")
         self.pandaA_img = load_ctk_image(pandaA_path, self, height_percentage=0.72)
@@ -1165,20 +1644,20 @@ class JapTranslateJaptoEnglish(DynamicFrame):
         pandaC_path = os.path.join("assets", "pandaC.png")
         self.pandaC_img = load_ctk_image(pandaC_path, self, height_percentage=0.72)
         if self.pandaA_img:
-            self.panda_label.configure(image=self.pandaA_img)
+            restyle(self.panda_label, image=self.pandaA_img)
         elif self.pandaB_img:
-            self.panda_label.configure(image=self.pandaB_img)
+            restyle(self.panda_label, image=self.pandaB_img)
         elif self.pandaC_img:
-            self.panda_label.configure(image=self.pandaC_img)
+            restyle(self.panda_label, image=self.pandaC_img)
         bubble_width = max(int(self.winfo_width() * 0.28), 400)
         bubble_height = max(int(self.winfo_height() * 0.20), 150)
-        self.bubble_frame.configure(width=bubble_width, height=bubble_height)
+        restyle(self.bubble_frame, width=bubble_width, height=bubble_height)
         
 
         swap_path = os.path.join("assets", "swap.png")
         self.swap_img = load_ctk_image(swap_path, self, height_percentage=0.06)
         if self.swap_img:
-            self.swap_button.configure(image=self.swap_img)
+            restyle(self.swap_button, image=self.swap_img)
 
 class JapTutoring(DynamicFrame):
     def __init__(self, parent):
@@ -1305,16 +1784,16 @@ class JapTutoring(DynamicFrame):
 
         for key, (relx, rely) in positions.items():
             frame = self.frames[key]
-            frame.configure(width=btn_width, height=btn_height)
+            restyle(frame, width=btn_width, height=btn_height)
             frame.place(relx=relx, rely=rely, anchor="center")
 
             icon = load_ctk_image(os.path.join("icons", f"{key}_icon.png"), self, height_percentage=0.08)
             if icon:
-                self.buttons[key].configure(image=icon)
+                restyle(self.buttons[key], image=icon)
                 self.buttons[key].image = icon
 
             label = self.buttons[f"{key}_label"]
-            label.configure(font=get_relative_font(label_font_size, self))
+            restyle(label, font=get_relative_font(label_font_size, self))
             
             if key in ["alphabet", "conversation"]:
                 label.place(relx=relx, rely=rely + 0.12, anchor="center")
@@ -1558,10 +2037,10 @@ class JapColors(DynamicFrame):
 
     def update_elements(self):
         super().update_elements()
-        self.title.configure(font=get_relative_font(60, self))
-        self.front_label.configure(font=get_relative_font(52, self))
-        self.back_label.configure(font=get_relative_font(52, self))
-        self.back_button.configure(font=get_relative_font(28, self))
+        restyle(self.title, font=get_relative_font(60, self))
+        restyle(self.front_label, font=get_relative_font(52, self))
+        restyle(self.back_label, font=get_relative_font(52, self))
+        restyle(self.back_button, font=get_relative_font(28, self))
         # Redraw card after font size changes
         self.draw_card()
         
@@ -1811,10 +2290,10 @@ class JapAnimals(DynamicFrame):
 
     def update_elements(self):
         super().update_elements()
-        self.title.configure(font=get_relative_font(60, self))
-        self.front_label.configure(font=get_relative_font(52, self))
-        self.back_label.configure(font=get_relative_font(52, self))
-        self.back_button.configure(font=get_relative_font(28, self))
+        restyle(self.title, font=get_relative_font(60, self))
+        restyle(self.front_label, font=get_relative_font(52, self))
+        restyle(self.back_label, font=get_relative_font(52, self))
+        restyle(self.back_button, font=get_relative_font(28, self))
         # Redraw card after font size changes
         self.draw_card()
 
@@ -2062,10 +2541,10 @@ class JapShapes(DynamicFrame):
 
     def update_elements(self):
         super().update_elements()
-        self.title.configure(font=get_relative_font(60, self))
-        self.front_label.configure(font=get_relative_font(52, self))
-        self.back_label.configure(font=get_relative_font(52, self))
-        self.back_button.configure(font=get_relative_font(28, self))
+        restyle(self.title, font=get_relative_font(60, self))
+        restyle(self.front_label, font=get_relative_font(52, self))
+        restyle(self.back_label, font=get_relative_font(52, self))
+        restyle(self.back_button, font=get_relative_font(28, self))
         # Redraw card after font size changes
         self.draw_card()
         
@@ -2301,10 +2780,10 @@ class JapNumbers(DynamicFrame):
 
     def update_elements(self):
         super().update_elements()
-        self.title.configure(font=get_relative_font(60, self))
-        self.front_label.configure(font=get_relative_font(52, self))
-        self.back_label.configure(font=get_relative_font(52, self))
-        self.back_button.configure(font=get_relative_font(28, self))
+        restyle(self.title, font=get_relative_font(60, self))
+        restyle(self.front_label, font=get_relative_font(52, self))
+        restyle(self.back_label, font=get_relative_font(52, self))
+        restyle(self.back_button, font=get_relative_font(28, self))
         # Redraw card after font size changes
         self.draw_card()
 
@@ -2541,10 +3020,10 @@ class JapAlphabet(DynamicFrame):
 
     def update_elements(self):
         super().update_elements()
-        self.title.configure(font=get_relative_font(60, self))
-        self.front_label.configure(font=get_relative_font(52, self))
-        self.back_label.configure(font=get_relative_font(52, self))
-        self.back_button.configure(font=get_relative_font(28, self))
+        restyle(self.title, font=get_relative_font(60, self))
+        restyle(self.front_label, font=get_relative_font(52, self))
+        restyle(self.back_label, font=get_relative_font(52, self))
+        restyle(self.back_button, font=get_relative_font(28, self))
         # Redraw card after font size changes
         self.draw_card()
      
@@ -2560,9 +3039,12 @@ class JapDrills(DynamicFrame):
         self.current_translation = ""
         self.current_romanized = ""
         self.user_input = ""
+        self.drill_tail = EventTail(DRILL_LOG)
+        self.drill_data = {}
+        self.partial_data = {}
         self.create_ui_elements()
-        self.clear_drill_json()
-        self.update_drill_results()
+        self.clear_drill_results()
+        self.every(250, self.update_drill_results)
 
     def create_ui_elements(self):
         # Title
@@ -2647,21 +3129,21 @@ class JapDrills(DynamicFrame):
         root.bind("3", lambda event: self.back_button.invoke())
 
     def start_word_drill(self):
-        self.clear_drill_json()
+        self.clear_drill_results()
         self.set_panda("pandaA")
         if self.drill_process is None or self.drill_process.poll() is not None:
             script_path = os.path.join("Modes", "Drill", "JapDrill.py")
-            self.drill_process = subprocess.Popen(["python3", script_path])
+            self.drill_process = launch_script(script_path)
             self.score = 0
             self.update_score()
             self.bubble_content.configure(text="Word drill started! Listen and speak your answers.")
 
     def start_phrase_drill(self):
-        self.clear_drill_json()
+        self.clear_drill_results()
         self.set_panda("pandaA")
         if self.drill_process is None or self.drill_process.poll() is not None:
             script_path = os.path.join("Modes", "Drill", "JapDrillPhrase.py")
-            self.drill_process = subprocess.Popen(["python3", script_path])
+            self.drill_process = launch_script(script_path)
             self.score = 0
             self.update_score()
             self.bubble_content.configure(text="Phrase drill started! Listen and speak your answers.")
@@ -2685,12 +3167,8 @@ class JapDrills(DynamicFrame):
 
     def stop_drill(self):
         if self.drill_process and self.drill_process.poll() is None:
-            self.drill_process.terminate()
-            try:
-                self.drill_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.drill_process.kill()
-            print("[✓] Drill process terminated.")
+            stop_drill_process(self.drill_process)
+            print("[✓] Drill process stopped.")
 
         self.panda_label.configure(image=self.pandaA_img)
         self.panda_toggle = False            
@@ -2708,87 +3186,97 @@ class JapDrills(DynamicFrame):
 
     def update_drill_results(self):
         if not self.running:
-            return
+            return False
         try:
-            json_path = os.path.join("Modes", "Drill", "drill_results.json")
-            if os.path.exists(json_path):
-                with open(json_path, "r") as f:
-                    data = json.load(f)
-                    
-                    if "current_word" in data:
-                        self.current_word = data["current_word"]
-                    
-                    if "user_input" in data:
-                        self.user_input = data["user_input"]
-                        # Show current question and user's answer in bubble
-                        display_text = f"Filipino: {self.current_word}\n\nYour answer: {self.user_input}"
-                        self.bubble_content.configure(text=display_text)
-            
-                    if "status" in data:
-                        if data["status"] == "QUESTION":
-                           self.bubble_content.configure(
-                               text=f"Filipino: {data['current_word']}"
-                           )
+            for event in self.drill_tail.poll():
+                if event.get("type") in ACTIVITY_EVENTS:
+                    idle.activity()
+                if event.get("type") == "partial":
+                    self.partial_data = event
+                elif event.get("type") == "drill":
+                    self.drill_data = event
+                    self.partial_data = {}
+            data = self.drill_data
+            if data:
+                if "current_word" in data:
+                    self.current_word = data["current_word"]
+                
+                if "user_input" in data:
+                    self.user_input = data["user_input"]
+                    # Show current question and user's answer in bubble
+                    display_text = f"Filipino: {self.current_word}\n\nYour answer: {self.user_input}"
+                    self.bubble_content.configure(text=display_text)
+        
+                if "status" in data:
+                    if data["status"] == "QUESTION":
+                       self.bubble_content.configure(
+                           text=f"Filipino: {data['current_word']}"
+                       )
+                       # The results are polled every 250 ms; the panda keeps its own slower pace
+                       if time.monotonic() - getattr(self, "panda_flipped_at", 0.0) >= DRILL_PANDA_FLIP:
                            if getattr(self, "panda_toggle", False):
                                self.set_panda("pandaB")
                            else:
                                self.set_panda("pandaC")
                            self.panda_toggle = not getattr(self, "panda_toggle", False)
-                        elif data["status"] == "ANSWER":
-                            self.bubble_content.configure(
-                                text=f"Your answer: {data['user_input']} ({data['user_romanized']})"
-                            )
-                            self.set_panda("pandaA")
-                            self.panda_toggle = False
-                        elif data["status"] == "RESULT":
-                            if data["is_correct"]:
-                                result_text = (f"Correct!\n\n"
-                                               f"Filipino: {data['current_word']}\n"
-                                               f"Your answer: {data['user_input']} ({data['user_romanized']})\n\n"
-                                               f"Japanese: {data['translation']} ({data['romanized']})")
-                            else:
-                                result_text = (f"Incorrect\n\n"
-                                               f"Filipino: {data['current_word']}\n"
-                                               f"Your answer: {data['user_input']} ({data['user_romanized']})\n\n"
-                                               f"Correct answer:\nJapanese: {data['translation']} ({data['romanized']})")
-                            self.bubble_content.configure(text=result_text)
-                            self.set_panda("pandaA")
-                            self.panda_toggle = False
-                        elif data["status"] == "COMPLETE":
-                            final_text = f"Drill Complete!"
-                            if data['final_score'] >= 4:
-                                final_text += "\n\nExcellent work!"
-                            elif data['final_score'] >= 3:
-                                final_text += "\n\nGood Job! Keep Practicing!"
-                            else:
-                                final_text += "\n\nKeep studying! You'll improve!"
-                            self.bubble_content.configure(text=final_text)
-                            self.set_panda("pandaA")
-                            self.panda_toggle = False
-                        
+                           self.panda_flipped_at = time.monotonic()
+                    elif data["status"] == "ANSWER":
+                        self.bubble_content.configure(
+                            text=f"Your answer: {data['user_input']} ({data['user_romanized']})"
+                        )
+                        self.set_panda("pandaA")
+                        self.panda_toggle = False
+                    elif data["status"] == "RESULT":
+                        if data["is_correct"]:
+                            result_text = (f"Correct!\n\n"
+                                           f"Filipino: {data['current_word']}\n"
+                                           f"Your answer: {data['user_input']} ({data['user_romanized']})\n\n"
+                                           f"Japanese: {data['translation']} ({data['romanized']})")
+                        else:
+                            result_text = (f"Incorrect\n\n"
+                                           f"Filipino: {data['current_word']}\n"
+                                           f"Your answer: {data['user_input']} ({data['user_romanized']})\n\n"
+                                           f"Correct answer:\nJapanese: {data['translation']} ({data['romanized']})")
+                            if data.get("alignment"):
+                                result_text += f"\nCheck: {format_alignment(data['alignment'])}"
+                        self.bubble_content.configure(text=result_text)
+                        self.set_panda("pandaA")
+                        self.panda_toggle = False
+                    elif data["status"] == "COMPLETE":
+                        final_text = f"Drill Complete!"
+                        if data['final_score'] >= 4:
+                            final_text += "\n\nExcellent work!"
+                        elif data['final_score'] >= 3:
+                            final_text += "\n\nGood Job! Keep Practicing!"
+                        else:
+                            final_text += "\n\nKeep studying! You'll improve!"
+                        self.bubble_content.configure(text=final_text)
+                        self.set_panda("pandaA")
+                        self.panda_toggle = False
+                    
+            # The answer as it is being spoken, until the graded one arrives
+            if self.partial_data.get("text"):
+                self.bubble_content.configure(
+                    text=f"Filipino: {self.current_word}\n\nYour answer: {self.partial_data['text']}…"
+                )
+
         except Exception as e:
             print(f"[!] Failed to update drill results: {e}")
-        
-        if self.running:
-            self.after(1000, self.update_drill_results)
 
-    def clear_drill_json(self):
-        results_file = os.path.join("Modes", "Drill", "drill_results.json")
-        try:
-            with open(results_file, "w") as f:
-                json.dump({}, f)
-            print("Results cleared")
-        except Exception as e:
-            print("Failed to clear")
+    def clear_drill_results(self):
+        # Start from the end of the log so results from an earlier drill are not replayed
+        self.drill_tail.skip_to_end()
+        self.drill_data = {}
+        self.partial_data = {}
 
     def update_elements(self):
         super().update_elements()
-        self.title.configure(font=get_relative_font(48, self))
-        self.bubble_content.configure(font=get_relative_font(22, self))
-        self.words_button.configure(font=get_relative_font(28, self, weight="bold"))
-        self.phrases_button.configure(font=get_relative_font(28, self, weight="bold"))
-        self.score_label.configure(font=get_relative_font(22, self))
-        self.back_button.configure(font=get_relative_font(18, self))
+        restyle(self.title, font=get_relative_font(48, self))
+        restyle(self.bubble_content, font=get_relative_font(22, self))
+        restyle(self.words_button, font=get_relative_font(28, self, weight="bold"))
+        restyle(self.phrases_button, font=get_relative_font(28, self, weight="bold"))
+        restyle(self.score_label, font=get_relative_font(22, self))
+        restyle(self.back_button, font=get_relative_font(18, self))
 
         
         pandaA_path = os.path.join("assets", "pandaA.png")
@@ -2798,16 +3286,16 @@ class JapDrills(DynamicFrame):
         pandaC_path = os.path.join("assets", "pandaC.png")
         self.pandaC_img = load_ctk_image(pandaC_path, self, height_percentage=0.72)
         if self.pandaA_img:
-            self.panda_label.configure(image=self.pandaA_img)
+            restyle(self.panda_label, image=self.pandaA_img)
         elif self.pandaB_img:
-            self.panda_label.configure(image=self.pandaB_img)
+            restyle(self.panda_label, image=self.pandaB_img)
         elif self.pandaC_img:
-            self.panda_label.configure(image=self.pandaC_img)
+            restyle(self.panda_label, image=self.pandaC_img)
 
         
         bubble_width = max(int(self.winfo_width() * 0.28), 400)
         bubble_height = max(int(self.winfo_height() * 0.20), 150)
-        self.bubble_frame.configure(width=bubble_width, height=bubble_height)
+        restyle(self.bubble_frame, width=bubble_width, height=bubble_height)
 
 # Korean Classes
 class KorModePage(DynamicFrame):
@@ -2904,16 +3392,16 @@ class KorModePage(DynamicFrame):
 
         for btn_name, relx in positions.items():
             frame = self.frames[btn_name]
-            frame.configure(width=btn_width, height=btn_height)
+            restyle(frame, width=btn_width, height=btn_height)
             frame.place(relx=relx, rely=0.48, anchor="center")
 
             icon = load_ctk_image(os.path.join("icons", f"{btn_name}_icon.png"), self, height_percentage=0.15)
             if icon:
-                self.buttons[btn_name].configure(image=icon)
+                restyle(self.buttons[btn_name], image=icon)
                 self.buttons[btn_name].image = icon
 
             label = self.buttons[f"{btn_name}_label"]
-            label.configure(font=get_relative_font(label_font_size, self))
+            restyle(label, font=get_relative_font(label_font_size, self))
             label.place(relx=relx, rely=0.70, anchor="center")
 
         self.back_button.place(relx=0.5, rely=0.9, anchor="center")
@@ -2926,11 +3414,19 @@ class KorTranslate(DynamicFrame):
     def __init__(self, parent):
         theme = get_current_theme()
         super().__init__(parent, theme["primary"])
-        self.translator_process = None
+        self.direction = ("tl", "ko")
         self.running = True
         self.is_listening = False
+        self.translation_tail = EventTail(TRANSLATION_LOG)
+        self.translator_state = ""
+        self.translation_data = {}
+        self.partial_data = {}
         self.create_ui_elements()
 
+        # Arriving here from a swap while listening: the worker just changes direction
+        if translator_worker["listening"]:
+            self.toggle_listening()
+
     def create_ui_elements(self):
         theme = get_current_theme()
         self.title = ctk.CTkLabel(self, text="Translate", 
@@ -3011,7 +3507,7 @@ class KorTranslate(DynamicFrame):
         root.bind("2", lambda event: self.swap_button.invoke())
         root.bind("3", lambda event: self.back_button.invoke())
 
-        self.after(250, self.check_translator_output)
+        self.every(250, self.check_translator_output)
 
     def on_back(self):
         self.running = False
@@ -3028,50 +3524,29 @@ class KorTranslate(DynamicFrame):
 
     def toggle_listening(self):
         self.is_listening = not self.is_listening
-        status_file = os.path.join("Modes", "Translation", "status.json")
         if self.is_listening:
-            with open(status_file, "w") as f:
-                json.dump({"status": "LOADING"}, f)
+            translation_log.append("status", status="LOADING")
             self.start_translator()
         else:
             self.stop_translator()
-            with open(status_file, "w") as f:
-                json.dump({"status": "IDLE"}, f)
+            translation_log.append("status", status="IDLE")
 
     def start_translator(self):
-        if self.translator_process is None or self.translator_process.poll() is not None:
-            script_path = os.path.join("Modes", "Translation", "KorTranslator.py")
-            self.translator_process = subprocess.Popen(["python3", script_path])
+        start_translation(*self.direction)
 
     def stop_translator(self):
-        if self.translator_process and self.translator_process.poll() is None:
-            self.translator_process.terminate()
-            stop_path = os.path.join("Modes", "Translation", "stop.json")
-            with open(stop_path, "w") as f:
-                json.dump({"stop": True}, f)
-
+        pause_translation()
 
         self.panda_label.configure(image=self.pandaA_img)
         self.placeholder_label.configure(text="Press START to begin")
         self.panda_toggle = False
 
-        translation_file = os.path.join("Modes", "Translation", "translation_data.json")
-        try:
-            with open(translation_file, "w") as f:
-                json.dump({
-                    "transcription": "",
-                    "translated_text": "",
-                    "romanized_text": ""
-                }, f)
-        except Exception as e:
-            print("Error clearing translation file:", e)
-
-        status_file = os.path.join("Modes", "Translation", "status.json")
+        # Clear the bubble and reset the status for anything tailing the log
         try:
-            with open(status_file, "w") as f:
-                json.dump({"status": "IDLE"}, f)
+            translation_log.append("translation", transcription="", translated_text="", romanized_text="")
+            translation_log.append("status", status="IDLE")
         except Exception as e:
-            print("Failed to reset status:", e)
+            print("Failed to reset translation events:", e)
 
     def set_panda(self, state):
         if state == "pandaA":
@@ -3082,57 +3557,66 @@ class KorTranslate(DynamicFrame):
             self.panda_label.configure(image=self.pandaC_img)
 
     def check_translator_output(self):
-        status_file = os.path.join("Modes", "Translation", "status.json")
-        translation_file = os.path.join("Modes", "Translation", "translation_data.json")
         try:
-            if os.path.exists(status_file):
-                with open(status_file, "r") as f:
-                    data = json.load(f)
-                    state = data.get("status", "")
-                    if state == "SPEAKING":
-                        if getattr(self, "panda_toggle", False):
-                            self.set_panda("pandaB")
-                        else:
-                            self.set_panda("pandaC")
-                        self.panda_toggle = not getattr(self, "panda_toggle", False)
-
-                    elif state == "IDLE":
-                        self.set_panda("pandaA")
-                        self.panda_toggle = False
-                        
-                    elif state == "LOADING":
-                        self.placeholder_label.configure(text="Loading Model...")
-                        self.set_panda("pandaA")
-                        
-                    elif state == "LOADED":
-                        self.placeholder_label.configure(text="Listening speak now")
-                        self.set_panda("pandaA")
-                        
-            if os.path.exists(translation_file):
-                with open (translation_file, "r") as f:
-                    trans_data = json.load(f)
-
-                translated = trans_data.get("translated_text", "").strip()
-                romanized = trans_data.get("romanized_text", "").strip()
+            for event in self.translation_tail.poll():
+                if event.get("type") in ACTIVITY_EVENTS:
+                    idle.activity()
+                if event.get("type") == "status":
+                    self.translator_state = event.get("status", "")
+                elif event.get("type") == "translation":
+                    self.translation_data = event
+                    self.partial_data = {}
+                elif event.get("type") == "partial":
+                    self.partial_data = event
+
+            state = self.translator_state
+            if state == "SPEAKING":
+                if getattr(self, "panda_toggle", False):
+                    self.set_panda("pandaB")
+                else:
+                    self.set_panda("pandaC")
+                self.panda_toggle = not getattr(self, "panda_toggle", False)
 
-                if translated or romanized:
-                    display_text = f"{romanized}\n{translated}"
-                    self.placeholder_label.configure(text=display_text, justify="center")
+            elif state == "IDLE":
+                self.set_panda("pandaA")
+                self.panda_toggle = False
+                
+            elif state == "LOADING":
+                self.placeholder_label.configure(text="Loading Model...")
+                self.set_panda("pandaA")
+                
+            elif state == "LOADED":
+                self.placeholder_label.configure(text="Listening speak now")
+                self.set_panda("pandaA")
+
+            trans_data = self.translation_data
+            translated = trans_data.get("translated_text", "").strip()
+            romanized = trans_data.get("romanized_text", "").strip()
+
+            if translated or romanized:
+                display_text = f"{romanized}\n{translated}"
+                self.placeholder_label.configure(text=display_text, justify="center")
+
+            # What is being heard so far, shown until the final translation arrives
+            partial = self.partial_data
+            if partial.get("text"):
+                display_text = f"{partial['text']}…"
+                if partial.get("translated_text"):
+                    display_text += f"\n{partial['translated_text']}"
+                self.placeholder_label.configure(text=display_text, justify="center")
 
         except Exception as e:
-            print("error reading statsu.json", e)
-
-        self.after(250, self.check_translator_output)
+            print("error reading translation events", e)
 
 
     def update_elements(self):
         super().update_elements()
-        self.title.configure(font=get_relative_font(48, self))
-        self.tagalog_label.configure(font=get_relative_font(28, self, weight="bold"))
-        self.korean_label.configure(font=get_relative_font(28, self, weight="bold"))
-        self.placeholder_label.configure(font=get_relative_font(22, self))
-        self.start_button.configure(font=get_relative_font(22, self))
-        self.back_button.configure(font=get_relative_font(18, self))
+        restyle(self.title, font=get_relative_font(48, self))
+        restyle(self.tagalog_label, font=get_relative_font(28, self, weight="bold"))
+        restyle(self.korean_label, font=get_relative_font(28, self, weight="bold"))
+        restyle(self.placeholder_label, font=get_relative_font(22, self))
+        restyle(self.start_button, font=get_relative_font(22, self))
+        restyle(self.back_button, font=get_relative_font(18, self))
 
         pandaA_path = os.path.join("assets", "pandaA.png")
         self.pandaA_img = load_ctk_image(pandaA_path, self, height_percentage=0.72)
@@ -3141,30 +3625,38 @@ class KorTranslate(DynamicFrame):
         pandaC_path = os.path.join("assets", "pandaC.png")
         self.pandaC_img = load_ctk_image(pandaC_path, self, height_percentage=0.72)
         if self.pandaA_img:
-            self.panda_label.configure(image=self.pandaA_img)
+            restyle(self.panda_label, image=self.pandaA_img)
         elif self.pandaB_img:
-            self.panda_label.configure(image=self.pandaB_img)
+            restyle(self.panda_label, image=self.pandaB_img)
         elif self.pandaC_img:
-            self.panda_label.configure(image=self.pandaC_img)
+            restyle(self.panda_label, image=self.pandaC_img)
 
         bubble_width = max(int(self.winfo_width() * 0.28), 400)
         bubble_height = max(int(self.winfo_height() * 0.20), 150)
-        self.bubble_frame.configure(width=bubble_width, height=bubble_height)
+        restyle(self.bubble_frame, width=bubble_width, height=bubble_height)
 
         swap_path = os.path.join("assets", "swap.png")
         self.swap_img = load_ctk_image(swap_path, self, height_percentage=0.06)
         if self.swap_img:
-            self.swap_button.configure(image=self.swap_img)
+            restyle(self.swap_button, image=self.swap_img)
 
 class KorTranslateJaptoEnglish(DynamicFrame):
     def __init__(self, parent):
         theme = get_current_theme()
         super().__init__(parent, theme["primary"])
-        self.translator_process = None
+        self.direction = ("ko", "tl")
         self.running = True
         self.is_listening = False
+        self.translation_tail = EventTail(TRANSLATION_LOG)
+        self.translator_state = ""
+        self.translation_data = {}
+        self.partial_data = {}
         self.create_ui_elements()
 
+        # Arriving here from a swap while listening: the worker just changes direction
+        if translator_worker["listening"]:
+            self.toggle_listening()
+
     def create_ui_elements(self):
         theme = get_current_theme()
         self.title = ctk.CTkLabel(self, text="Translate", 
@@ -3239,7 +3731,7 @@ class KorTranslateJaptoEnglish(DynamicFrame):
         root.bind("2", lambda event: show_frame(KorTranslate))
         root.bind("3", lambda event: self.back_button.invoke())
 
-        self.after(250, self.check_translator_output)
+        self.every(250, self.check_translator_output)
 
     def toggle_listening(self):
         self.is_listening = not self.is_listening
@@ -3260,39 +3752,20 @@ class KorTranslateJaptoEnglish(DynamicFrame):
         show_frame(KorModePage)
 
     def start_translator(self):
-        if self.translator_process is None or self.translator_process.poll() is not None:
-            script_path = os.path.join("Modes", "Translation", "KorToFilTranslator.py")
-            self.translator_process = subprocess.Popen(["python3", script_path])
+        start_translation(*self.direction)
 
     def stop_translator(self):
-        if self.translator_process and self.translator_process.poll() is None:
-            self.translator_process.terminate()
-            try:
-                self.translator_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.translator_process.kill()
-            print("Translator Process Terminated")
+        pause_translation()
 
         self.panda_label.configure(image=self.pandaA_img)
         self.panda_toggle = False
 
-        translation_file = os.path.join("Modes", "Translation", "translation_data.json")
+        # Clear the bubble and reset the status for anything tailing the log
         try:
-            with open(translation_file, "w") as f:
-                json.dump({
-                    "transcription": "",
-                    "translated_text": "",
-                    "romanized_text": ""
-                }, f)
+            translation_log.append("translation", transcription="", translated_text="", romanized_text="")
+            translation_log.append("status", status="IDLE")
         except Exception as e:
-            print("Error clearing translation file:", e)
-
-        status_file = os.path.join("Modes", "Translation", "status.json")
-        try:
-            with open(status_file, "w") as f:
-                json.dump({"status": "IDLE"}, f)
-        except Exception as e:
-            print("Failed to reset status:", e)
+            print("Failed to reset translation events:", e)
 
     def set_panda(self, state):
         if state == "pandaA":
@@ -3303,47 +3776,56 @@ class KorTranslateJaptoEnglish(DynamicFrame):
             self.panda_label.configure(image=self.pandaC_img)
 
     def check_translator_output(self):
-        status_file = os.path.join("Modes", "Translation", "status.json")
-        translation_file = os.path.join("Modes", "Translation", "translation_data.json")
         try:
-            if os.path.exists(status_file):
-                with open(status_file, "r") as f:
-                    data = json.load(f)
-                    state = data.get("status", "")
-                    if state == "SPEAKING":
-                        if getattr(self, "panda_toggle", False):
-                            self.set_panda("pandaB")
-                        else:
-                            self.set_panda("pandaC")
-                        self.panda_toggle = not getattr(self, "panda_toggle", False)
+            for event in self.translation_tail.poll():
+                if event.get("type") in ACTIVITY_EVENTS:
+                    idle.activity()
+                if event.get("type") == "status":
+                    self.translator_state = event.get("status", "")
+                elif event.get("type") == "translation":
+                    self.translation_data = event
+                    self.partial_data = {}
+                elif event.get("type") == "partial":
+                    self.partial_data = event
+
+            state = self.translator_state
+            if state == "SPEAKING":
+                if getattr(self, "panda_toggle", False):
+                    self.set_panda("pandaB")
+                else:
+                    self.set_panda("pandaC")
+                self.panda_toggle = not getattr(self, "panda_toggle", False)
 
-                    elif state == "IDLE":
-                        self.set_panda("pandaA")
-                        self.panda_toggle = False
-                        
-            if os.path.exists(translation_file):
-                with open (translation_file, "r") as f:
-                    trans_data = json.load(f)
+            elif state == "IDLE":
+                self.set_panda("pandaA")
+                self.panda_toggle = False
 
-                translated = trans_data.get("translated_text", "").strip()
+            trans_data = self.translation_data
+            translated = trans_data.get("translated_text", "").strip()
 
-                if translated:
-                    display_text = f"{translated}"
-                    self.placeholder_label.configure(text=display_text, justify="center")
+            if translated:
+                display_text = f"{translated}"
+                self.placeholder_label.configure(text=display_text, justify="center")
 
-        except Exception as e:
-            print("error reading statsu.json", e)
+            # What is being heard so far, shown until the final translation arrives
+            partial = self.partial_data
+            if partial.get("text"):
+                display_text = f"{partial['text']}…"
+                if partial.get("translated_text"):
+                    display_text += f"\n{partial['translated_text']}"
+                self.placeholder_label.configure(text=display_text, justify="center")
 
-        self.after(250, self.check_translator_output)
+        except Exception as e:
+            print("error reading translation events", e)
 
     def update_elements(self):
         super().update_elements()
-        self.title.configure(font=get_relative_font(48, self))
-        self.korean_label.configure(font=get_relative_font(28, self, weight="bold"))
-        self.tagalog_label.configure(font=get_relative_font(28, self, weight="bold"))
-        self.placeholder_label.configure(font=get_relative_font(22, self))
-        self.start_button.configure(font=get_relative_font(22, self))
-        self.back_button.configure(font=get_relative_font(18, self))
+        restyle(self.title, font=get_relative_font(48, self))
+        restyle(self.korean_label, font=get_relative_font(28, self, weight="bold"))
+        restyle(self.tagalog_label, font=get_relative_font(28, self, weight="bold"))
+        restyle(self.placeholder_label, font=get_relative_font(22, self))
+        restyle(self.start_button, font=get_relative_font(22, self))
+        restyle(self.back_button, font=get_relative_font(18, self))
 
         pandaA_path = os.path.join("assets", "pandaA.png")
         self.pandaA_img = load_ctk_image(pandaA_path, self, height_percentage=0.72)
@@ -3352,19 +3834,19 @@ class KorTranslateJaptoEnglish(DynamicFrame):
         pandaC_path = os.path.join("assets", "pandaC.png")
         self.pandaC_img = load_ctk_image(pandaC_path, self, height_percentage=0.72)
         if self.pandaA_img:
-            self.panda_label.configure(image=self.pandaA_img)
+            restyle(self.panda_label, image=self.pandaA_img)
         elif self.pandaB_img:
-            self.panda_label.configure(image=self.pandaB_img)
+            restyle(self.panda_label, image=self.pandaB_img)
         elif self.pandaC_img:
-            self.panda_label.configure(image=self.pandaC_img)
+            restyle(self.panda_label, image=self.pandaC_img)
         bubble_width = max(int(self.winfo_width() * 0.28), 400)
         bubble_height = max(int(self.winfo_height() * 0.20), 150)
-        self.bubble_frame.configure(width=bubble_width, height=bubble_height)
+        restyle(self.bubble_frame, width=bubble_width, height=bubble_height)
 
         swap_path = os.path.join("assets", "swap.png")
         self.swap_img = load_ctk_image(swap_path, self, height_percentage=0.06)
         if self.swap_img:
-            self.swap_button.configure(image=self.swap_img)
+            restyle(self.swap_button, image=self.swap_img)
 
 class KorTutoring(DynamicFrame):
     def __init__(self, parent):
@@ -3489,16 +3971,16 @@ class KorTutoring(DynamicFrame):
 
         for key, (relx, rely) in positions.items():
             frame = self.frames[key]
-            frame.configure(width=btn_width, height=btn_height)
+            restyle(frame, width=btn_width, height=btn_height)
             frame.place(relx=relx, rely=rely, anchor="center")
 
             icon = load_ctk_image(os.path.join("icons", f"{key}_icon.png"), self, height_percentage=0.08)
             if icon:
-                self.buttons[key].configure(image=icon)
+                restyle(self.buttons[key], image=icon)
                 self.buttons[key].image = icon
 
             label = self.buttons[f"{key}_label"]
-            label.configure(font=get_relative_font(label_font_size, self))
+            restyle(label, font=get_relative_font(label_font_size, self))
             
             if key in ["alphabet", "conversation"]:
                 label.place(relx=relx, rely=rely + 0.12, anchor="center")
@@ -3739,10 +4221,10 @@ class KorColors(DynamicFrame):
 
     def update_elements(self):
         super().update_elements()
-        self.title.configure(font=get_relative_font(60, self))
-        self.front_label.configure(font=get_relative_font(52, self))
-        self.back_label.configure(font=get_relative_font(52, self))
-        self.back_button.configure(font=get_relative_font(28, self))
+        restyle(self.title, font=get_relative_font(60, self))
+        restyle(self.front_label, font=get_relative_font(52, self))
+        restyle(self.back_label, font=get_relative_font(52, self))
+        restyle(self.back_button, font=get_relative_font(28, self))
         # Redraw card after font size changes
         self.draw_card()
 
@@ -3969,10 +4451,10 @@ class KorAnimals(DynamicFrame):
 
     def update_elements(self):
         super().update_elements()
-        self.title.configure(font=get_relative_font(60, self))
-        self.front_label.configure(font=get_relative_font(52, self))
-        self.back_label.configure(font=get_relative_font(52, self))
-        self.back_button.configure(font=get_relative_font(28, self))
+        restyle(self.title, font=get_relative_font(60, self))
+        restyle(self.front_label, font=get_relative_font(52, self))
+        restyle(self.back_label, font=get_relative_font(52, self))
+        restyle(self.back_button, font=get_relative_font(28, self))
         # Redraw card after font size changes
         self.draw_card()
 
@@ -4200,10 +4682,10 @@ class KorNumbers(DynamicFrame):
 
     def update_elements(self):
         super().update_elements()
-        self.title.configure(font=get_relative_font(60, self))
-        self.front_label.configure(font=get_relative_font(52, self))
-        self.back_label.configure(font=get_relative_font(52, self))
-        self.back_button.configure(font=get_relative_font(28, self))
+        restyle(self.title, font=get_relative_font(60, self))
+        restyle(self.front_label, font=get_relative_font(52, self))
+        restyle(self.back_label, font=get_relative_font(52, self))
+        restyle(self.back_button, font=get_relative_font(28, self))
         # Redraw card after font size changes
         self.draw_card()
 
@@ -4430,10 +4912,10 @@ class KorShapes(DynamicFrame):
 
     def update_elements(self):
         super().update_elements()
-        self.title.configure(font=get_relative_font(60, self))
-        self.front_label.configure(font=get_relative_font(52, self))
-        self.back_label.configure(font=get_relative_font(52, self))
-        self.back_button.configure(font=get_relative_font(28, self))
+        restyle(self.title, font=get_relative_font(60, self))
+        restyle(self.front_label, font=get_relative_font(52, self))
+        restyle(self.back_label, font=get_relative_font(52, self))
+        restyle(self.back_button, font=get_relative_font(28, self))
         # Redraw card after font size changes
         self.draw_card()
         
@@ -4662,10 +5144,10 @@ class KorAlphabet(DynamicFrame):
 
     def update_elements(self):
         super().update_elements()
-        self.title.configure(font=get_relative_font(60, self))
-        self.front_label.configure(font=get_relative_font(52, self))
-        self.back_label.configure(font=get_relative_font(52, self))
-        self.back_button.configure(font=get_relative_font(28, self))
+        restyle(self.title, font=get_relative_font(60, self))
+        restyle(self.front_label, font=get_relative_font(52, self))
+        restyle(self.back_label, font=get_relative_font(52, self))
+        restyle(self.back_button, font=get_relative_font(28, self))
         # Redraw card after font size changes
         self.draw_card()
         
@@ -4680,9 +5162,12 @@ class KorDrills(DynamicFrame):
         self.current_translation = ""
         self.current_romanized = ""
         self.user_input = ""
+        self.drill_tail = EventTail(DRILL_LOG)
+        self.drill_data = {}
+        self.partial_data = {}
         self.create_ui_elements()
-        self.clear_drill_json()
-        self.update_drill_results()
+        self.clear_drill_results()
+        self.every(250, self.update_drill_results)
 
     def create_ui_elements(self):
         self.title = ctk.CTkLabel(self, text="Drills", 
@@ -4760,21 +5245,21 @@ class KorDrills(DynamicFrame):
         root.bind("3", lambda event: self.back_button.invoke())
 
     def start_word_drill(self):
-        self.clear_drill_json()
+        self.clear_drill_results()
         self.set_panda("pandaA")
         if self.drill_process is None or self.drill_process.poll() is not None:
             script_path = os.path.join("Modes", "Drill", "KorDrill.py")
-            self.drill_process = subprocess.Popen(["python3", script_path])
+            self.drill_process = launch_script(script_path)
             self.score = 0
             self.update_score()
             self.bubble_content.configure(text="Word drill started! Listen and speak your answers.")
 
     def start_phrase_drill(self):
-        self.clear_drill_json()
+        self.clear_drill_results()
         self.set_panda("pandaA")
         if self.drill_process is None or self.drill_process.poll() is not None:
             script_path = os.path.join("Modes", "Drill", "KorDrillPhrase.py")
-            self.drill_process = subprocess.Popen(["python3", script_path])
+            self.drill_process = launch_script(script_path)
             self.score = 0
             self.update_score()
             self.bubble_content.configure(text="Phrase drill started! Listen and speak your answers.")
@@ -4798,12 +5283,8 @@ class KorDrills(DynamicFrame):
 
     def stop_drill(self):
         if self.drill_process and self.drill_process.poll() is None:
-            self.drill_process.terminate()
-            try:
-                self.drill_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.drill_process.kill()
-            print("[✓] Drill process terminated.")
+            stop_drill_process(self.drill_process)
+            print("[✓] Drill process stopped.")
         
         self.panda_label.configure(image=self.pandaA_img)
         self.panda_toggle = False
@@ -4821,88 +5302,98 @@ class KorDrills(DynamicFrame):
 
     def update_drill_results(self):
         if not self.running:
-            return
+            return False
         try:
-            json_path = os.path.join("Modes", "Drill", "drill_results.json")
-            if os.path.exists(json_path):
-                with open(json_path, "r") as f:
-                    data = json.load(f)
-                    
-                    if "current_word" in data:
-                        self.current_word = data["current_word"]
-                    
-                    if "user_input" in data:
-                        self.user_input = data["user_input"]
-                        # Show current question and user's answer in bubble
-                        display_text = f"Filipino: {self.current_word}\n\nYour answer: {self.user_input}"
-                        self.bubble_content.configure(text=display_text)
-            
-                    if "status" in data:
-                        if data["status"] == "QUESTION":
-                           self.bubble_content.configure(
-                               text=f"Filipino: {data['current_word']}"
-                           )
+            for event in self.drill_tail.poll():
+                if event.get("type") in ACTIVITY_EVENTS:
+                    idle.activity()
+                if event.get("type") == "partial":
+                    self.partial_data = event
+                elif event.get("type") == "drill":
+                    self.drill_data = event
+                    self.partial_data = {}
+            data = self.drill_data
+            if data:
+                if "current_word" in data:
+                    self.current_word = data["current_word"]
+                
+                if "user_input" in data:
+                    self.user_input = data["user_input"]
+                    # Show current question and user's answer in bubble
+                    display_text = f"Filipino: {self.current_word}\n\nYour answer: {self.user_input}"
+                    self.bubble_content.configure(text=display_text)
+        
+                if "status" in data:
+                    if data["status"] == "QUESTION":
+                       self.bubble_content.configure(
+                           text=f"Filipino: {data['current_word']}"
+                       )
+                       # The results are polled every 250 ms; the panda keeps its own slower pace
+                       if time.monotonic() - getattr(self, "panda_flipped_at", 0.0) >= DRILL_PANDA_FLIP:
                            if getattr(self, "panda_toggle", False):
                                self.set_panda("pandaB")
                            else:
                                self.set_panda("pandaC")
                            self.panda_toggle = not getattr(self, "panda_toggle", False)
-                        elif data["status"] == "ANSWER":
-                            self.bubble_content.configure(
-                                text=f"Your answer: {data['user_input']} ({data['user_romanized']})"
-                            )
-                            self.set_panda("pandaA")
-                            self.panda_toggle = False
-                        elif data["status"] == "RESULT":
-                            if data["is_correct"]:
-                                result_text = (f"Correct!\n\n"
-                                               f"Filipino: {data['current_word']}\n"
-                                               f"Your answer: {data['user_input']} ({data['user_romanized']})\n\n"
-                                               f"Korean: {data['translation']} ({data['romanized']})")
-                            else:
-                                result_text = (f"Incorrect\n\n"
-                                               f"Filipino: {data['current_word']}\n"
-                                               f"Your answer: {data['user_input']} ({data['user_romanized']})\n\n"
-                                               f"Correct answer:\nKorean: {data['translation']} ({data['romanized']})")
-                            self.bubble_content.configure(text=result_text)
-                            self.set_panda("pandaA")
-                            self.panda_toggle = False
-                        elif data["status"] == "COMPLETE":
-                            final_text = f"Drill Complete!"
-                            if data['final_score'] >= 4:
-                                final_text += "\n\nExcellent work!"
-                            elif data['final_score'] >= 3:
-                                final_text += "\n\nGood Job! Keep Practicing!"
-                            else:
-                                final_text += "\n\nKeep studying! You'll improve!"
-                            self.bubble_content.configure(text=final_text)
-                            self.set_panda("pandaA")
-                            self.panda_toggle = False
-                        
+                           self.panda_flipped_at = time.monotonic()
+                    elif data["status"] == "ANSWER":
+                        self.bubble_content.configure(
+                            text=f"Your answer: {data['user_input']} ({data['user_romanized']})"
+                        )
+                        self.set_panda("pandaA")
+                        self.panda_toggle = False
+                    elif data["status"] == "RESULT":
+                        if data["is_correct"]:
+                            result_text = (f"Correct!\n\n"
+                                           f"Filipino: {data['current_word']}\n"
+                                           f"Your answer: {data['user_input']} ({data['user_romanized']})\n\n"
+                                           f"Korean: {data['translation']} ({data['romanized']})")
+                        else:
+                            result_text = (f"Incorrect\n\n"
+                                           f"Filipino: {data['current_word']}\n"
+                                           f"Your answer: {data['user_input']} ({data['user_romanized']})\n\n"
+                                           f"Correct answer:\nKorean: {data['translation']} ({data['romanized']})")
+                            if data.get("alignment"):
+                                result_text += f"\nCheck: {format_alignment(data['alignment'])}"
+                        self.bubble_content.configure(text=result_text)
+                        self.set_panda("pandaA")
+                        self.panda_toggle = False
+                    elif data["status"] == "COMPLETE":
+                        final_text = f"Drill Complete!"
+                        if data['final_score'] >= 4:
+                            final_text += "\n\nExcellent work!"
+                        elif data['final_score'] >= 3:
+                            final_text += "\n\nGood Job! Keep Practicing!"
+                        else:
+                            final_text += "\n\nKeep studying! You'll improve!"
+                        self.bubble_content.configure(text=final_text)
+                        self.set_panda("pandaA")
+                        self.panda_toggle = False
+                    
+            # The answer as it is being spoken, until the graded one arrives
+            if self.partial_data.get("text"):
+                self.bubble_content.configure(
+                    text=f"Filipino: {self.current_word}\n\nYour answer: {self.partial_data['text']}…"
+                )
+
         except Exception as e:
             print(f"[!] Failed to update drill results: {e}")
 
-        if self.running:
-            self.after(1000, self.update_drill_results)
-
-    def clear_drill_json(self):
-        results_file = os.path.join("Modes", "Drill", "drill_results.json")
-        try:
-            with open(results_file, "w") as f:
-                json.dump({}, f)
-            print("Results cleared")
-        except Exception as e:
-            print("Failed to clear")
+    def clear_drill_results(self):
+        # Start from the end of the log so results from an earlier drill are not replayed
+        self.drill_tail.skip_to_end()
+        self.drill_data = {}
+        self.partial_data = {}
 
 
     def update_elements(self):
         super().update_elements()
-        self.title.configure(font=get_relative_font(48, self))
-        self.bubble_content.configure(font=get_relative_font(22, self))
-        self.words_button.configure(font=get_relative_font(28, self, weight="bold"))
-        self.phrases_button.configure(font=get_relative_font(28, self, weight="bold"))
-        self.score_label.configure(font=get_relative_font(22, self))
-        self.back_button.configure(font=get_relative_font(18, self))
+        restyle(self.title, font=get_relative_font(48, self))
+        restyle(self.bubble_content, font=get_relative_font(22, self))
+        restyle(self.words_button, font=get_relative_font(28, self, weight="bold"))
+        restyle(self.phrases_button, font=get_relative_font(28, self, weight="bold"))
+        restyle(self.score_label, font=get_relative_font(22, self))
+        restyle(self.back_button, font=get_relative_font(18, self))
 
         pandaA_path = os.path.join("assets", "pandaA.png")
         self.pandaA_img = load_ctk_image(pandaA_path, self, height_percentage=0.72)
@@ -4911,15 +5402,15 @@ class KorDrills(DynamicFrame):
         pandaC_path = os.path.join("assets", "pandaC.png")
         self.pandaC_img = load_ctk_image(pandaC_path, self, height_percentage=0.72)
         if self.pandaA_img:
-            self.panda_label.configure(image=self.pandaA_img)
+            restyle(self.panda_label, image=self.pandaA_img)
         elif self.pandaB_img:
-            self.panda_label.configure(image=self.pandaB_img)
+            restyle(self.panda_label, image=self.pandaB_img)
         elif self.pandaC_img:
-            self.panda_label.configure(image=self.pandaC_img)
+            restyle(self.panda_label, image=self.pandaC_img)
 
         bubble_width = max(int(self.winfo_width() * 0.28), 400)
         bubble_height = max(int(self.winfo_height() * 0.20), 150)
-        self.bubble_frame.configure(width=bubble_width, height=bubble_height)
+        restyle(self.bubble_frame, width=bubble_width, height=bubble_height)
 
 # Chinese Classes 
 class ChiModePage(DynamicFrame):
@@ -5016,16 +5507,16 @@ class ChiModePage(DynamicFrame):
 
         for btn_name, relx in positions.items():
             frame = self.frames[btn_name]
-            frame.configure(width=btn_width, height=btn_height)
+            restyle(frame, width=btn_width, height=btn_height)
             frame.place(relx=relx, rely=0.48, anchor="center")
 
             icon = load_ctk_image(os.path.join("icons", f"{btn_name}_icon.png"), self, height_percentage=0.15)
             if icon:
-                self.buttons[btn_name].configure(image=icon)
+                restyle(self.buttons[btn_name], image=icon)
                 self.buttons[btn_name].image = icon
 
             label = self.buttons[f"{btn_name}_label"]
-            label.configure(font=get_relative_font(label_font_size, self))
+            restyle(label, font=get_relative_font(label_font_size, self))
             label.place(relx=relx, rely=0.70, anchor="center")
 
         self.back_button.place(relx=0.5, rely=0.9, anchor="center")
@@ -5038,11 +5529,19 @@ class ChiTranslate(DynamicFrame):
     def __init__(self, parent):
         theme = get_current_theme()
         super().__init__(parent, theme["primary"])
-        self.translator_process = None
+        self.direction = ("tl", "zh")
         self.running = True
         self.is_listening = False
+        self.translation_tail = EventTail(TRANSLATION_LOG)
+        self.translator_state = ""
+        self.translation_data = {}
+        self.partial_data = {}
         self.create_ui_elements()
 
+        # Arriving here from a swap while listening: the worker just changes direction
+        if translator_worker["listening"]:
+            self.toggle_listening()
+
     def create_ui_elements(self):
         theme = get_current_theme()
         self.title = ctk.CTkLabel(
@@ -5167,7 +5666,7 @@ class ChiTranslate(DynamicFrame):
         root.bind("2", lambda event: self.swap_button.invoke())
         root.bind("3", lambda event: self.back_button.invoke())
 
-        self.after(250, self.check_translator_output)
+        self.every(250, self.check_translator_output)
 
     def on_back(self):
         self.running = False
@@ -5184,53 +5683,30 @@ class ChiTranslate(DynamicFrame):
 
     def toggle_listening(self):
         self.is_listening = not self.is_listening
-        status_file = os.path.join("Modes", "Translation", "status.json")
-
         if self.is_listening:
-            with open(status_file, "w") as f:
-                json.dump({"status": "LOADING"}, f)
+            translation_log.append("status", status="LOADING")
             self.start_translator()
         else:
             self.stop_translator()
-            with open(status_file, "w") as f:
-                json.dump({"status": "IDLE"}, f)
+            translation_log.append("status", status="IDLE")
 
     def start_translator(self):
-        if self.translator_process is None or self.translator_process.poll() is not None:
-            script_path = os.path.join("Modes", "Translation", "ChineseTranslator.py")
-            self.translator_process = subprocess.Popen(["python3", script_path])
+        start_translation(*self.direction)
 
     def stop_translator(self):
-        if self.translator_process and self.translator_process.poll() is None:
-            self.translator_process.terminate()
-            stop_path = os.path.join("Modes", "Translation", "stop.json")
-            with open(stop_path, "w") as f:
-                json.dump({"stop": True}, f)
+        pause_translation()
 
         # Reset visual
         self.panda_label.configure(image=self.pandaA_img)
         self.placeholder_label.configure(text="Press START to begin")
         self.panda_toggle = False
 
-        # Clear translation file
-        translation_file = os.path.join("Modes", "Translation", "translation_data.json")
+        # Clear the bubble and reset the status for anything tailing the log
         try:
-            with open(translation_file, "w") as f:
-                json.dump({
-                    "transcription": "",
-                    "translated_text": "",
-                    "romanized_text": ""
-                }, f)
+            translation_log.append("translation", transcription="", translated_text="", romanized_text="")
+            translation_log.append("status", status="IDLE")
         except Exception as e:
-            print("Error clearing translation file:", e)
-
-        # Reset status file
-        status_file = os.path.join("Modes", "Translation", "status.json")
-        try:
-            with open(status_file, "w") as f:
-                json.dump({"status": "IDLE"}, f)
-        except Exception as e:
-            print("Failed to reset status:", e)
+            print("Failed to reset translation events:", e)
 
     def set_panda(self, state):
         if state == "pandaA":
@@ -5241,59 +5717,66 @@ class ChiTranslate(DynamicFrame):
             self.panda_label.configure(image=self.pandaC_img)
 
     def check_translator_output(self):
-        status_file = os.path.join("Modes", "Translation", "status.json")
-        translation_file = os.path.join("Modes", "Translation", "translation_data.json")
-
         try:
-            if os.path.exists(status_file):
-                with open(status_file, "r") as f:
-                    data = json.load(f)
-                    state = data.get("status", "")
-
-                if state == "SPEAKING":
-                    if getattr(self, "panda_toggle", False):
-                        self.set_panda("pandaB")
-                    else:
-                        self.set_panda("pandaC")
-                    self.panda_toggle = not getattr(self, "panda_toggle", False)
+            for event in self.translation_tail.poll():
+                if event.get("type") in ACTIVITY_EVENTS:
+                    idle.activity()
+                if event.get("type") == "status":
+                    self.translator_state = event.get("status", "")
+                elif event.get("type") == "translation":
+                    self.translation_data = event
+                    self.partial_data = {}
+                elif event.get("type") == "partial":
+                    self.partial_data = event
+
+            state = self.translator_state
+            if state == "SPEAKING":
+                if getattr(self, "panda_toggle", False):
+                    self.set_panda("pandaB")
+                else:
+                    self.set_panda("pandaC")
+                self.panda_toggle = not getattr(self, "panda_toggle", False)
 
-                elif state == "IDLE":
-                    self.set_panda("pandaA")
-                    self.panda_toggle = False
+            elif state == "IDLE":
+                self.set_panda("pandaA")
+                self.panda_toggle = False
 
-                elif state == "LOADING":
-                    self.placeholder_label.configure(text="Loading Model...")
-                    self.set_panda("pandaA")
+            elif state == "LOADING":
+                self.placeholder_label.configure(text="Loading Model...")
+                self.set_panda("pandaA")
 
-                elif state == "LOADED":
-                    self.placeholder_label.configure(text="Listening speak now")
-                    self.set_panda("pandaA")
+            elif state == "LOADED":
+                self.placeholder_label.configure(text="Listening speak now")
+                self.set_panda("pandaA")
 
-            if os.path.exists(translation_file):
-                with open(translation_file, "r") as f:
-                    trans_data = json.load(f)
+            trans_data = self.translation_data
+            translated = trans_data.get("translated_text", "").strip()
+            romanized = trans_data.get("romanized_text", "").strip()
 
-                translated = trans_data.get("translated_text", "").strip()
-                romanized = trans_data.get("romanized_text", "").strip()
+            if translated or romanized:
+                display_text = f"{romanized}\n{translated}"
+                self.placeholder_label.configure(text=display_text, justify="center")
 
-                if translated or romanized:
-                    display_text = f"{romanized}\n{translated}"
-                    self.placeholder_label.configure(text=display_text, justify="center")
+            # What is being heard so far, shown until the final translation arrives
+            partial = self.partial_data
+            if partial.get("text"):
+                display_text = f"{partial['text']}…"
+                if partial.get("translated_text"):
+                    display_text += f"\n{partial['translated_text']}"
+                self.placeholder_label.configure(text=display_text, justify="center")
 
         except Exception as e:
-            print("error reading status.json", e)
-
-        self.after(250, self.check_translator_output)
+            print("error reading translation events", e)
 
     def update_elements(self):
         super().update_elements()
 
-        self.title.configure(font=get_relative_font(48, self))
-        self.tagalog_label.configure(font=get_relative_font(28, self, weight="bold"))
-        self.chinese_label.configure(font=get_relative_font(28, self, weight="bold"))
-        self.placeholder_label.configure(font=get_relative_font(22, self))
-        self.start_button.configure(font=get_relative_font(22, self))
-        self.back_button.configure(font=get_relative_font(18, self))
+        restyle(self.title, font=get_relative_font(48, self))
+        restyle(self.tagalog_label, font=get_relative_font(28, self, weight="bold"))
+        restyle(self.chinese_label, font=get_relative_font(28, self, weight="bold"))
+        restyle(self.placeholder_label, font=get_relative_font(22, self))
+        restyle(self.start_button, font=get_relative_font(22, self))
+        restyle(self.back_button, font=get_relative_font(18, self))
 
         pandaA_path = os.path.join("assets", "pandaA.png")
         pandaB_path = os.path.join("assets", "pandaB.png")
@@ -5304,30 +5787,38 @@ class ChiTranslate(DynamicFrame):
         self.pandaC_img = load_ctk_image(pandaC_path, self, height_percentage=0.72)
 
         if self.pandaA_img:
-            self.panda_label.configure(image=self.pandaA_img)
+            restyle(self.panda_label, image=self.pandaA_img)
         elif self.pandaB_img:
-            self.panda_label.configure(image=self.pandaB_img)
+            restyle(self.panda_label, image=self.pandaB_img)
         elif self.pandaC_img:
-            self.panda_label.configure(image=self.pandaC_img)
+            restyle(self.panda_label, image=self.pandaC_img)
 
         bubble_width = max(int(self.winfo_width() * 0.28), 400)
         bubble_height = max(int(self.winfo_height() * 0.20), 150)
-        self.bubble_frame.configure(width=bubble_width, height=bubble_height)
+        restyle(self.bubble_frame, width=bubble_width, height=bubble_height)
 
         swap_path = os.path.join("assets", "swap.png")
         self.swap_img = load_ctk_image(swap_path, self, height_percentage=0.06)
         if self.swap_img:
-            self.swap_button.configure(image=self.swap_img)
+            restyle(self.swap_button, image=self.swap_img)
 
 class ChiTranslateJaptoEnglish(DynamicFrame):
     def __init__(self, parent):
         theme = get_current_theme()
         super().__init__(parent, theme["primary"])
-        self.translator_process = None
+        self.direction = ("zh", "tl")
         self.running = True
         self.is_listening = False
+        self.translation_tail = EventTail(TRANSLATION_LOG)
+        self.translator_state = ""
+        self.translation_data = {}
+        self.partial_data = {}
         self.create_ui_elements()
 
+        # Arriving here from a swap while listening: the worker just changes direction
+        if translator_worker["listening"]:
+            self.toggle_listening()
+
     def create_ui_elements(self):
         theme = get_current_theme()
         self.title = ctk.CTkLabel(self, text="Translate", 
@@ -5402,7 +5893,7 @@ class ChiTranslateJaptoEnglish(DynamicFrame):
         root.bind("2", lambda event: show_frame(ChiTranslate))
         root.bind("3", lambda event: self.back_button.invoke())
 
-        self.after(250, self.check_translator_output)
+        self.every(250, self.check_translator_output)
 
     def toggle_listening(self):
         self.is_listening = not self.is_listening
@@ -5423,39 +5914,20 @@ class ChiTranslateJaptoEnglish(DynamicFrame):
         show_frame(ChiModePage)
 
     def start_translator(self):
-        if self.translator_process is None or self.translator_process.poll() is not None:
-            script_path = os.path.join("Modes", "Translation", "ChiToFilTranslator.py")
-            self.translator_process = subprocess.Popen(["python3", script_path])
+        start_translation(*self.direction)
 
     def stop_translator(self):
-        if self.translator_process and self.translator_process.poll() is None:
-            self.translator_process.terminate()
-            try:
-                self.translator_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.translator_process.kill()
-            print("Translator Process Terminated")
+        pause_translation()
 
         self.panda_label.configure(image=self.pandaA_img)
         self.panda_toggle = False
 
-        translation_file = os.path.join("Modes", "Translation", "translation_data.json")
+        # Clear the bubble and reset the status for anything tailing the log
         try:
-            with open(translation_file, "w") as f:
-                json.dump({
-                    "transcription": "",
-                    "translated_text": "",
-                    "romanized_text": ""
-                }, f)
+            translation_log.append("translation", transcription="", translated_text="", romanized_text="")
+            translation_log.append("status", status="IDLE")
         except Exception as e:
-            print("Error clearing translation file:", e)
-
-        status_file = os.path.join("Modes", "Translation", "status.json")
-        try:
-            with open(status_file, "w") as f:
-                json.dump({"status": "IDLE"}, f)
-        except Exception as e:
-            print("Failed to reset status:", e)
+            print("Failed to reset translation events:", e)
 
     def set_panda(self, state):
         if state == "pandaA":
@@ -5466,47 +5938,56 @@ class ChiTranslateJaptoEnglish(DynamicFrame):
             self.panda_label.configure(image=self.pandaC_img)
 
     def check_translator_output(self):
-        status_file = os.path.join("Modes", "Translation", "status.json")
-        translation_file = os.path.join("Modes", "Translation", "translation_data.json")
         try:
-            if os.path.exists(status_file):
-                with open(status_file, "r") as f:
-                    data = json.load(f)
-                    state = data.get("status", "")
-                    if state == "SPEAKING":
-                        if getattr(self, "panda_toggle", False):
-                            self.set_panda("pandaB")
-                        else:
-                            self.set_panda("pandaC")
-                        self.panda_toggle = not getattr(self, "panda_toggle", False)
+            for event in self.translation_tail.poll():
+                if event.get("type") in ACTIVITY_EVENTS:
+                    idle.activity()
+                if event.get("type") == "status":
+                    self.translator_state = event.get("status", "")
+                elif event.get("type") == "translation":
+                    self.translation_data = event
+                    self.partial_data = {}
+                elif event.get("type") == "partial":
+                    self.partial_data = event
+
+            state = self.translator_state
+            if state == "SPEAKING":
+                if getattr(self, "panda_toggle", False):
+                    self.set_panda("pandaB")
+                else:
+                    self.set_panda("pandaC")
+                self.panda_toggle = not getattr(self, "panda_toggle", False)
 
-                    elif state == "IDLE":
-                        self.set_panda("pandaA")
-                        self.panda_toggle = False
-                        
-            if os.path.exists(translation_file):
-                with open (translation_file, "r") as f:
-                    trans_data = json.load(f)
+            elif state == "IDLE":
+                self.set_panda("pandaA")
+                self.panda_toggle = False
 
-                translated = trans_data.get("translated_text", "").strip()
+            trans_data = self.translation_data
+            translated = trans_data.get("translated_text", "").strip()
 
-                if translated:
-                    display_text = f"{translated}"
-                    self.placeholder_label.configure(text=display_text, justify="center")
+            if translated:
+                display_text = f"{translated}"
+                self.placeholder_label.configure(text=display_text, justify="center")
 
-        except Exception as e:
-            print("error reading statsu.json", e)
+            # What is being heard so far, shown until the final translation arrives
+            partial = self.partial_data
+            if partial.get("text"):
+                display_text = f"{partial['text']}…"
+                if partial.get("translated_text"):
+                    display_text += f"\n{partial['translated_text']}"
+                self.placeholder_label.configure(text=display_text, justify="center")
 
-        self.after(250, self.check_translator_output)
+        except Exception as e:
+            print("error reading translation events", e)
 
     def update_elements(self):
         super().update_elements()
-        self.title.configure(font=get_relative_font(48, self))
-        self.chinese_label.configure(font=get_relative_font(28, self, weight="bold"))
-        self.tagalog_label.configure(font=get_relative_font(28, self, weight="bold"))
-        self.placeholder_label.configure(font=get_relative_font(22, self))
-        self.start_button.configure(font=get_relative_font(22, self))
-        self.back_button.configure(font=get_relative_font(18, self))
+        restyle(self.title, font=get_relative_font(48, self))
+        restyle(self.chinese_label, font=get_relative_font(28, self, weight="bold"))
+        restyle(self.tagalog_label, font=get_relative_font(28, self, weight="bold"))
+        restyle(self.placeholder_label, font=get_relative_font(22, self))
+        restyle(self.start_button, font=get_relative_font(22, self))
+        restyle(self.back_button, font=get_relative_font(18, self))
 
         pandaA_path = os.path.join("assets", "pandaA.png")
         self.pandaA_img = load_ctk_image(pandaA_path, self, height_percentage=0.72)
@@ -5515,20 +5996,20 @@ class ChiTranslateJaptoEnglish(DynamicFrame):
         pandaC_path = os.path.join("assets", "pandaC.png")
         self.pandaC_img = load_ctk_image(pandaC_path, self, height_percentage=0.72)
         if self.pandaA_img:
-            self.panda_label.configure(image=self.pandaA_img)
+            restyle(self.panda_label, image=self.pandaA_img)
         elif self.pandaB_img:
-            self.panda_label.configure(image=self.pandaB_img)
+            restyle(self.panda_label, image=self.pandaB_img)
         elif self.pandaC_img:
-            self.panda_label.configure(image=self.pandaC_img)
+            restyle(self.panda_label, image=self.pandaC_img)
 
         bubble_width = max(int(self.winfo_width() * 0.28), 400)
         bubble_height = max(int(self.winfo_height() * 0.20), 150)
-        self.bubble_frame.configure(width=bubble_width, height=bubble_height)
+        restyle(self.bubble_frame, width=bubble_width, height=bubble_height)
 
         swap_path = os.path.join("assets", "swap.png")
         self.swap_img = load_ctk_image(swap_path, self, height_percentage=0.06)
         if self.swap_img:
-            self.swap_button.configure(image=self.swap_img)
+            restyle(self.swap_button, image=self.swap_img)
 
 class ChiTutoring(DynamicFrame):
     def __init__(self, parent):
@@ -5653,16 +6134,16 @@ class ChiTutoring(DynamicFrame):
 
         for key, (relx, rely) in positions.items():
             frame = self.frames[key]
-            frame.configure(width=btn_width, height=btn_height)
+            restyle(frame, width=btn_width, height=btn_height)
             frame.place(relx=relx, rely=rely, anchor="center")
 
             icon = load_ctk_image(os.path.join("icons", f"{key}_icon.png"), self, height_percentage=0.08)
             if icon:
-                self.buttons[key].configure(image=icon)
+                restyle(self.buttons[key], image=icon)
                 self.buttons[key].image = icon
 
             label = self.buttons[f"{key}_label"]
-            label.configure(font=get_relative_font(label_font_size, self))
+            restyle(label, font=get_relative_font(label_font_size, self))
             
             if key in ["alphabet", "conversation"]:
                 label.place(relx=relx, rely=rely + 0.12, anchor="center")
@@ -5900,10 +6381,10 @@ class ChiColors(DynamicFrame):
 
     def update_elements(self):
         super().update_elements()
-        self.title.configure(font=get_relative_font(60, self))
-        self.front_label.configure(font=get_relative_font(52, self))
-        self.back_label.configure(font=get_relative_font(52, self))
-        self.back_button.configure(font=get_relative_font(28, self))
+        restyle(self.title, font=get_relative_font(60, self))
+        restyle(self.front_label, font=get_relative_font(52, self))
+        restyle(self.back_label, font=get_relative_font(52, self))
+        restyle(self.back_button, font=get_relative_font(28, self))
         # Redraw card after font size changes
         self.draw_card()
 
@@ -6130,10 +6611,10 @@ class ChiAnimals(DynamicFrame):
 
     def update_elements(self):
         super().update_elements()
-        self.title.configure(font=get_relative_font(60, self))
-        self.front_label.configure(font=get_relative_font(52, self))
-        self.back_label.configure(font=get_relative_font(52, self))
-        self.back_button.configure(font=get_relative_font(28, self))
+        restyle(self.title, font=get_relative_font(60, self))
+        restyle(self.front_label, font=get_relative_font(52, self))
+        restyle(self.back_label, font=get_relative_font(52, self))
+        restyle(self.back_button, font=get_relative_font(28, self))
         # Redraw card after font size changes
         self.draw_card()
 
@@ -6360,10 +6841,10 @@ class ChiNumbers(DynamicFrame):
 
     def update_elements(self):
         super().update_elements()
-        self.title.configure(font=get_relative_font(60, self))
-        self.front_label.configure(font=get_relative_font(52, self))
-        self.back_label.configure(font=get_relative_font(52, self))
-        self.back_button.configure(font=get_relative_font(28, self))
+        restyle(self.title, font=get_relative_font(60, self))
+        restyle(self.front_label, font=get_relative_font(52, self))
+        restyle(self.back_label, font=get_relative_font(52, self))
+        restyle(self.back_button, font=get_relative_font(28, self))
         # Redraw card after font size changes
         self.draw_card()
 
@@ -6591,10 +7072,10 @@ class ChiShapes(DynamicFrame):
 
     def update_elements(self):
         super().update_elements()
-        self.title.configure(font=get_relative_font(60, self))
-        self.front_label.configure(font=get_relative_font(52, self))
-        self.back_label.configure(font=get_relative_font(52, self))
-        self.back_button.configure(font=get_relative_font(28, self))
+        restyle(self.title, font=get_relative_font(60, self))
+        restyle(self.front_label, font=get_relative_font(52, self))
+        restyle(self.back_label, font=get_relative_font(52, self))
+        restyle(self.back_button, font=get_relative_font(28, self))
         # Redraw card after font size changes
         self.draw_card()
              
@@ -6819,10 +7300,10 @@ class ChiAlphabet(DynamicFrame):
 
     def update_elements(self):
         super().update_elements()
-        self.title.configure(font=get_relative_font(60, self))
-        self.front_label.configure(font=get_relative_font(52, self))
-        self.back_label.configure(font=get_relative_font(52, self))
-        self.back_button.configure(font=get_relative_font(28, self))
+        restyle(self.title, font=get_relative_font(60, self))
+        restyle(self.front_label, font=get_relative_font(52, self))
+        restyle(self.back_label, font=get_relative_font(52, self))
+        restyle(self.back_button, font=get_relative_font(28, self))
         # Redraw card after font size changes
         self.draw_card()
         
@@ -6837,9 +7318,12 @@ class ChiDrills(DynamicFrame):
         self.current_translation = ""
         self.current_romanized = ""
         self.user_input = ""
+        self.drill_tail = EventTail(DRILL_LOG)
+        self.drill_data = {}
+        self.partial_data = {}
         self.create_ui_elements()
-        self.clear_drill_json()
-        self.update_drill_results()
+        self.clear_drill_results()
+        self.every(250, self.update_drill_results)
 
     def create_ui_elements(self):
         self.title = ctk.CTkLabel(self, text="Drills", 
@@ -6916,21 +7400,21 @@ class ChiDrills(DynamicFrame):
         root.bind("3", lambda event: self.back_button.invoke())
 
     def start_word_drill(self):
-        self.clear_drill_json()
+        self.clear_drill_results()
         self.set_panda("pandaA")
         if self.drill_process is None or self.drill_process.poll() is not None:
             script_path = os.path.join("Modes", "Drill", "ChinDrill.py")
-            self.drill_process = subprocess.Popen(["python3", script_path])
+            self.drill_process = launch_script(script_path)
             self.score = 0
             self.update_score()
             self.bubble_content.configure(text="Word drill started! Listen and speak your answers.")
 
     def start_phrase_drill(self):
-        self.clear_drill_json()
+        self.clear_drill_results()
         self.set_panda("pandaA")
         if self.drill_process is None or self.drill_process.poll() is not None:
             script_path = os.path.join("Modes", "Drill", "ChinDrillPhrase.py")
-            self.drill_process = subprocess.Popen(["python3", script_path])
+            self.drill_process = launch_script(script_path)
             self.score = 0
             self.update_score()
             self.bubble_content.configure(text="Phrase drill started! Listen and speak your answers.")
@@ -6954,12 +7438,8 @@ class ChiDrills(DynamicFrame):
 
     def stop_drill(self):
         if self.drill_process and self.drill_process.poll() is None:
-            self.drill_process.terminate()
-            try:
-                self.drill_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.drill_process.kill()
-            print("[✓] Drill process terminated.")
+            stop_drill_process(self.drill_process)
+            print("[✓] Drill process stopped.")
 
         self.panda_label.configure(image=self.pandaA_img)
         self.panda_toggle = False
@@ -6978,87 +7458,97 @@ class ChiDrills(DynamicFrame):
 
     def update_drill_results(self):
         if not self.running:
-            return
+            return False
         try:
-            json_path = os.path.join("Modes", "Drill", "drill_results.json")
-            if os.path.exists(json_path):
-                with open(json_path, "r") as f:
-                    data = json.load(f)
-                    
-                    if "current_word" in data:
-                        self.current_word = data["current_word"]
-                    
-                    if "user_input" in data:
-                        self.user_input = data["user_input"]
-                        # Show current question and user's answer in bubble
-                        display_text = f"Filipino: {self.current_word}\n\nYour answer: {self.user_input}"
-                        self.bubble_content.configure(text=display_text)
-            
-                    if "status" in data:
-                        if data["status"] == "QUESTION":
-                           self.bubble_content.configure(
-                               text=f"Filipino: {data['current_word']}"
-                           )
+            for event in self.drill_tail.poll():
+                if event.get("type") in ACTIVITY_EVENTS:
+                    idle.activity()
+                if event.get("type") == "partial":
+                    self.partial_data = event
+                elif event.get("type") == "drill":
+                    self.drill_data = event
+                    self.partial_data = {}
+            data = self.drill_data
+            if data:
+                if "current_word" in data:
+                    self.current_word = data["current_word"]
+                
+                if "user_input" in data:
+                    self.user_input = data["user_input"]
+                    # Show current question and user's answer in bubble
+                    display_text = f"Filipino: {self.current_word}\n\nYour answer: {self.user_input}"
+                    self.bubble_content.configure(text=display_text)
+        
+                if "status" in data:
+                    if data["status"] == "QUESTION":
+                       self.bubble_content.configure(
+                           text=f"Filipino: {data['current_word']}"
+                       )
+                       # The results are polled every 250 ms; the panda keeps its own slower pace
+                       if time.monotonic() - getattr(self, "panda_flipped_at", 0.0) >= DRILL_PANDA_FLIP:
                            if getattr(self, "panda_toggle", False):
                                self.set_panda("pandaB")
                            else:
                                self.set_panda("pandaC")
                            self.panda_toggle = not getattr(self, "panda_toggle", False)
-                        elif data["status"] == "ANSWER":
-                            self.bubble_content.configure(
-                                text=f"Your answer: {data['user_input']} ({data['user_romanized']})"
-                            )
-                            self.set_panda("pandaA")
-                            self.panda_toggle = False
-                        elif data["status"] == "RESULT":
-                            if data["is_correct"]:
-                                result_text = (f"Correct!\n\n"
-                                               f"Filipino: {data['current_word']}\n"
-                                               f"Your answer: {data['user_input']} ({data['user_romanized']})\n\n"
-                                               f"Chinese: {data['translation']} ({data['romanized']})")
-                            else:
-                                result_text = (f"Incorrect\n\n"
-                                               f"Filipino: {data['current_word']}\n"
-                                               f"Your answer: {data['user_input']} ({data['user_romanized']})\n\n"
-                                               f"Correct answer:\nChinese: {data['translation']} ({data['romanized']})")
-                            self.bubble_content.configure(text=result_text)
-                            self.set_panda("pandaA")
-                            self.panda_toggle = False
-                        elif data["status"] == "COMPLETE":
-                            final_text = f"Drill Complete!"
-                            if data['final_score'] >= 4:
-                                final_text += "\n\nExcellent work!"
-                            elif data['final_score'] >= 3:
-                                final_text += "\n\nGood Job! Keep Practicing!"
-                            else:
-                                final_text += "\n\nKeep studying! You'll improve!"
-                            self.bubble_content.configure(text=final_text)
-                            self.set_panda("pandaA")
-                            self.panda_toggle = False
-                        
+                           self.panda_flipped_at = time.monotonic()
+                    elif data["status"] == "ANSWER":
+                        self.bubble_content.configure(
+                            text=f"Your answer: {data['user_input']} ({data['user_romanized']})"
+                        )
+                        self.set_panda("pandaA")
+                        self.panda_toggle = False
+                    elif data["status"] == "RESULT":
+                        if data["is_correct"]:
+                            result_text = (f"Correct!\n\n"
+                                           f"Filipino: {data['current_word']}\n"
+                                           f"Your answer: {data['user_input']} ({data['user_romanized']})\n\n"
+                                           f"Chinese: {data['translation']} ({data['romanized']})")
+                        else:
+                            result_text = (f"Incorrect\n\n"
+                                           f"Filipino: {data['current_word']}\n"
+                                           f"Your answer: {data['user_input']} ({data['user_romanized']})\n\n"
+                                           f"Correct answer:\nChinese: {data['translation']} ({data['romanized']})")
+                            if data.get("alignment"):
+                                result_text += f"\nCheck: {format_alignment(data['alignment'])}"
+                        self.bubble_content.configure(text=result_text)
+                        self.set_panda("pandaA")
+                        self.panda_toggle = False
+                    elif data["status"] == "COMPLETE":
+                        final_text = f"Drill Complete!"
+                        if data['final_score'] >= 4:
+                            final_text += "\n\nExcellent work!"
+                        elif data['final_score'] >= 3:
+                            final_text += "\n\nGood Job! Keep Practicing!"
+                        else:
+                            final_text += "\n\nKeep studying! You'll improve!"
+                        self.bubble_content.configure(text=final_text)
+                        self.set_panda("pandaA")
+                        self.panda_toggle = False
+                    
+            # The answer as it is being spoken, until the graded one arrives
+            if self.partial_data.get("text"):
+                self.bubble_content.configure(
+                    text=f"Filipino: {self.current_word}\n\nYour answer: {self.partial_data['text']}…"
+                )
+
         except Exception as e:
             print(f"[!] Failed to update drill results: {e}")
-        
-        if self.running:
-            self.after(1000, self.update_drill_results)
 
-    def clear_drill_json(self):
-        results_file = os.path.join("Modes", "Drill", "drill_results.json")
-        try:
-            with open(results_file, "w") as f:
-                json.dump({}, f)
-            print("Results cleared")
-        except Exception as e:
-            print("Failed to clear")
+    def clear_drill_results(self):
+        # Start from the end of the log so results from an earlier drill are not replayed
+        self.drill_tail.skip_to_end()
+        self.drill_data = {}
+        self.partial_data = {}
 
     def update_elements(self):
         super().update_elements()
-        self.title.configure(font=get_relative_font(48, self))
-        self.bubble_content.configure(font=get_relative_font(22, self))
-        self.words_button.configure(font=get_relative_font(28, self, weight="bold"))
-        self.phrases_button.configure(font=get_relative_font(28, self, weight="bold"))
-        self.score_label.configure(font=get_relative_font(22, self))
-        self.back_button.configure(font=get_relative_font(18, self))
+        restyle(self.title, font=get_relative_font(48, self))
+        restyle(self.bubble_content, font=get_relative_font(22, self))
+        restyle(self.words_button, font=get_relative_font(28, self, weight="bold"))
+        restyle(self.phrases_button, font=get_relative_font(28, self, weight="bold"))
+        restyle(self.score_label, font=get_relative_font(22, self))
+        restyle(self.back_button, font=get_relative_font(18, self))
 
         pandaA_path = os.path.join("assets", "pandaA.png")
         self.pandaA_img = load_ctk_image(pandaA_path, self, height_percentage=0.72)
@@ -7067,15 +7557,15 @@ class ChiDrills(DynamicFrame):
         pandaC_path = os.path.join("assets", "pandaC.png")
         self.pandaC_img = load_ctk_image(pandaC_path, self, height_percentage=0.72)
         if self.pandaA_img:
-            self.panda_label.configure(image=self.pandaA_img)
+            restyle(self.panda_label, image=self.pandaA_img)
         elif self.pandaB_img:
-            self.panda_label.configure(image=self.pandaB_img)
+            restyle(self.panda_label, image=self.pandaB_img)
         elif self.pandaC_img:
-            self.panda_label.configure(image=self.pandaC_img)
+            restyle(self.panda_label, image=self.pandaC_img)
 
         bubble_width = max(int(self.winfo_width() * 0.28), 400)
         bubble_height = max(int(self.winfo_height() * 0.20), 150)
-        self.bubble_frame.configure(width=bubble_width, height=bubble_height)
+        restyle(self.bubble_frame, width=bubble_width, height=bubble_height)
 
 
 CONVERSATION_DATA = {
@@ -7828,17 +8318,17 @@ class JapConversation(DynamicFrame):
     def update_elements(self):
         super().update_elements()
         theme = get_current_theme()
-        self.title.configure(font=get_relative_font(120, self), fg_color=theme["primary"])
+        restyle(self.title, font=get_relative_font(120, self), fg_color=theme["primary"])
         # update conv_frame/conv_text colors and font
-        self.conv_frame.configure(fg_color=theme["primary"], border_color="black")
-        self.conv_text.configure(font=get_relative_font(28, self), fg_color=theme["primary"], text_color="white")
+        restyle(self.conv_frame, fg_color=theme["primary"], border_color="black")
+        restyle(self.conv_text, font=get_relative_font(28, self), fg_color=theme["primary"], text_color="white")
         try:
-            self.large_feedback.configure(font=get_relative_font(48, self))
+            restyle(self.large_feedback, font=get_relative_font(48, self))
         except Exception:
             pass
         for rb in self.radio_buttons:
-            rb.configure(font=get_relative_font(20, self))
-        self.back_button.configure(font=get_relative_font(18, self))
+            restyle(rb, font=get_relative_font(20, self))
+        restyle(self.back_button, font=get_relative_font(18, self))
 
 class KorConversation(DynamicFrame):
     def __init__(self, parent):
@@ -8078,15 +8568,15 @@ class KorConversation(DynamicFrame):
         super().update_elements()
         theme = get_current_theme()
         # Keep title large and apply theme to conv box and text
-        self.title.configure(font=get_relative_font(120, self), fg_color=theme["primary"])
+        restyle(self.title, font=get_relative_font(120, self), fg_color=theme["primary"])
         try:
-            self.conv_frame.configure(fg_color=theme["primary"], border_color="black")
-            self.conv_text.configure(font=get_relative_font(28, self), fg_color=theme["primary"], text_color="white")
+            restyle(self.conv_frame, fg_color=theme["primary"], border_color="black")
+            restyle(self.conv_text, font=get_relative_font(28, self), fg_color=theme["primary"], text_color="white")
             for rb in self.radio_buttons:
-                rb.configure(font=get_relative_font(20, self))
+                restyle(rb, font=get_relative_font(20, self))
         except Exception:
             pass
-        self.back_button.configure(font=get_relative_font(18, self))
+        restyle(self.back_button, font=get_relative_font(18, self))
 
 class ChiConversation(DynamicFrame):
     def __init__(self, parent):
@@ -8326,15 +8816,15 @@ class ChiConversation(DynamicFrame):
         super().update_elements()
         theme = get_current_theme()
         # Keep title large and apply theme to conv box and text
-        self.title.configure(font=get_relative_font(120, self), fg_color=theme["primary"])
+        restyle(self.title, font=get_relative_font(120, self), fg_color=theme["primary"])
         try:
-            self.conv_frame.configure(fg_color=theme["primary"], border_color="black")
-            self.conv_text.configure(font=get_relative_font(28, self), fg_color=theme["primary"], text_color="white")
+            restyle(self.conv_frame, fg_color=theme["primary"], border_color="black")
+            restyle(self.conv_text, font=get_relative_font(28, self), fg_color=theme["primary"], text_color="white")
             for rb in self.radio_buttons:
-                rb.configure(font=get_relative_font(20, self))
+                restyle(rb, font=get_relative_font(20, self))
         except Exception:
             pass
-        self.back_button.configure(font=get_relative_font(18, self))
+        restyle(self.back_button, font=get_relative_font(18, self))
 
 # Start the application
 if __name__ == "__main__":
@@ -8427,18 +8917,15 @@ if __name__ == "__main__":
             except Exception:
                 pass
 
+    install_ui_watchdog(root, timers)  # UI_WATCHDOG=1 reports callbacks that block the main loop
+    load_theme()  # Before the first page, so it is built once in the saved theme
+    idle.install(root)
+    start_model_host()
     show_frame(MainPage)
-    
-    # Load saved theme if it exists
-    try:
-        with open("theme_settings.json", "r") as f:
-            theme_data = json.load(f)
-            saved_theme = theme_data.get("theme", "Blue")
-            if saved_theme in COLOR_THEMES:
-                set_theme(saved_theme)
-                # Refresh the current frame with new theme
-                show_frame(MainPage)
-    except Exception as e:
-        print(f"No saved theme found or error loading theme: {e}")
+
+    root.bind("<F12>", toggle_timing_overlay)
+    root.protocol("WM_DELETE_WINDOW", close_app)
+    if os.environ.get("DEBUG_OVERLAY") == "1":
+        toggle_timing_overlay()
     
     root.mainloop()
\ No newline at end of file
@@ -8,6 +8,7 @@ import sounddevice as sd
 import numpy as np
 import wave
 import os
+import sys
 import json
 import tempfile
 import unicodedata
@@ -16,7 +17,6 @@ import subprocess
 import re
 import random
 import platform
-from difflib import SequenceMatcher
 from gtts import gTTS
 import io
 import getpass
@@ -24,11 +24,25 @@ from pydub import AudioSegment
 import argostranslate.package
 import argostranslate.translate
 import time
+import threading
 import noisereduce as nr
 import pyttsx3
 import soundfile as sf
 from googletrans import Translator
 from pypinyin import lazy_pinyin
+from grading import AnswerKey
+from drill_history import DrillHistory, read_source
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from translation_router import TranslationRouter
+from offline_translation import offline_translate
+from event_log import EventLog, DRILL_LOG
+from model_manager import models, preferred_variant, disk_size_mb
+from warmup import warm_translation
+from stop_signal import StopSignal, Cancelled, watch_for_stop
+from streaming_asr import record_streaming, DRILL_PREVIEW
+from timing import Timings
+from content_store import ContentStore
 
 # ===============================
 # CONFIGURATION
@@ -37,14 +51,21 @@ from pypinyin import lazy_pinyin
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 USER =  getpass.getuser()
 WHISPER_BIN = os.path.join("/", "home", USER, "whisper.cpp", "build", "bin", "whisper-cli")
-MODEL_PATH = os.path.join("/", "home", USER, "whisper.cpp", "models", "ggml-base.bin")
+# Uses ggml-base-q8_0.bin instead when the quantized model has been downloaded
+MODEL_PATH = preferred_variant(os.path.join("/", "home", USER, "whisper.cpp", "models", "ggml-base.bin"))
 
 SOURCE_LANG = "tl"
-OUTPUT_PATH = os.path.join(BASE_DIR, "..", "Drill", "drill_results.json")
+drill_log = EventLog(DRILL_LOG)
+timings = Timings("drill", drill_log)
 
 translator = Translator()
 engine = pyttsx3.init()
 
+# Recording, whisper-cli and TTS go through this so the GUI's stop interrupts them mid-stream
+stop_signal = StopSignal()
+stop_signal.on_stop(engine.stop)
+
+@timings.timed("check_internet")
 def check_internet():
     try:
         requests.get("https://www.google.com", timeout=3)
@@ -55,32 +76,34 @@ def check_internet():
 def normalize_text(text):
     return unicodedata.normalize("NFKC", text.strip().lower())
 
+@timings.timed("argos")
 def argos_translate_chain(text):
     try:
-        installed_languages = argostranslate.translate.get_installed_languages()
-
-        tl = next((lang for lang in installed_languages if lang.code == "tl"), None)
-        en = next((lang for lang in installed_languages if lang.code == "en"), None)
-        zh = next((lang for lang in installed_languages if lang.code == "zh"), None)
+        # Uses a direct tl->zh model when one is installed, otherwise pivots through English
+        return offline_translate(text, "tl", "zh")
+    except Exception as e:
+        return f"Argos chain failed: {e}"
 
-        tl_en = tl.get_translation(en)
-        text_en = tl_en.translate(text)
+@timings.timed("google")
+def google_translate(text, target_lang):
+    translated = translator.translate(text, dest=target_lang)
+    return translated.text.strip()
 
-        en_zh = en.get_translation(zh)
-        text_zh = en_zh.translate(text_en)
+# Google and Argos race each other instead of Argos only running after Google fails
+router = TranslationRouter([
+    ("google", google_translate),
+    ("argos", lambda text, target_lang: argos_translate_chain(text)),
+])
 
-        return text_zh.strip()
-    except Exception as e:
-        return f"Argos chain failed: {e}"
+# Translations and prompt audio built ahead of time by precompile_content.py
+content = ContentStore()
 
+@timings.timed("translate")
 def translate_text(text, target_lang):
-    if check_internet():
-        try:
-            translated = translator.translate(text, dest=target_lang)
-            return translated.text.strip()
-        except Exception as e:
-            print(f"⚠️ Google Translate error: {e} — using ArgosTranslate.")
-    return argos_translate_chain(text)
+    cached = content.get(text, SOURCE_LANG, target_lang)
+    if cached and cached["translation"]:
+        return cached["translation"]
+    return router.translate(text, target_lang)
 
 def preprocess_text(text: str) -> str:
     if text and not text.endswith(("。", "！", "？")):
@@ -90,7 +113,13 @@ def preprocess_text(text: str) -> str:
 def romanize_chinese(text):
     return " ".join(lazy_pinyin(text))
 
+@timings.timed("tts")
 def speak_text(text, lang, use_gtts=False):
+    cached = content.get(text, lang, lang)
+    if cached and cached["audio"]:
+        print(f"🔈 Speaking Filipino: {text}")
+        stop_signal.play_file(cached["audio"])
+        return
     if not check_internet():
         print("Offline mode playback skipped")
         return
@@ -104,8 +133,9 @@ def speak_text(text, lang, use_gtts=False):
         audio = AudioSegment.from_file(audio_bytes, format="mp3")
         audio = audio.set_frame_rate(16000).set_channels(1)
         samples = np.array(audio.get_array_of_samples(), dtype=np.int16)
-        sd.play(samples, samplerate=16000)
-        sd.wait()
+        stop_signal.play(samples, 16000)
+    except Cancelled:
+        raise
     except Exception as e:
         print("")
 
@@ -118,16 +148,20 @@ def whisper_stt(audio_data):
         data, sr = sf.read(tmp_wav.name, dtype="float32")
 
         # Apply noise reduction
-        reduced = nr.reduce_noise(y=data, sr=sr)
+        with timings.span("denoise"):
+            reduced = nr.reduce_noise(y=data, sr=sr)
 
         # Overwrite with denoised version
         sf.write(tmp_wav.name, reduced, sr)
 
         # Run Whisper
-        result = subprocess.run(
-            [WHISPER_BIN, "-m", MODEL_PATH, "-l", "zh", "--no-timestamps", "-f", tmp_wav.name],
-            capture_output=True, text=True
-        )
+        # whisper-cli loads the model in its own process; make room for it first
+        models.make_room(disk_size_mb(MODEL_PATH))
+        with timings.span("whisper"):
+            result = stop_signal.run(
+                [WHISPER_BIN, "-m", MODEL_PATH, "-l", "zh", "--no-timestamps", "-f", tmp_wav.name],
+                capture_output=True, text=True
+            )
 
         raw_output = result.stdout.strip()
         cleaned = re.sub(r"\[\d+:\d+\.\d+ --> \d+:\d+\.\d+\]", "", raw_output)
@@ -135,37 +169,40 @@ def whisper_stt(audio_data):
 
     return transcription
 
+@timings.timed("record")
 def record_audio():
     print("Recording... Speak clearly.")
-    audio = sd.rec(int(5 * 16000), samplerate=16000, channels=1, dtype=np.int16)
-    sd.wait()
-    return audio
+    # The bubble shows what is being heard while the answer is spoken; grading still uses whisper
+    return record_streaming(stop_signal, 5, 16000, "zh", show_partial if DRILL_PREVIEW else None)
 
-def is_close(a, b, threshold=0.8):
-    return SequenceMatcher(None, normalize_text(a), normalize_text(b)).ratio() >= threshold
+def show_partial(text):
+    drill_log.append("partial", text=text)
 
 def save_drill_results(data):
-    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    drill_log.append("drill", **data)
 
 def run_drill():
     filename = os.path.join(BASE_DIR, "randphrase.txt")
 
+    history = DrillHistory()
     try:
-        with open(filename, "r", encoding="utf-8") as f:
-            lines = list(set(f.read().splitlines()))
-            if len(lines) < 5:
-                print("[!] Not enough phrases in the file.")
-                return
-            selected_phrases = random.sample(lines, 5)
+        history.sync_source("zh", "phrase", filename)
     except FileNotFoundError:
         print("[!] randphrase.txt not found.")
         return
 
+    accepted = read_source(filename, "zh")
+    selected_phrases = history.pick_items("zh", "phrase", 5)
+    if len(selected_phrases) < 5:
+        print("[!] Not enough phrases in the file.")
+        return
+
     score = 0
     all_results = []
 
     for i, chosen_text in enumerate(selected_phrases, start=1):
+        # Extra "zh=..." fields on the prompt's line are additional accepted answers
+        accepted_answers = accepted.get(chosen_text, [])
         save_drill_results({
             "status": "QUESTION",
             "current_word": chosen_text
@@ -185,7 +222,11 @@ def run_drill():
 
         chinese_text = translate_text(chosen_text, "zh-CN")
         romanized = romanize_chinese(chinese_text)
-        is_correct = is_close(romanize_chinese(user_translation), romanize_chinese(chinese_text), threshold=0.8)
+        answer_key = AnswerKey([romanized] + [romanize_chinese(answer) for answer in accepted_answers], "zh", threshold=0.8)
+        with timings.span("grade"):
+            grade = answer_key.grade(user_romanized)
+        is_correct = grade["is_correct"]
+        history.record_answer("zh", "phrase", chosen_text, user_translation, user_romanized, romanized, grade["score"], is_correct)
 
         save_drill_results({
             "status": "RESULT",
@@ -194,7 +235,8 @@ def run_drill():
             "user_romanized": user_romanized,
             "translation": chinese_text,
             "romanized": romanized,
-            "is_correct": is_correct
+            "is_correct": is_correct,
+            "alignment": grade["alignment"]
         })
 
         if is_correct:
@@ -219,7 +261,17 @@ def run_drill():
         "final_score": score
     }
     save_drill_results(final_data)
+    history.close()
     print(f"\nDrill complete! Your score: {score}/5")
 
 if __name__ == "__main__":
-    run_drill()
+    # Load the offline fallback model while the first prompt is being shown
+    threading.Thread(target=warm_translation, args=("tl", "zh"), daemon=True).start()
+    # The GUI's stop arrives as a control event (or SIGTERM); answers so far are already saved
+    stop_signal.install_signal_handlers()
+    watch_for_stop(DRILL_LOG, stop_signal)
+    try:
+        run_drill()
+    except (Cancelled, SystemExit):
+        print("Drill stopped.")
+        drill_log.append("control_ack", command="stop")
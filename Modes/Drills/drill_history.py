@@ -0,0 +1,215 @@
+import os
+import random
+import sqlite3
+import time
+
+# ===============================
+# CONFIGURATION
+# ===============================
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+HISTORY_PATH = os.path.join(BASE_DIR, "drill_history.db")
+
+DAY = 24 * 60 * 60
+RELEARN_DELAY = 10 * 60  # Missed items come back after ten minutes
+MIN_EASE = 1.3
+NEW_PER_DRILL = 3        # Unseen items introduced per drill while others are due
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    lang TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    prompt TEXT NOT NULL,
+    due_at REAL NOT NULL DEFAULT 0,
+    interval REAL NOT NULL DEFAULT 0,
+    ease REAL NOT NULL DEFAULT 2.5,
+    reps INTEGER NOT NULL DEFAULT 0,
+    lapses INTEGER NOT NULL DEFAULT 0,
+    UNIQUE (lang, kind, prompt)
+);
+CREATE INDEX IF NOT EXISTS items_due ON items (lang, kind, due_at, ease);
+
+CREATE TABLE IF NOT EXISTS answers (
+    id INTEGER PRIMARY KEY,
+    item_id INTEGER NOT NULL REFERENCES items (id),
+    answered_at REAL NOT NULL,
+    user_input TEXT,
+    user_romanized TEXT,
+    expected TEXT,
+    score REAL,
+    is_correct INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS answers_item ON answers (item_id, answered_at);
+
+CREATE TABLE IF NOT EXISTS sources (
+    path TEXT PRIMARY KEY,
+    mtime REAL NOT NULL
+);
+"""
+
+
+def prompt_of(line):
+    """The prompt on a word/phrase list line; extra "|"-separated fields are accepted answers."""
+    return line.split("|")[0].strip()
+
+
+def read_source(filename, lang=None):
+    """Map each prompt of a word/phrase list, in file order, to its accepted answers in lang.
+
+    The lists are shared by every language's drill, so each extra answer
+    names its language, e.g. "isa|ja=ichi|ko=hana|zh=yi"; only the fields
+    for lang are returned.
+    """
+    entries = {}
+    with open(filename, "r", encoding="utf-8") as f:
+        for line in f.read().splitlines():
+            prompt = prompt_of(line)
+            if not prompt:
+                continue
+            answers = entries.setdefault(prompt, [])
+            for field in line.split("|")[1:]:
+                field_lang, _, answer = field.partition("=")
+                if not answer.strip():
+                    print(f"[!] Ignoring answer {field.strip()!r} for {prompt!r}: give it as lang=answer")
+                elif field_lang.strip() == lang:
+                    answers.append(answer.strip())
+    return entries
+
+
+class DrillHistory:
+    """Learner history for the drills, with SM-2 style spaced-repetition scheduling."""
+
+    def __init__(self, path=HISTORY_PATH):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def sync_source(self, lang, kind, filename):
+        """Mirror a word/phrase list: add new prompts, drop removed ones; skipped if the file has not changed.
+
+        Items are keyed by prompt alone, so editing the accepted answers on a
+        line keeps the item and its history.
+        """
+        mtime = os.path.getmtime(filename)
+        row = self.conn.execute("SELECT mtime FROM sources WHERE path = ?", (filename,)).fetchone()
+        if row and row[0] == mtime:
+            return
+
+        prompts = list(read_source(filename))
+
+        # Shuffle so brand new items are not always introduced in file order
+        random.shuffle(prompts)
+        with self.conn:
+            self.rekey_full_lines(lang, kind)
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO items (lang, kind, prompt) VALUES (?, ?, ?)",
+                [(lang, kind, prompt) for prompt in prompts]
+            )
+            kept = set(prompts)
+            removed = [(item_id,) for item_id, prompt in self.conn.execute(
+                "SELECT id, prompt FROM items WHERE lang = ? AND kind = ?", (lang, kind)
+            ) if prompt not in kept]
+            self.conn.executemany("DELETE FROM answers WHERE item_id = ?", removed)
+            self.conn.executemany("DELETE FROM items WHERE id = ?", removed)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sources (path, mtime) VALUES (?, ?)",
+                (filename, mtime)
+            )
+
+    def rekey_full_lines(self, lang, kind):
+        """Move items once keyed by their whole line (answers included) to their prompt."""
+        rows = self.conn.execute(
+            "SELECT id, prompt FROM items WHERE lang = ? AND kind = ? AND prompt LIKE '%|%'", (lang, kind)
+        ).fetchall()
+        for item_id, line in rows:
+            existing = self.conn.execute(
+                "SELECT id FROM items WHERE lang = ? AND kind = ? AND prompt = ?", (lang, kind, prompt_of(line))
+            ).fetchone()
+            if existing is None:
+                self.conn.execute("UPDATE items SET prompt = ? WHERE id = ?", (prompt_of(line), item_id))
+            else:
+                # Both spellings exist: keep the prompt's item and its schedule, with both histories
+                self.conn.execute("UPDATE answers SET item_id = ? WHERE item_id = ?", (existing[0], item_id))
+                self.conn.execute("DELETE FROM items WHERE id = ?", (item_id,))
+
+    def pick_items(self, lang, kind, count):
+        """Return count prompts: due reviews most overdue first, then up to NEW_PER_DRILL unseen items.
+
+        Any places left go to the items due soonest (e.g. ones just missed),
+        then to more unseen items. Unseen items have due_at = 0; every
+        answered item has been rescheduled to a real time. Every query reads
+        the items_due index in its own order, so a pick never sorts rows.
+        """
+        now = time.time()
+        picked = []
+
+        def take(where, order, limit, *args):
+            if limit <= 0:
+                return
+            rows = self.conn.execute(
+                f"SELECT prompt FROM items WHERE lang = ? AND kind = ? AND {where} ORDER BY {order} LIMIT ?",
+                (lang, kind, *args, limit + len(picked))
+            ).fetchall()
+            for (prompt,) in rows:
+                if prompt not in picked and len(picked) < count:
+                    picked.append(prompt)
+
+        take("due_at > 0 AND due_at <= ?", "due_at, ease", count, now)
+        # Unseen items all have the starting ease, so this is file (id) order straight from the index
+        take("due_at = 0", "ease, id", min(NEW_PER_DRILL, count - len(picked)))
+        take("due_at > ?", "due_at, ease", count - len(picked), now)
+        take("due_at = 0", "ease, id", count - len(picked))
+        return picked
+
+    def record_answer(self, lang, kind, prompt, user_input, user_romanized, expected, score, is_correct):
+        """Store one graded answer and reschedule its item."""
+        now = time.time()
+        prompt = prompt_of(prompt)
+        row = self.conn.execute(
+            "SELECT id, interval, ease, reps, lapses FROM items WHERE lang = ? AND kind = ? AND prompt = ?",
+            (lang, kind, prompt)
+        ).fetchone()
+        if row is None:
+            with self.conn:
+                cursor = self.conn.execute(
+                    "INSERT INTO items (lang, kind, prompt) VALUES (?, ?, ?)",
+                    (lang, kind, prompt)
+                )
+            row = (cursor.lastrowid, 0, 2.5, 0, 0)
+
+        item_id, interval, ease, reps, lapses = row
+        interval, ease, reps, lapses = schedule(interval, ease, reps, lapses, score, is_correct)
+        due_at = now + (interval * DAY if is_correct else RELEARN_DELAY)
+
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO answers (item_id, answered_at, user_input, user_romanized, expected, score, is_correct) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (item_id, now, user_input, user_romanized, expected, score, int(bool(is_correct)))
+            )
+            self.conn.execute(
+                "UPDATE items SET due_at = ?, interval = ?, ease = ?, reps = ?, lapses = ? WHERE id = ?",
+                (due_at, interval, ease, reps, lapses, item_id)
+            )
+
+
+def schedule(interval, ease, reps, lapses, score, is_correct):
+    """SM-2 update: returns the new (interval in days, ease, reps, lapses)."""
+    if not is_correct:
+        return 0, max(MIN_EASE, ease - 0.2), 0, lapses + 1
+
+    # Map the 0..1 grading score onto SM-2's 3..5 passing qualities
+    quality = 3 + 2 * max(0.0, min(1.0, score))
+    ease = max(MIN_EASE, ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    if reps == 0:
+        interval = 1
+    elif reps == 1:
+        interval = 6
+    else:
+        interval = interval * ease
+    return interval, ease, reps + 1, lapses
@@ -0,0 +1,254 @@
+import re
+import unicodedata
+
+# ===============================
+# PHONETIC KEYS
+# ===============================
+
+# Long vowels written out by the romanizers ("dou", "oo") or with macrons
+# ("Dōmo") should all grade the same as the short spelling ("domo").
+JA_LONG_VOWELS = [
+    ("ou", "o"),
+    ("oo", "o"),
+    ("uu", "u"),
+    ("aa", "a"),
+    ("ii", "i"),
+    ("ee", "e"),
+]
+
+SYLLABLE_PATTERN = re.compile(r"[^aeiou\s]*[aeiou]+(?:(?:ng|[nmlkp]|t(?!s))(?![aeiouy]))?|[^aeiou\s]+")
+
+
+def strip_marks(text):
+    """Lowercase, NFKC-normalize and drop diacritics such as macrons and tone marks."""
+    text = unicodedata.normalize("NFKC", text.strip().lower())
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def phonetic_syllables(text, lang):
+    """Split a romanized answer into the syllables shown to the learner."""
+    text = strip_marks(text)
+    text = text.replace("ü", "u").replace("v", "u") if lang == "zh" else text
+    text = re.sub(r"[0-9]", "", text) if lang == "zh" else text
+    text = re.sub(r"[^a-z\s]", " ", text)
+
+    syllables = []
+    for word in text.split():
+        if lang == "zh":
+            syllables.append(word)
+        else:
+            syllables.extend(SYLLABLE_PATTERN.findall(word))
+    return syllables
+
+
+def fold_syllable(syllable, lang):
+    """Fold one syllable into the spelling it grades as (Japanese long vowels become short)."""
+    if lang == "ja":
+        for long_vowel, short_vowel in JA_LONG_VOWELS:
+            syllable = syllable.replace(long_vowel, short_vowel)
+    return syllable
+
+
+def phonetic_key(text, lang):
+    """Collapse a romanized answer into the spacing-free key used for grading."""
+    return "".join(fold_syllable(syllable, lang) for syllable in phonetic_syllables(text, lang))
+
+
+# ===============================
+# EDIT DISTANCE
+# ===============================
+
+def edit_distance(a, b, max_distance=None):
+    """Levenshtein distance using Myers' bit-parallel algorithm.
+
+    When max_distance is given, max_distance + 1 is returned as soon as the
+    distance is known to exceed it: up front when the lengths alone differ by
+    more, or mid-scan once the remaining characters could no longer bring the
+    score back within it.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if max_distance is not None and len(a) - len(b) > max_distance:
+        return max_distance + 1
+    if not b:
+        return len(a)
+
+    # Pattern is the shorter string, so it fits in as few machine words as possible
+    pattern, text = b, a
+    m = len(pattern)
+    mask = (1 << m) - 1
+    high_bit = 1 << (m - 1)
+
+    peq = {}
+    for i, ch in enumerate(pattern):
+        peq[ch] = peq.get(ch, 0) | (1 << i)
+
+    pv = mask
+    mv = 0
+    score = m
+    remaining = len(text)
+    for ch in text:
+        eq = peq.get(ch, 0)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) & mask) ^ pv) | eq
+        ph = (mv | ~(xh | pv)) & mask
+        mh = pv & xh
+        if ph & high_bit:
+            score += 1
+        elif mh & high_bit:
+            score -= 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv
+        # score is the distance to the text so far; each further character lowers it by at most 1
+        remaining -= 1
+        if max_distance is not None and score - remaining > max_distance:
+            return max_distance + 1
+    return score
+
+
+def similarity(a, b, max_distance=None):
+    longest = max(len(a), len(b))
+    if longest == 0:
+        return 1.0
+    return 1.0 - min(edit_distance(a, b, max_distance), longest) / longest
+
+
+# ===============================
+# ALIGNMENT
+# ===============================
+
+def align_syllables(expected, heard, lang):
+    """Align two syllable lists and mark which expected syllables were said correctly.
+
+    The comparison runs over the letters of the folded syllables, so spellings
+    and spacing that grade the same ("arigatou" for "arigato", "nihao" for
+    "ni hao") are not marked as mistakes. Returns a list of
+    {"expected", "heard", "ok"} entries in speaking order: one per expected
+    syllable, holding the folded letters heard for it, plus entries with an
+    empty "expected" for letters heard between syllables.
+    """
+    # Each expected letter remembers which syllable it came from
+    letters = [(ch, index) for index, syllable in enumerate(expected) for ch in fold_syllable(syllable, lang)]
+    said = "".join(fold_syllable(syllable, lang) for syllable in heard)
+
+    rows, cols = len(letters), len(said)
+    cost = [[0] * (cols + 1) for _ in range(rows + 1)]
+    for i in range(1, rows + 1):
+        cost[i][0] = i
+    for j in range(1, cols + 1):
+        cost[0][j] = j
+
+    for i in range(1, rows + 1):
+        for j in range(1, cols + 1):
+            substitution = 0 if letters[i - 1][0] == said[j - 1] else 1
+            cost[i][j] = min(
+                cost[i - 1][j - 1] + substitution,
+                cost[i - 1][j] + 1,
+                cost[i][j - 1] + 1,
+            )
+
+    # (expected letter, heard letter) pairs; None on the side that has no letter
+    pairs = []
+    i, j = rows, cols
+    while i > 0 or j > 0:
+        if i > 0 and j > 0 and cost[i][j] == cost[i - 1][j - 1] + (0 if letters[i - 1][0] == said[j - 1] else 1):
+            pairs.append((i - 1, j - 1))
+            i -= 1
+            j -= 1
+        elif i > 0 and cost[i][j] == cost[i - 1][j] + 1:
+            pairs.append((i - 1, None))
+            i -= 1
+        else:
+            pairs.append((None, j - 1))
+            j -= 1
+    pairs.reverse()
+
+    alignment = []
+    entries = {}
+    inserted = ""
+    last_index = None
+    for i, j in pairs:
+        if i is None:
+            inserted += said[j]
+            continue
+        ch, index = letters[i]
+        if inserted:
+            if index == last_index:
+                # Extra letters inside a syllable make that syllable wrong
+                entries[index]["heard"] += inserted
+                entries[index]["ok"] = False
+            else:
+                alignment.append({"expected": "", "heard": inserted, "ok": False})
+            inserted = ""
+        if index not in entries:
+            entries[index] = {"expected": expected[index], "heard": "", "ok": True}
+            alignment.append(entries[index])
+        if j is None or said[j] != ch:
+            entries[index]["ok"] = False
+        if j is not None:
+            entries[index]["heard"] += said[j]
+        last_index = index
+    if inserted:
+        alignment.append({"expected": "", "heard": inserted, "ok": False})
+    return alignment
+
+
+# ===============================
+# ANSWER KEY
+# ===============================
+
+class AnswerKey:
+    """Precomputed phonetic keys for every accepted answer to one drill prompt."""
+
+    def __init__(self, answers, lang, threshold=0.8):
+        self.lang = lang
+        self.threshold = threshold
+        self.answers = []
+        for answer in answers:
+            if not answer or not answer.strip():
+                continue
+            syllables = phonetic_syllables(answer, lang)
+            self.answers.append({
+                "text": answer,
+                "syllables": syllables,
+                "key": phonetic_key(answer, lang),
+            })
+
+    def grade(self, user_text):
+        """Grade a romanized answer against every accepted answer and keep the best match."""
+        heard_syllables = phonetic_syllables(user_text or "", self.lang)
+        heard_key = phonetic_key(user_text or "", self.lang)
+
+        best = None
+        best_score = -1.0
+        for answer in self.answers:
+            # Anything further away than this can never pass, so let the distance bail out early
+            max_distance = int(max(len(answer["key"]), len(heard_key)) * (1 - self.threshold) + 1e-9)
+            score = similarity(answer["key"], heard_key, max_distance)
+            if score > best_score:
+                best, best_score = answer, score
+            if score == 1.0:
+                break
+
+        if best is None:
+            return {"is_correct": False, "score": 0.0, "matched": "", "alignment": []}
+
+        return {
+            "is_correct": best_score >= self.threshold,
+            "score": round(best_score, 3),
+            "matched": best["text"],
+            "alignment": align_syllables(best["syllables"], heard_syllables, self.lang),
+        }
+
+
+def format_alignment(alignment):
+    """Render an alignment as text, bracketing the syllables the learner missed."""
+    parts = []
+    for item in alignment:
+        if not item["expected"]:
+            continue
+        parts.append(item["expected"] if item["ok"] else f"[{item['expected']}]")
+    return " ".join(parts)
@@ -0,0 +1,478 @@
+import warnings
+warnings.filterwarnings(
+    "ignore",
+    category=FutureWarning,
+    message=".*weights_only.*"
+)
+import sounddevice as sd
+import numpy as np
+import wave
+import os
+import sys
+import json
+import pyttsx3
+import tempfile
+import requests
+import subprocess
+import re
+from gtts import gTTS
+import io
+import getpass
+from pydub import AudioSegment
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from vosk import Model, KaldiRecognizer
+import noisereduce as nr
+import soundfile as sf
+from googletrans import Translator
+from pypinyin import lazy_pinyin  # For Chinese Romanization
+from korean_romanizer.romanizer import Romanizer  # For Korean Romanization
+import pykakasi  # For Japanese Romanization
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from translation_router import TranslationRouter
+from offline_translation import offline_translate
+from event_log import EventLog, EventTail, TRANSLATION_LOG
+from model_manager import models, preferred_variant, disk_size_mb
+from warmup import warm_recognizer, warm_translation
+from stop_signal import StopSignal, Cancelled
+from audio_device import device
+from timing import Timings
+from streaming_asr import record_streaming, vosk_model_path
+from pipeline import TranslationPipeline
+from model_host import owner_alive
+
+# ===============================
+# CONFIGURATION
+# ===============================
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+USER = getpass.getuser()
+VOSK_MODEL_PATH = os.path.join(BASE_DIR, "Vosk", "Filipino", "vosk-model-tl-ph-generic-0.6")
+WHISPER_BIN = os.path.join("/", "home", USER, "whisper.cpp", "build", "bin", "whisper-cli")
+# Uses ggml-base-q8_0.bin instead when the quantized model has been downloaded
+WHISPER_MODEL_PATH = preferred_variant(os.path.join("/", "home", USER, "whisper.cpp", "models", "ggml-base.bin"))
+OPENJTALK_VOICE = "/home/cultureconnect/open_jtalk/new_voices/takumi_normal.htsvoice"
+OPENJTALK_DIC = "/var/lib/mecab/dic/open-jtalk/naist-jdic"
+
+SAMPLERATE = 16000
+RECORD_SECONDS = 5
+CONTROL_POLL = 0.05   # Seconds between checks for GUI control messages
+# Translate and speak each clause as soon as it is stable instead of waiting for the whole
+# utterance. Needs a Vosk model for the source language; others fall back to whole utterances.
+INCREMENTAL = os.environ.get("INCREMENTAL_TRANSLATION") == "1"
+
+GOOGLE_CODES = {"zh": "zh-CN"}
+LANGUAGE_NAMES = {"tl": "Filipino", "ja": "Japanese", "ko": "Korean", "zh": "Chinese"}
+
+translation_log = EventLog(TRANSLATION_LOG)
+timings = Timings("translator", translation_log)
+translator = Translator()
+# Translates committed segments while the speaker is still talking; one thread keeps them in order
+segment_executor = ThreadPoolExecutor(max_workers=1)
+engine = pyttsx3.init()
+engine_lock = threading.Lock()   # pyttsx3 is not thread-safe
+
+# Recording, whisper-cli and every TTS go through this so a pause interrupts them mid-stream
+stop_signal = StopSignal()
+stop_signal.on_stop(engine.stop)
+
+kks = pykakasi.kakasi()
+kks.setMode("H", "a")
+kks.setMode("K", "a")
+kks.setMode("J", "a")
+kks.setMode("r", "Hepburn")
+kks.setMode("s", True)
+
+def update_status(state):
+    translation_log.append("status", status=state)
+
+@timings.timed("check_internet")
+def check_internet():
+    try:
+        requests.get("http://www.google.com", timeout=3)
+        return True
+    except requests.exceptions.RequestException:
+        return False
+
+# ===============================
+# SPEECH RECOGNITION
+# ===============================
+
+def record_audio(duration=RECORD_SECONDS, samplerate=SAMPLERATE):
+    return stop_signal.record(duration, samplerate)
+
+@timings.timed("denoise")
+def denoise(audio_data, samplerate=SAMPLERATE):
+    """Write the recording to a temporary WAV with noise reduction applied; returns its path."""
+    data = audio_data.reshape(-1).astype(np.float32) / 32768.0
+    reduced = nr.reduce_noise(y=data, sr=samplerate)
+    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_wav:
+        sf.write(tmp_wav.name, reduced, samplerate, subtype="PCM_16")
+        return tmp_wav.name
+
+def load_vosk_model():
+    return Model(VOSK_MODEL_PATH)
+
+def transcribe_vosk(audio_data):
+    denoised_wav = denoise(audio_data)
+    results = []
+    try:
+        with models.use("vosk:tl", load_vosk_model, path=VOSK_MODEL_PATH) as model, timings.span("vosk"):
+            recognizer = KaldiRecognizer(model, SAMPLERATE)
+            with wave.open(denoised_wav, 'rb') as wf:
+                while True:
+                    data = wf.readframes(4000)
+                    if not data:
+                        break
+                    if recognizer.AcceptWaveform(data):
+                        results.append(json.loads(recognizer.Result()).get("text", ""))
+            results.append(json.loads(recognizer.FinalResult()).get("text", ""))
+    finally:
+        os.remove(denoised_wav)
+    return " ".join(results).strip()
+
+def transcribe_whisper(audio_data, lang):
+    denoised_wav = denoise(audio_data)
+    try:
+        # whisper-cli loads the model in its own process; make room for it first
+        models.make_room(disk_size_mb(WHISPER_MODEL_PATH))
+        with timings.span("whisper", lang=lang):
+            result = stop_signal.run(
+                [WHISPER_BIN, "-m", WHISPER_MODEL_PATH, "-l", lang, "--no-timestamps", "-f", denoised_wav],
+                capture_output=True,
+                text=True
+            )
+    finally:
+        os.remove(denoised_wav)
+    cleaned = re.sub(r"\[\d+:\d+\.\d+ --> \d+:\d+\.\d+\]", "", result.stdout.strip())
+    return cleaned.strip()
+
+# ===============================
+# TEXT TO SPEECH
+# ===============================
+
+# Each synthesizer renders speech to a WAV file; speaking plays that file on our own
+# output stream, and the batch tool (batch_translate.py) keeps it instead
+
+def synthesize_japanese(text, path):
+    with tempfile.NamedTemporaryFile(suffix=".wav") as raw_wav:
+        with timings.span("open_jtalk"):
+            stop_signal.run([
+                "open_jtalk",
+                "-m", OPENJTALK_VOICE,
+                "-x", OPENJTALK_DIC,
+                "-r", "1",
+                "-p", "145",
+                "-g", "10",
+                "-ow", raw_wav.name
+            ], input=text, text=True, check=True)
+        stop_signal.run(["sox", raw_wav.name, path, "vol", "1"], check=True)
+
+def synthesize_korean(text, path):
+    with engine_lock:
+        for voice in engine.getProperty('voices'):
+            if any(kw in voice.id.lower() or kw in voice.name.lower() for kw in ["ko", "korean", "kr"]):
+                engine.setProperty('voice', voice.id)
+                break
+        else:
+            print("⚠️ Korean voice not found. Using default voice.")
+        engine.setProperty('rate', 150)
+        engine.setProperty('volume', 1.0)
+        engine.save_to_file(text, path)
+        engine.runAndWait()
+
+def synthesize_chinese(text, path):
+    stop_signal.run(["espeak-ng", "-v", "cmn", "-s", "130", "-w", path, text], check=True)
+
+def synthesize_filipino(text, path):
+    tts = gTTS(text=text, lang="tl")
+    audio_bytes = io.BytesIO()
+    tts.write_to_fp(audio_bytes)
+    audio_bytes.seek(0)
+
+    audio = AudioSegment.from_file(audio_bytes, format="mp3")
+    audio.set_frame_rate(SAMPLERATE).set_channels(1).export(path, format="wav")
+
+SYNTHESIZERS = {"ja": synthesize_japanese, "ko": synthesize_korean, "zh": synthesize_chinese, "tl": synthesize_filipino}
+
+def speak_with(synthesize, text):
+    with tempfile.NamedTemporaryFile(suffix=".wav") as tmp_wav:
+        synthesize(text, tmp_wav.name)
+        stop_signal.play_file(tmp_wav.name)
+
+@timings.timed("tts_ja")
+def speak_japanese(text):
+    try:
+        speak_with(synthesize_japanese, text)
+    except subprocess.CalledProcessError as e:
+        print(f"[!] Error running Open JTalk: {e}")
+
+@timings.timed("tts_ko")
+def speak_korean(text):
+    try:
+        speak_with(synthesize_korean, text)
+    except Cancelled:
+        raise
+    except Exception as e:
+        print(f"⚠️ TTS Error: {str(e)}")
+
+@timings.timed("tts_zh")
+def speak_chinese(text):
+    try:
+        speak_with(synthesize_chinese, text)
+    except FileNotFoundError:
+        print("❌ espeak-ng not found. Please install espeak-ng to enable Chinese TTS.")
+
+@timings.timed("tts_tl")
+def speak_filipino(text):
+    if not check_internet():
+        print("Offline mode playback skipped")
+        return
+    try:
+        speak_with(synthesize_filipino, text)
+    except Cancelled:
+        raise
+    except Exception as e:
+        print(f"[!] Filipino TTS failed: {e}")
+
+SPEAKERS = {"ja": speak_japanese, "ko": speak_korean, "zh": speak_chinese, "tl": speak_filipino}
+
+# ===============================
+# TRANSLATION
+# ===============================
+
+@timings.timed("google")
+def google_translate(text, source, target):
+    translated = translator.translate(text, src=GOOGLE_CODES.get(source, source), dest=GOOGLE_CODES.get(target, target))
+    return translated.text.strip()
+
+@timings.timed("argos")
+def argos_translate_chain(text, source, target):
+    try:
+        # Uses a direct model when one is installed, otherwise pivots through English
+        return offline_translate(text, source, target)
+    except Exception as e:
+        return f"Argos chain failed: {e}"
+
+# Google and Argos race each other instead of Argos only running after Google fails
+router = TranslationRouter([
+    ("google", google_translate),
+    ("argos", argos_translate_chain),
+])
+
+@timings.timed("romanize")
+def romanize_translation(text, lang):
+    if lang == "zh":
+        return " ".join(lazy_pinyin(text))
+    elif lang == "ko":
+        return Romanizer(text).romanize()
+    elif lang == "ja":
+        return " ".join(item['hepburn'] for item in kks.convert(text))
+    return ""
+
+def preprocess_text(text, lang):
+    """whisper output has no final punctuation; add it so MT treats it as a sentence."""
+    stop = "." if lang == "ko" else "。"
+    if text and not text.endswith((".", "!", "?", "。", "！", "？")):
+        return text + stop
+    return text
+
+# ===============================
+# DIRECTIONS
+# ===============================
+
+class StreamedAudio(np.ndarray):
+    """A recording carrying the transcript the streaming recognizer already made of it."""
+    transcript = None
+
+class Direction:
+    """One translation direction; every direction shares the same models and router."""
+
+    def __init__(self, source, target):
+        self.source = source
+        self.target = target
+        self.incremental = INCREMENTAL and vosk_model_path(source) is not None
+
+    def record(self, pipeline):
+        """Record one chunk, showing what is being heard in the GUI as the speaker talks.
+
+        The streaming transcript comes back with the audio as a StreamedAudio, so
+        translate_utterance() does not decode the chunk a second time. In incremental
+        mode stable stretches of speech are also translated and spoken right away, and
+        make up the final translation themselves.
+        """
+        generation = pipeline.generation
+        state = {"done": False, "text": "", "final": None}
+        segments, translations = [], []
+
+        def publish(text):
+            state["text"] = text
+            if not state["done"]:
+                translation_log.append("partial", source=self.source, target=self.target,
+                                       text=text, translated_text=" ".join(translations))
+
+        def translate_segment(text):
+            segments.append(text)
+
+            def run():
+                if generation != pipeline.generation:
+                    return  # Paused or swapped since
+                translated = router.translate(text, self.source, self.target)
+                translations.append(translated)
+                publish(state["text"])
+                pipeline.speak_now(generation, translated)
+            segment_executor.submit(run)
+
+        def finish():
+            if generation == pipeline.generation and translations:
+                transcription = " ".join(segments)
+                print(f"📝 {LANGUAGE_NAMES[self.source]} Transcription: {transcription}")
+                self.log_translation(transcription, " ".join(translations))
+
+        def keep_transcript(text):
+            state["final"] = text
+
+        try:
+            audio = record_streaming(stop_signal, RECORD_SECONDS, SAMPLERATE, self.source, publish,
+                                     translate_segment if self.incremental else None, keep_transcript)
+        finally:
+            state["done"] = True
+            if self.incremental:
+                # Queued behind the last clause, which is committed when recording ends
+                segment_executor.submit(finish)
+        if audio is not None and state["final"] is not None:
+            audio = audio.view(StreamedAudio)
+            audio.transcript = state["final"]
+        return audio
+
+    def transcribe(self, audio_data):
+        if self.source == "tl":
+            return transcribe_vosk(audio_data)
+        return preprocess_text(transcribe_whisper(audio_data, self.source), self.source)
+
+    def translate_utterance(self, audio_data):
+        if self.incremental:
+            return None  # Already translated and spoken clause by clause while recording
+        transcription = getattr(audio_data, "transcript", None)
+        if transcription is None:
+            transcription = self.transcribe(audio_data)
+        if not transcription:
+            return None
+        print(f"📝 {LANGUAGE_NAMES[self.source]} Transcription: {transcription}")
+
+        with timings.span("translate", source=self.source, target=self.target):
+            translated_text = router.translate(transcription, self.source, self.target)
+        self.log_translation(transcription, translated_text)
+        return translated_text
+
+    def log_translation(self, transcription, translated_text):
+        romanized_text = romanize_translation(translated_text, self.target)
+        translation_log.append("translation", source=self.source, target=self.target,
+                               transcription=transcription, translated_text=translated_text,
+                               romanized_text=romanized_text)
+
+    def speak(self, text):
+        if not text or not text.strip():
+            return
+        update_status("SPEAKING")
+        SPEAKERS[self.target](text)
+        update_status("IDLE")
+
+    def warm_up(self):
+        if self.source == "tl":
+            warm_recognizer(models.get("vosk:tl", load_vosk_model, path=VOSK_MODEL_PATH))
+        warm_translation(self.source, self.target)
+
+# ===============================
+# WORKER LOOP
+# ===============================
+
+def run_worker():
+    """Serve every direction from one process, switching on control events from the GUI.
+
+    Control events ("type": "control") are appended to the translation log:
+      command=start, source=.., target=..   listen and translate in that direction
+      command=pause                         stop listening, keep everything loaded
+      command=exit                          shut the worker down
+    pause and exit cut off recording, whisper-cli and TTS mid-stream, close the
+    audio streams and answer with a "control_ack" event.
+
+    The GUI passes --since with its launch time: the start it sends right after
+    launching is written while this process is still importing its models.
+    """
+    since = float(sys.argv[sys.argv.index("--since") + 1]) if "--since" in sys.argv else None
+    control = EventTail(TRANSLATION_LOG, since=since)
+    state = {"direction": None}
+    gui_alive = owner_alive()
+
+    def record():
+        return state["direction"].record(pipeline)
+
+    def process(audio_data):
+        return state["direction"].translate_utterance(audio_data)
+
+    def speak(text):
+        state["direction"].speak(text)
+
+    pipeline = TranslationPipeline(
+        record=record,
+        process=process,
+        speak=speak,
+        publish=translation_log.append
+    )
+
+    def interrupt(command):
+        started = time.monotonic()
+        pipeline.pause()
+        stop_signal.request()
+        released = pipeline.wait_idle()
+        if command != "swap":
+            device.release()  # Let a drill (or anything else) open the microphone while paused
+        stop_signal.reset()   # Nothing records while paused, so the next start begins clean
+        translation_log.append("control_ack", command=command, released=released,
+                               seconds=round(time.monotonic() - started, 3))
+
+    stop_signal.install_signal_handlers()
+    pipeline.pause()
+    pipeline.start()
+    update_status("IDLE")
+
+    try:
+        while gui_alive():
+            for event in control.poll():
+                if event.get("type") != "control":
+                    continue
+                command = event.get("command")
+                if command == "start":
+                    direction = Direction(event["source"], event["target"])
+                    if state["direction"] is None:
+                        update_status("LOADING")
+                        direction.warm_up()
+                    else:
+                        # A swap: drop the other direction's audio and start listening right
+                        # away, the router covers the new offline model while it warms up
+                        interrupt("swap")
+                        threading.Thread(target=direction.warm_up, daemon=True).start()
+                    state["direction"] = direction
+                    pipeline.resume()
+                    update_status("LOADED")
+                    print(f"Translating {direction.source} -> {direction.target}")
+                elif command == "pause":
+                    interrupt(command)
+                    update_status("IDLE")
+                elif command == "exit":
+                    interrupt(command)
+                    return
+            time.sleep(CONTROL_POLL)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop_signal.request()
+        pipeline.stop(timeout=1)
+        device.release()
+        print(f"Throughput: {pipeline.utterances_per_minute():.1f} utterances/min")
+
+if __name__ == "__main__":
+    run_worker()
@@ -0,0 +1,140 @@
+"""Translate a list of sentences or recordings without the GUI or a microphone.
+
+Usage:
+    python3 Modes/Translation/batch_translate.py --text sentences.txt --source tl --targets ja ko zh
+    python3 Modes/Translation/batch_translate.py --audio clips/*.wav --source ja --targets tl
+                                                 [--workers 4] [--tts DIR] [--output results.jsonl]
+
+--text takes one item per line (only the first "|" field is used, so the drill
+word lists work as they are). --audio takes 16 kHz mono WAVs, or .txt files
+listing WAV paths one per line. Every item goes through the translator's own
+stages: transcription for audio, the same translation router (Google racing
+Argos), romanization, and with --tts the same synthesizers, whose WAVs are
+written to DIR instead of being played. Results are written as JSON lines in
+input order, one per item and target language.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import TranslatorWorker as worker
+
+# ===============================
+# CONFIGURATION
+# ===============================
+
+LANGUAGES = list(worker.LANGUAGE_NAMES)
+DEFAULT_WORKERS = 4
+
+
+def read_text_items(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.split("|")[0].strip() for line in f.read().splitlines() if line.split("|")[0].strip()]
+
+
+def read_audio_items(paths):
+    items = []
+    for path in paths:
+        if path.endswith(".txt"):
+            base = os.path.dirname(os.path.abspath(path))
+            with open(path, "r", encoding="utf-8") as f:
+                items.extend(os.path.join(base, line.strip()) for line in f if line.strip())
+        else:
+            items.append(path)
+    return items
+
+
+def load_wav(path):
+    """Read a WAV shaped like a recording (int16, one column), resampled to SAMPLERATE."""
+    audio, samplerate = worker.sf.read(path, dtype="int16")
+    if audio.ndim > 1:
+        audio = audio[:, 0]
+    if samplerate != worker.SAMPLERATE:
+        np = worker.np
+        positions = np.arange(0, len(audio), samplerate / worker.SAMPLERATE)
+        audio = np.interp(positions, np.arange(len(audio)), audio).astype(np.int16)
+    return audio.reshape(-1, 1)
+
+
+def translate_item(job):
+    index, item, is_audio, source, target, tts_dir = job
+    result = {"index": index, "input": item, "source": source, "target": target,
+              "transcription": None, "translated_text": None, "romanized_text": None,
+              "tts_path": None, "seconds": None, "error": None}
+    started = time.perf_counter()
+    try:
+        if is_audio:
+            transcription = worker.Direction(source, target).transcribe(load_wav(item))
+        else:
+            transcription = item
+        result["transcription"] = transcription
+        if transcription:
+            translated_text = worker.router.translate(transcription, source, target)
+            result["translated_text"] = translated_text
+            result["romanized_text"] = worker.romanize_translation(translated_text, target)
+            if tts_dir and translated_text.strip():
+                tts_path = os.path.join(tts_dir, f"{index:04d}-{target}.wav")
+                worker.SYNTHESIZERS[target](translated_text, tts_path)
+                result["tts_path"] = tts_path
+        else:
+            result["error"] = "nothing recognized"
+    except Exception as e:
+        result["error"] = str(e)
+    result["seconds"] = round(time.perf_counter() - started, 3)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--text", help="File with one sentence per line")
+    parser.add_argument("--audio", nargs="+", default=[], help="WAV files, or .txt files listing them")
+    parser.add_argument("--source", required=True, choices=LANGUAGES)
+    parser.add_argument("--targets", nargs="+", required=True, choices=LANGUAGES)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--tts", metavar="DIR", help="Also synthesize each translation into DIR")
+    parser.add_argument("--output", help="JSONL results file (default: stdout)")
+    args = parser.parse_args()
+
+    items = [(item, False) for item in (read_text_items(args.text) if args.text else [])]
+    items += [(item, True) for item in read_audio_items(args.audio)]
+    if not items:
+        parser.error("nothing to translate; give --text and/or --audio")
+    targets = [target for target in args.targets if target != args.source]
+    if args.tts:
+        os.makedirs(args.tts, exist_ok=True)
+
+    # Spans still go to the shared stats file, but not to the live GUI's event log
+    worker.timings.log = None
+    for target in targets:
+        worker.warm_translation(args.source, target)
+
+    jobs = [(index, item, is_audio, args.source, target, args.tts)
+            for index, (item, is_audio) in enumerate(items) for target in targets]
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    started = time.perf_counter()
+    failed = 0
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+            # map() yields in input order however the workers finish
+            for result in pool.map(translate_item, jobs):
+                if result["error"]:
+                    failed += 1
+                    print(f"[!] {result['index']} {result['target']}: {result['error']}", file=sys.stderr)
+                out.write(json.dumps(result, ensure_ascii=False) + "\n")
+                out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - started
+    print(f"✅ {len(jobs) - failed}/{len(jobs)} translated in {elapsed:.1f} s "
+          f"({len(jobs) / elapsed * 60:.1f} items/min, {args.workers} workers)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
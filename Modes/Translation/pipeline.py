@@ -0,0 +1,200 @@
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+# ===============================
+# CONFIGURATION
+# ===============================
+
+SAMPLERATE = 16000
+MIN_GATED_AUDIO = 0.5    # Chunks with less unmuted audio than this are dropped
+QUEUE_SIZE = 2
+
+
+class TranslationPipeline:
+    """Staged capture -> recognize/translate -> playback loop.
+
+    Each stage runs on its own thread and hands work to the next through a
+    small queue, so the microphone records the next utterance while the
+    previous one is being transcribed, translated and spoken. The audio device
+    mutes captured blocks that are echo of our own TTS (see audio_device.py);
+    chunks left with too little audio are dropped here.
+
+    Every queued item carries the generation it was captured in; flush() starts
+    a new generation so anything recorded before (e.g. in the other language
+    after a direction swap) is dropped instead of recognized or spoken.
+    """
+
+    def __init__(self, record, process, speak, publish=None, samplerate=SAMPLERATE):
+        self.record = record      # () -> int16 numpy array
+        self.process = process    # (audio) -> text to speak, or None
+        self.speak = speak        # (text) -> None, blocks until playback is done
+        self.publish = publish    # (event_type, **fields) -> None
+        self.samplerate = samplerate
+
+        self.audio_queue = queue.Queue(maxsize=QUEUE_SIZE)
+        self.speech_queue = queue.Queue(maxsize=QUEUE_SIZE)
+        self.stop_event = threading.Event()
+        self.paused = threading.Event()
+        self.generation = 0
+        self.audio_lock = threading.Lock()
+        self.audio_busy = 0          # Stages currently holding the microphone or speaker
+        self.threads = []
+
+        self.started_at = None
+        self.utterances = 0
+
+    def start(self):
+        self.started_at = time.monotonic()
+        for target in (self._capture_loop, self._process_loop, self._playback_loop):
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def stop(self, timeout=None):
+        self.stop_event.set()
+        for thread in self.threads:
+            thread.join(timeout)
+
+    def pause(self):
+        self.paused.set()
+        self.flush()
+
+    def resume(self):
+        self.flush()
+        self.paused.clear()
+
+    def flush(self):
+        self.generation += 1
+        for q in (self.audio_queue, self.speech_queue):
+            while True:
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    break
+
+    def speak_now(self, generation, text):
+        """Queue text for playback from outside the process stage, e.g. a clause
+        translated while its utterance is still being recorded."""
+        if text and generation == self.generation:
+            self._put(self.speech_queue, (generation, text))
+
+    def wait_idle(self, timeout=1.0):
+        """Wait until no stage is using the audio device; True if it was released in time."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self.audio_lock:
+                if self.audio_busy == 0:
+                    return True
+            time.sleep(0.01)
+        return False
+
+    def interrupted(self):
+        """Errors raised while pausing or stopping are the stop itself, not failures."""
+        return self.paused.is_set() or self.stop_event.is_set()
+
+    def utterances_per_minute(self):
+        if self.started_at is None:
+            return 0.0
+        elapsed = time.monotonic() - self.started_at
+        return self.utterances * 60.0 / elapsed if elapsed > 0 else 0.0
+
+    # ===============================
+    # STAGES
+    # ===============================
+
+    def _capture_loop(self):
+        while not self.stop_event.is_set():
+            if self.paused.is_set():
+                time.sleep(0.05)
+                continue
+            try:
+                generation = self.generation
+                with self._using_audio():
+                    audio = self.record()
+                audio = self.gate_echo(audio)
+                if audio is not None and generation == self.generation:
+                    self._put(self.audio_queue, (generation, audio))
+            except Exception as e:
+                if self.interrupted():
+                    continue
+                print(f"Error in capture: {e}")
+                time.sleep(0.5)
+
+    def _process_loop(self):
+        while not self.stop_event.is_set():
+            item = self._get(self.audio_queue)
+            if item is None or item[0] != self.generation:
+                continue
+            generation, audio = item
+            try:
+                text = self.process(audio)
+                if text and generation == self.generation:
+                    self._put(self.speech_queue, (generation, text))
+            except Exception as e:
+                if not self.interrupted():
+                    print(f"Error in translation: {e}")
+
+    def _playback_loop(self):
+        while not self.stop_event.is_set():
+            item = self._get(self.speech_queue)
+            if item is None or item[0] != self.generation:
+                continue
+            generation, text = item
+            try:
+                with self._using_audio():
+                    self.speak(text)
+            except Exception as e:
+                if not self.interrupted():
+                    print(f"Error in playback: {e}")
+                continue
+
+            # Playback cut off by a pause, swap or stop is not a finished utterance
+            if self.interrupted() or generation != self.generation:
+                continue
+            self.utterances += 1
+            if self.publish:
+                self.publish("throughput", utterances=self.utterances,
+                             utterances_per_minute=round(self.utterances_per_minute(), 2))
+
+    # ===============================
+    # ECHO GATING
+    # ===============================
+
+    def gate_echo(self, audio):
+        """Drop a chunk that is (almost) all muted echo, so it costs no ASR + MT + TTS cycle.
+
+        Returns None when too little of the chunk is left to be worth recognizing.
+        """
+        if (audio != 0).sum() < MIN_GATED_AUDIO * self.samplerate:
+            return None
+        return audio
+
+    # ===============================
+    # QUEUE HELPERS
+    # ===============================
+
+    @contextmanager
+    def _using_audio(self):
+        with self.audio_lock:
+            self.audio_busy += 1
+        try:
+            yield
+        finally:
+            with self.audio_lock:
+                self.audio_busy -= 1
+
+    def _put(self, q, item):
+        while not self.stop_event.is_set():
+            try:
+                q.put(item, timeout=0.2)
+                return
+            except queue.Full:
+                continue
+
+    def _get(self, q):
+        try:
+            return q.get(timeout=0.2)
+        except queue.Empty:
+            return None
@@ -0,0 +1,236 @@
+import threading
+import time
+from collections import deque
+
+# ===============================
+# CONFIGURATION
+# ===============================
+
+SAMPLERATE = 16000
+RING_SECONDS = 10.0   # Capture history kept; a reader further behind than this loses the oldest audio
+PRE_ROLL = 0.3        # Seconds from before a recording starts that are included in it
+READ_POLL = 0.01
+READ_TIMEOUT = 1.0    # No samples for this long means the input stream has stalled
+
+ECHO_DELAY = 0.3      # Longest speaker-to-microphone delay we allow for, including the room's reverb
+DOUBLE_TALK = 2.0     # A block this much louder than the expected echo is the user talking over us
+COUPLING_RATE = 0.1   # How quickly the speaker-to-microphone level estimate adapts
+PLAYBACK_KEPT = 400   # Reference blocks remembered (20 s of 50 ms blocks)
+
+
+def block_rms(block):
+    import numpy as np
+
+    if len(block) == 0:
+        return 0.0
+    return float(np.sqrt(np.mean(block.astype(np.float32) ** 2)))
+
+
+class RingBuffer:
+    """Fixed-size int16 capture history with one writer and any number of readers.
+
+    There is no lock: the PortAudio callback copies samples in and only then
+    advances `written` (an absolute sample count), and every reader keeps its
+    own absolute position. Readers never block the audio thread or each other.
+    """
+
+    def __init__(self, capacity):
+        import numpy as np
+
+        self.data = np.zeros(capacity, dtype=np.int16)
+        self.capacity = capacity
+        self.written = 0
+
+    def write(self, samples):
+        count = len(samples)
+        if count > self.capacity:
+            self.written += count - self.capacity
+            samples = samples[-self.capacity:]
+            count = self.capacity
+        start = self.written % self.capacity
+        first = min(count, self.capacity - start)
+        self.data[start:start + first] = samples[:first]
+        self.data[:count - first] = samples[first:]
+        self.written += count
+
+    def read(self, position, count):
+        import numpy as np
+
+        start = position % self.capacity
+        first = min(count, self.capacity - start)
+        return np.concatenate((self.data[start:start + first], self.data[:count - first]))
+
+
+class EchoSuppressor:
+    """Mutes captured blocks that are only our own playback coming back in.
+
+    Every block written to the speaker is kept as a reference: when it will be
+    heard and how loud it is. A captured block that overlaps recent playback
+    is compared with the level that playback should reach the microphone at
+    (reference level times the learned speaker-to-microphone coupling). If it
+    is not clearly louder it is echo and muted; otherwise the user is talking
+    over the playback and it is kept.
+    """
+
+    def __init__(self):
+        self.played = deque(maxlen=PLAYBACK_KEPT)  # (start, end, rms), end includes output latency
+        self.playout_end = 0.0
+        self.coupling = 1.0
+        self.muted = 0
+
+    def add_playback(self, block, samplerate, latency):
+        start = max(self.playout_end, time.monotonic())
+        self.playout_end = start + len(block) / samplerate
+        self.played.append((start, self.playout_end + latency, block_rms(block)))
+
+    def reference_level(self, start, end):
+        level = 0.0
+        # list() copies in one step, so the playback thread appending meanwhile is harmless
+        for played_start, played_end, rms in reversed(list(self.played)):
+            if played_end + ECHO_DELAY < start:
+                break
+            if played_start <= end:
+                level = max(level, rms)
+        return level
+
+    def filter(self, block, start, end):
+        reference = self.reference_level(start, end)
+        if reference == 0.0:
+            return block
+        ratio = block_rms(block) / reference
+        is_echo = ratio <= DOUBLE_TALK * self.coupling
+        # Learn from every overlapping block, but let no single one (e.g. the
+        # user talking over us) pull the estimate up more than a little
+        self.coupling += COUPLING_RATE * (min(ratio, 4 * self.coupling) - self.coupling)
+        if not is_echo:
+            return block
+        self.muted += len(block)
+        return block * 0
+
+
+class Reader:
+    """One consumer's position in the capture ring.
+
+    Consecutive recordings continue exactly where the previous one ended, so
+    nothing is lost or repeated between chunks; after a longer gap a recording
+    starts PRE_ROLL seconds back, which keeps a first syllable spoken just
+    before it began.
+    """
+
+    def __init__(self, device):
+        self.device = device
+        self.ring = None
+        self.position = 0
+        self.lost = 0   # Samples skipped because this reader fell too far behind
+
+    def begin(self, pre_roll=PRE_ROLL):
+        ring = self.device.open_input()
+        earliest = max(0, ring.written - int(pre_roll * self.device.samplerate))
+        if ring is not self.ring:
+            self.ring = ring
+            self.position = earliest
+        else:
+            self.position = max(self.position, earliest)
+
+    def read(self, count):
+        """Wait for and return the next count samples as an int16 array."""
+        ring = self.ring
+        deadline = time.monotonic() + READ_TIMEOUT
+        while ring.written - self.position < count:
+            if time.monotonic() > deadline:
+                raise TimeoutError("No audio from the input device")
+            time.sleep(READ_POLL)
+
+        # Keep a second of margin so the callback cannot overwrite what is being copied
+        oldest = ring.written - ring.capacity + self.device.samplerate
+        if self.position < oldest:
+            self.lost += oldest - self.position
+            self.position = oldest
+        data = ring.read(self.position, count)
+        self.position += count
+        return self.device.echo.filter(data, *self.device.capture_time(self.position - count, self.position))
+
+
+class AudioDevice:
+    """Owns this process's input and output streams and keeps them open between uses.
+
+    Opening a PortAudio stream for every recording or clip adds latency and
+    now and then fails with "device busy" while the previous one is closing.
+    Once opened, the input stream runs continuously into a RingBuffer and the
+    output stream takes blocking writes, which double as the EchoSuppressor's
+    reference for what reads return. release() closes both, e.g. when the
+    translation worker pauses so a drill can use the microphone; the next
+    recording or clip opens them again.
+    """
+
+    def __init__(self, samplerate=SAMPLERATE):
+        self.samplerate = samplerate
+        self.lock = threading.Lock()   # Opening and closing only, never taken on the audio thread
+        self.input = None
+        self.output = None
+        self.output_rate = None
+        self.ring = None
+        self.anchor = (0, 0.0)   # (samples written, monotonic time) at the last input callback
+        self.overflows = 0
+        self.echo = EchoSuppressor()
+        self.reader = Reader(self)
+
+    def open_input(self):
+        with self.lock:
+            if self.input is None:
+                import sounddevice as sd
+
+                self.ring = RingBuffer(int(RING_SECONDS * self.samplerate))
+                self.input = sd.InputStream(samplerate=self.samplerate, channels=1, dtype="int16",
+                                            callback=self._on_input)
+                self.input.start()
+            return self.ring
+
+    def open_output(self, samplerate):
+        with self.lock:
+            if self.output is not None and self.output_rate != samplerate:
+                self._close(self.output)
+                self.output = None
+            if self.output is None:
+                import sounddevice as sd
+
+                self.output = sd.OutputStream(samplerate=samplerate, channels=1, dtype="int16")
+                self.output.start()
+                self.output_rate = samplerate
+            return self.output
+
+    def write(self, block, samplerate):
+        """Queue one block on the output stream and keep it as the echo reference."""
+        stream = self.open_output(samplerate)
+        stream.write(block.reshape(-1, 1))
+        self.echo.add_playback(block, samplerate, stream.latency)
+        return stream
+
+    def capture_time(self, first, last):
+        """Monotonic times at which samples first..last of the ring were recorded."""
+        written, at = self.anchor
+        return (at - (written - first) / self.samplerate, at - (written - last) / self.samplerate)
+
+    def release(self):
+        """Close both streams without draining them."""
+        with self.lock:
+            for stream in (self.input, self.output):
+                if stream is not None:
+                    self._close(stream)
+            self.input = self.output = self.ring = None
+
+    def _close(self, stream):
+        try:
+            stream.abort()
+            stream.close()
+        except Exception as e:
+            print(f"[!] Error closing audio stream: {e}")
+
+    def _on_input(self, indata, frames, time_info, status):
+        if status.input_overflow:
+            self.overflows += 1
+        self.ring.write(indata[:, 0])
+        self.anchor = (self.ring.written, time.monotonic())
+
+
+device = AudioDevice()
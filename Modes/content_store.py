@@ -0,0 +1,100 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+# ===============================
+# CONFIGURATION
+# ===============================
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CONTENT_DIR = os.path.join(BASE_DIR, "content")
+STORE_PATH = os.path.join(CONTENT_DIR, "content.db")
+AUDIO_DIR = os.path.join(CONTENT_DIR, "audio")
+
+# Bump to rebuild everything, e.g. after changing a TTS voice
+CONTENT_VERSION = 1
+
+# Codes some callers use for the same language (Google's "zh-CN" in the Chinese drills)
+LANGUAGE_ALIASES = {"zh-CN": "zh"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS content (
+    key TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    text TEXT NOT NULL,
+    translation TEXT,
+    romanized TEXT,
+    audio TEXT,
+    built_at REAL NOT NULL
+);
+"""
+
+
+def content_key(text, source, target):
+    """Content hash of one item: the same text and direction always maps to the same entry."""
+    source, target = LANGUAGE_ALIASES.get(source, source), LANGUAGE_ALIASES.get(target, target)
+    data = json.dumps([CONTENT_VERSION, source, target, text.strip()], ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def audio_path(key):
+    return os.path.join(AUDIO_DIR, f"{key}.wav")
+
+
+class ContentStore:
+    """Precompiled translations, romanizations and TTS audio for the learning content.
+
+    Entries are keyed by content_key(text, source, target); source == target
+    holds only the spoken audio of the text itself (e.g. a drill prompt).
+    Filled by precompile_content.py, read by the drills so a prompt needs
+    neither the network nor a translation engine when it is already here.
+    """
+
+    def __init__(self, path=STORE_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.makedirs(AUDIO_DIR, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def get(self, text, source, target):
+        """The entry for text as a dict, or None; audio is None if its file has gone missing."""
+        row = self.conn.execute("SELECT * FROM content WHERE key = ?",
+                                (content_key(text, source, target),)).fetchone()
+        if row is None:
+            return None
+        entry = dict(row)
+        if entry["audio"] and not os.path.exists(entry["audio"]):
+            entry["audio"] = None
+        return entry
+
+    def complete_keys(self):
+        """Keys of entries whose audio is on disk, i.e. that need no more work."""
+        rows = self.conn.execute("SELECT key, audio FROM content").fetchall()
+        return {row["key"] for row in rows if row["audio"] and os.path.exists(row["audio"])}
+
+    def keys(self):
+        return {row["key"] for row in self.conn.execute("SELECT key FROM content")}
+
+    def put(self, key, source, target, text, translation=None, romanized=None, audio=None):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO content (key, source, target, text, translation, romanized, audio, built_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, source, target, text.strip(), translation, romanized, audio, time.time())
+            )
+
+    def delete(self, keys):
+        with self.conn:
+            self.conn.executemany("DELETE FROM content WHERE key = ?", [(key,) for key in keys])
+        for key in keys:
+            if os.path.exists(audio_path(key)):
+                os.remove(audio_path(key))
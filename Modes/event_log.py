@@ -0,0 +1,182 @@
+import json
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows development machines
+    fcntl = None
+
+# ===============================
+# CONFIGURATION
+# ===============================
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+LOG_DIR = os.path.join(BASE_DIR, "logs")
+DRILL_LOG = os.path.join(LOG_DIR, "drill_events.jsonl")
+TRANSLATION_LOG = os.path.join(LOG_DIR, "translation_events.jsonl")
+SYSTEM_LOG = os.path.join(LOG_DIR, "system_events.jsonl")
+
+MAX_LOG_BYTES = 256 * 1024   # Compact the live log once it grows past this
+COMPACT_KEEP = 50            # Events kept in the live log after compaction
+COMPACT_CHECK_EVERY = 64     # Appends between size checks
+
+
+class EventLog:
+    """Append-only, line-delimited JSON event log.
+
+    Every append is one small sequential write. When the live file grows past
+    max_bytes it is compacted: older events move to an archive next to it and
+    only the most recent ones stay live, so history is never lost.
+    """
+
+    def __init__(self, path, max_bytes=MAX_LOG_BYTES):
+        self.path = path
+        self.archive_path = path + ".archive"
+        self.lock_path = path + ".lock"
+        self.max_bytes = max_bytes
+        self.appends = 0
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    def append(self, event_type, **fields):
+        event = {"ts": time.time(), "pid": os.getpid(), "type": event_type}
+        event.update(fields)
+        line = json.dumps(event, ensure_ascii=False) + "\n"
+
+        with self._lock(exclusive=False):
+            # Opened per append so writers always follow the file across compactions
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+        self.appends += 1
+        if self.appends % COMPACT_CHECK_EVERY == 0:
+            try:
+                if os.path.getsize(self.path) > self.max_bytes:
+                    self.compact()
+            except OSError as e:
+                print(f"[!] Event log compaction failed: {e}")
+        return event
+
+    def compact(self, keep=COMPACT_KEEP):
+        with self._lock(exclusive=True):
+            if not os.path.exists(self.path):
+                return
+            with open(self.path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+
+            if len(lines) <= keep:
+                return
+
+            with open(self.archive_path, "a", encoding="utf-8") as archive:
+                archive.writelines(lines[:-keep])
+
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(lines[-keep:])
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+
+    def _lock(self, exclusive):
+        return _FileLock(self.lock_path, exclusive)
+
+
+class _FileLock:
+    def __init__(self, path, exclusive):
+        self.path = path
+        self.exclusive = exclusive
+        self.fd = None
+
+    def __enter__(self):
+        if fcntl is None:
+            return self
+        self.fd = os.open(self.path, os.O_CREAT | os.O_RDWR, 0o644)
+        fcntl.flock(self.fd, fcntl.LOCK_EX if self.exclusive else fcntl.LOCK_SH)
+        return self
+
+    def __exit__(self, *exc):
+        if self.fd is not None:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+            os.close(self.fd)
+            self.fd = None
+        return False
+
+
+class EventTail:
+    """Reads only the events appended since the last poll, following compactions.
+
+    With since (a time.time() timestamp) the live log is read from the start
+    and only events from that moment on are returned, so a process that is
+    slow to start still sees what was sent to it right after it was launched.
+    """
+
+    def __init__(self, path, from_start=False, since=None):
+        self.path = path
+        self.inode = None
+        self.offset = 0
+        self.partial = b""
+        self.last_ts = 0.0
+        self.since = since
+        if not from_start and since is None:
+            self.skip_to_end()
+
+    def skip_to_end(self):
+        try:
+            stat = os.stat(self.path)
+            self.inode, self.offset = stat.st_ino, stat.st_size
+        except FileNotFoundError:
+            self.inode, self.offset = None, 0
+        self.partial = b""
+        self.last_ts = time.time()
+
+    def poll(self):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return []
+
+        seen_before = None
+        if stat.st_ino != self.inode or stat.st_size < self.offset:
+            # The log was compacted; re-read the kept tail and drop what we already saw
+            self.inode, self.offset, self.partial = stat.st_ino, 0, b""
+            seen_before = self.last_ts
+        if stat.st_size == self.offset:
+            return []
+
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            chunk = f.read()
+            self.offset = f.tell()
+
+        lines = (self.partial + chunk).split(b"\n")
+        self.partial = lines.pop()  # Unterminated line still being written
+
+        events = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                event = json.loads(line.decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                continue
+            if seen_before is not None and event.get("ts", 0) <= seen_before:
+                continue
+            if self.since is not None and event.get("ts", 0) < self.since:
+                continue
+            self.last_ts = max(self.last_ts, event.get("ts", 0))
+            events.append(event)
+        return events
+
+
+def read_events(path, include_archive=False):
+    """Yield every event in a log, oldest first, for analytics."""
+    paths = [path + ".archive", path] if include_archive else [path]
+    for log_path in paths:
+        if not os.path.exists(log_path):
+            continue
+        with open(log_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
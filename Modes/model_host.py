@@ -0,0 +1,275 @@
+import json
+import os
+import runpy
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from event_log import EventLog, SYSTEM_LOG, LOG_DIR
+from model_manager import models, memory_usage
+
+# ===============================
+# CONFIGURATION
+# ===============================
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SOCKET_PATH = os.path.join(LOG_DIR, "model_host.sock")
+VOSK_MODEL_PATH = os.path.join(BASE_DIR, "Translation", "Vosk", "Filipino", "vosk-model-tl-ph-generic-0.6")
+
+REPORT_INTERVAL = 30.0   # Seconds between memory reports while children are running
+CONNECT_TIMEOUT = 2.0
+OWNER_ENV = "MODEL_HOST_OWNER"   # Pid of the GUI that asked for a hosted child
+
+system_log = EventLog(SYSTEM_LOG)
+
+
+# ===============================
+# CLIENT SIDE (used by the GUI)
+# ===============================
+
+class HostedProcess:
+    """Handle for a script forked by the model host, shaped like subprocess.Popen.
+
+    The host reaps its children, so the exit code is not known here; poll()
+    returns 0 once the process is gone.
+    """
+
+    def __init__(self, pid, args):
+        self.pid = pid
+        self.args = args
+        self.returncode = None
+
+    def poll(self):
+        if self.returncode is None:
+            try:
+                os.kill(self.pid, 0)
+            except ProcessLookupError:
+                self.returncode = 0
+            except PermissionError:
+                pass
+        return self.returncode
+
+    def wait(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.poll() is None:
+            if deadline is not None and time.monotonic() > deadline:
+                raise subprocess.TimeoutExpired(self.args, timeout)
+            time.sleep(0.05)
+        return self.returncode
+
+    def send_signal(self, sig):
+        if self.poll() is None:
+            try:
+                os.kill(self.pid, sig)
+            except ProcessLookupError:
+                pass
+
+    def terminate(self):
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self):
+        self.send_signal(signal.SIGKILL)
+
+
+def send_request(request):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(CONNECT_TIMEOUT)
+        client.connect(SOCKET_PATH)
+        client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        return json.loads(client.makefile("r").readline() or "{}")
+
+
+def launch_hosted(script_path, args=()):
+    """Ask the running model host to fork script_path. Returns None if there is no host."""
+    if not os.path.exists(SOCKET_PATH) or not os.path.exists(script_path):
+        return None
+    request = {"script": os.path.abspath(script_path), "args": list(args), "cwd": os.getcwd(),
+               "owner": os.getpid()}
+    try:
+        reply = send_request(request)
+    except (OSError, ValueError) as e:
+        print(f"[!] Model host unavailable, starting {script_path} directly: {e}")
+        return None
+    if "pid" not in reply:
+        print(f"[!] Model host could not start {script_path}: {reply.get('error')}")
+        return None
+    return HostedProcess(reply["pid"], ["python3", script_path, *args])
+
+
+def stop_host():
+    """Tell the running model host to shut down, e.g. when the GUI closes."""
+    if not os.path.exists(SOCKET_PATH):
+        return
+    try:
+        send_request({"command": "exit"})
+    except (OSError, ValueError) as e:
+        print(f"[!] Could not stop the model host: {e}")
+
+
+def owner_alive():
+    """Return a check for whether the GUI that started this process is still running.
+
+    A script started directly is the GUI's child, so it is orphaned once its
+    parent changes. A hosted script's parent is the model host, so the GUI's
+    pid comes in OWNER_ENV instead and is checked directly.
+    """
+    owner = os.environ.get(OWNER_ENV)
+    if owner:
+        return lambda: HostedProcess(int(owner), []).poll() is None
+    parent = os.getppid()
+    return lambda: os.getppid() == parent
+
+
+# ===============================
+# HOST SIDE
+# ===============================
+
+def preload():
+    """Load the fork-safe models that every child would otherwise load privately.
+
+    Only Vosk is preloaded: CTranslate2 starts worker threads when a model is
+    loaded, and threads do not survive fork(), so Argos models stay per-process.
+    """
+    if os.path.exists(VOSK_MODEL_PATH):
+        from vosk import Model
+        from warmup import touch_pages, warm_recognizer
+
+        touch_pages(VOSK_MODEL_PATH)
+        warm_recognizer(models.get("vosk:tl", lambda: Model(VOSK_MODEL_PATH), path=VOSK_MODEL_PATH))
+
+
+def fork_child(target, *args):
+    pid = os.fork()
+    if pid:
+        return pid
+
+    # Child: drop the host's socket handling and run target as a normal program
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    code = 0
+    try:
+        target(*args)
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except BaseException as e:
+        print(f"[!] Hosted process failed: {e}")
+        code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        models.unregister()
+        os._exit(code)
+
+
+def run_script(server, conn, script, args, cwd, owner):
+    conn.close()
+    server.close()
+    os.chdir(cwd)
+    if owner:
+        os.environ[OWNER_ENV] = str(owner)
+    sys.argv = [script, *args]
+    sys.path.insert(0, os.path.dirname(script))
+    runpy.run_path(script, run_name="__main__")
+
+
+def memory_report(children):
+    processes = []
+    for pid, script in children.items():
+        usage = memory_usage(pid)
+        if usage:
+            processes.append({"pid": pid, "script": os.path.basename(script), **usage})
+    rss_total = round(sum(p["rss_mb"] for p in processes), 1)
+    pss_total = round(sum(p["pss_mb"] for p in processes), 1)
+    return {
+        "processes": processes,
+        "rss_total_mb": rss_total,
+        "pss_total_mb": pss_total,
+        "saved_mb": round(rss_total - pss_total, 1),   # Counted more than once by RSS, resident once
+    }
+
+
+def publish_report(children):
+    report = memory_report({os.getpid(): "model_host", **children})
+    system_log.append("memory", **report)
+    print(f"Memory: RSS {report['rss_total_mb']} MB, PSS {report['pss_total_mb']} MB "
+          f"across {len(report['processes'])} processes, {report['saved_mb']} MB shared")
+
+
+def serve():
+    # Children are reaped automatically; the GUI polls them by pid
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    try:
+        preload()
+    except Exception as e:
+        print(f"[!] Model preload failed, children will load their own: {e}")
+
+    from warmup import run_warmup
+    fork_child(run_warmup)
+
+    if os.path.exists(SOCKET_PATH):
+        os.remove(SOCKET_PATH)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(SOCKET_PATH)
+    server.listen(4)
+    server.settimeout(REPORT_INTERVAL)
+    print(f"Model host ready at {SOCKET_PATH}")
+
+    children = {}
+    parent = os.getppid()
+    try:
+        while True:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                if os.getppid() != parent:
+                    break  # The GUI that started us is gone
+                children = {pid: s for pid, s in children.items() if HostedProcess(pid, []).poll() is None}
+                if children:
+                    publish_report(children)
+                continue
+
+            with conn:
+                try:
+                    request = json.loads(conn.makefile("r").readline())
+                    if request.get("command") == "exit":
+                        conn.sendall(json.dumps({"ok": True}).encode("utf-8") + b"\n")
+                        break
+                    script = request["script"]
+                    if not os.path.exists(script):
+                        raise FileNotFoundError(script)
+                    pid = fork_child(run_script, server, conn, script, request.get("args", []),
+                                     request.get("cwd", os.getcwd()), request.get("owner"))
+                    children[pid] = script
+                    reply = {"pid": pid}
+                except Exception as e:
+                    reply = {"error": str(e)}
+                conn.sendall(json.dumps(reply).encode("utf-8") + b"\n")
+    finally:
+        server.close()
+        if os.path.exists(SOCKET_PATH):
+            os.remove(SOCKET_PATH)
+
+
+if __name__ == "__main__":
+    if "--report" in sys.argv:
+        # Report on every app process (host, its children and standalone scripts)
+        processes = {}
+        for pid in os.listdir("/proc"):
+            if pid.isdigit() and int(pid) != os.getpid():
+                try:
+                    with open(f"/proc/{pid}/cmdline", "rb") as f:
+                        cmdline = f.read().split(b"\0")
+                except OSError:
+                    continue
+                scripts = [arg.decode(errors="replace") for arg in cmdline if arg.endswith(b".py")]
+                if scripts and ("Modes" in scripts[0] or "MainPage" in scripts[0]):
+                    processes[int(pid)] = scripts[0]
+        print(json.dumps(memory_report(processes), indent=2))
+    else:
+        serve()
@@ -0,0 +1,277 @@
+import atexit
+import gc
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+# ===============================
+# CONFIGURATION
+# ===============================
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RESIDENCY_PATH = os.path.join(BASE_DIR, "logs", "model_residency.json")
+
+# RAM all app processes together may spend on models. MODEL_BUDGET_MB overrides;
+# otherwise half of physical memory, which leaves room for the GUI and the OS on a Pi.
+BUDGET_FRACTION = 0.5
+DEFAULT_BUDGET_MB = 1024
+
+# Quantized siblings looked for next to a model file, best first
+QUANTIZED_SUFFIXES = ["-q8_0", "-int8"]
+
+
+def total_memory_mb():
+    try:
+        with open("/proc/meminfo", "r") as f:
+            for line in f:
+                if line.startswith("MemTotal:"):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def default_budget_mb():
+    if os.environ.get("MODEL_BUDGET_MB"):
+        return float(os.environ["MODEL_BUDGET_MB"])
+    total = total_memory_mb()
+    return total * BUDGET_FRACTION if total else DEFAULT_BUDGET_MB
+
+
+def process_rss_mb():
+    """Resident memory of this process in MB (Linux only, 0 elsewhere)."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return 0.0
+
+
+def memory_usage(pid="self"):
+    """RSS, PSS and shared/private memory of a process in MB, from /proc/<pid>/smaps_rollup.
+
+    PSS splits each shared page between the processes mapping it, so summing PSS
+    over processes gives the real total while summing RSS counts shared pages repeatedly.
+    """
+    fields = {"Rss": 0, "Pss": 0, "Shared_Clean": 0, "Shared_Dirty": 0, "Private_Clean": 0, "Private_Dirty": 0}
+    for name in ("smaps_rollup", "smaps"):
+        try:
+            with open(f"/proc/{pid}/{name}", "r") as f:
+                for line in f:
+                    key, _, rest = line.partition(":")
+                    if key in fields:
+                        fields[key] += int(rest.split()[0])
+            break
+        except (OSError, ValueError):
+            continue
+    else:
+        return None
+    return {
+        "rss_mb": round(fields["Rss"] / 1024, 1),
+        "pss_mb": round(fields["Pss"] / 1024, 1),
+        "shared_mb": round((fields["Shared_Clean"] + fields["Shared_Dirty"]) / 1024, 1),
+        "private_mb": round((fields["Private_Clean"] + fields["Private_Dirty"]) / 1024, 1),
+    }
+
+
+def disk_size_mb(path):
+    if not path or not os.path.exists(path):
+        return 0.0
+    if os.path.isfile(path):
+        return os.path.getsize(path) / (1024 * 1024)
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            total += os.path.getsize(os.path.join(root, name))
+    return total / (1024 * 1024)
+
+
+def preferred_variant(path):
+    """Return the int8-quantized sibling of a model file when one is installed.
+
+    e.g. ggml-base.bin -> ggml-base-q8_0.bin
+    """
+    root, ext = os.path.splitext(path)
+    for suffix in QUANTIZED_SUFFIXES:
+        candidate = root + suffix + ext
+        if os.path.exists(candidate):
+            return candidate
+    return path
+
+
+def pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+
+class ModelManager:
+    """Keeps loaded models under a shared RAM budget, unloading the least recently used.
+
+    Each app process has one manager. Managers publish what they hold to a small
+    registry file, so a process loading a model also counts what the others have
+    resident. When the total goes over budget, this process unloads its own least
+    recently used models that are not in use. Sizes are measured as the RSS growth
+    while loading and remembered by name, so the next load can make room first.
+
+    Models inherited across fork() (see model_host.py) are marked shared: their
+    pages belong to the parent, so the child neither counts nor unloads them.
+    """
+
+    def __init__(self, budget_mb=None, registry_path=RESIDENCY_PATH):
+        self.budget_mb = budget_mb if budget_mb is not None else default_budget_mb()
+        self.registry_path = registry_path
+        self.lock = threading.RLock()
+        self.models = OrderedDict()  # name -> {"model", "unload", "size_mb", "users"}
+        self.loading = {}            # name -> threading.Event
+        atexit.register(self.unregister)
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self.after_fork)
+
+    def after_fork(self):
+        self.lock = threading.RLock()
+        self.loading = {}
+        for entry in self.models.values():
+            entry["shared"] = True
+            entry["users"] = 0
+
+    @contextmanager
+    def use(self, name, loader, unload=None, path=None):
+        """Yield the named model, loading it with loader() if it is not resident.
+
+        The model cannot be unloaded while it is in use.
+        """
+        entry = self._acquire(name, loader, unload, path)
+        try:
+            yield entry["model"]
+        finally:
+            with self.lock:
+                entry["users"] -= 1
+
+    def get(self, name, loader, unload=None, path=None):
+        """Load (or touch) a model without holding it, e.g. to preload at startup."""
+        with self.use(name, loader, unload, path) as model:
+            return model
+
+    def _acquire(self, name, loader, unload, path):
+        while True:
+            with self.lock:
+                if name in self.models:
+                    entry = self.models[name]
+                    entry["users"] += 1
+                    self.models.move_to_end(name)
+                    return entry
+                event = self.loading.get(name)
+                if event is None:
+                    event = self.loading[name] = threading.Event()
+                    break
+            event.wait()  # Someone else is loading it
+
+        try:
+            expected = self.known_sizes().get(name) or disk_size_mb(path)
+            self.make_room(expected)
+
+            before = process_rss_mb()
+            started = time.monotonic()
+            model = loader()
+            measured = process_rss_mb() - before
+            size_mb = measured if measured > 1 else expected
+
+            entry = {"model": model, "unload": unload, "size_mb": size_mb, "users": 1, "shared": False}
+            with self.lock:
+                self.models[name] = entry
+            print(f"Loaded {name} ({size_mb:.0f} MB) in {time.monotonic() - started:.1f}s")
+            self.make_room(0)
+            self.publish()
+            return entry
+        finally:
+            with self.lock:
+                self.loading.pop(name).set()
+
+    def unload(self, name):
+        with self.lock:
+            entry = self.models.get(name)
+            if entry is None or entry["users"] > 0:
+                return False
+            del self.models[name]
+        if entry["unload"]:
+            try:
+                entry["unload"](entry["model"])
+            except Exception as e:
+                print(f"[!] Error unloading {name}: {e}")
+        entry["model"] = None
+        gc.collect()
+        print(f"Unloaded {name} ({entry['size_mb']:.0f} MB)")
+        return True
+
+    def make_room(self, needed_mb):
+        """Unload idle models, oldest first, until needed_mb more fits in the budget."""
+        while self.resident_mb() + self.others_mb() + needed_mb > self.budget_mb:
+            with self.lock:
+                idle = [name for name, entry in self.models.items() if entry["users"] == 0 and not entry["shared"]]
+            if not idle or not self.unload(idle[0]):
+                break
+        self.publish()
+
+    def resident_mb(self):
+        with self.lock:
+            return sum(entry["size_mb"] for entry in self.models.values() if not entry["shared"])
+
+    # ===============================
+    # SHARED REGISTRY
+    # ===============================
+
+    def read_registry(self):
+        try:
+            with open(self.registry_path, "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {"processes": {}, "sizes": {}}
+
+    def known_sizes(self):
+        return self.read_registry().get("sizes", {})
+
+    def others_mb(self):
+        processes = self.read_registry().get("processes", {})
+        return sum(
+            sum(info.get("models", {}).values())
+            for pid, info in processes.items()
+            if int(pid) != os.getpid() and pid_alive(int(pid))
+        )
+
+    def publish(self, remove=False):
+        # Last writer wins; a lost update is corrected on that process's next load
+        registry = self.read_registry()
+        processes = {
+            pid: info for pid, info in registry.get("processes", {}).items()
+            if int(pid) != os.getpid() and pid_alive(int(pid))
+        }
+        with self.lock:
+            models = {name: round(entry["size_mb"], 1) for name, entry in self.models.items() if not entry["shared"]}
+        sizes = registry.get("sizes", {})
+        sizes.update(models)
+        if models and not remove:
+            processes[str(os.getpid())] = {"models": models, "updated": time.time()}
+
+        try:
+            os.makedirs(os.path.dirname(self.registry_path), exist_ok=True)
+            tmp_path = f"{self.registry_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"budget_mb": round(self.budget_mb), "processes": processes, "sizes": sizes}, f, indent=2)
+            os.replace(tmp_path, self.registry_path)
+        except OSError as e:
+            print(f"[!] Could not update model registry: {e}")
+
+    def unregister(self):
+        self.publish(remove=True)
+
+
+models = ModelManager()
@@ -0,0 +1,203 @@
+import json
+import os
+import threading
+from collections import deque
+
+import argostranslate.package
+import argostranslate.translate
+
+from model_manager import models
+
+# ===============================
+# CONFIGURATION
+# ===============================
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Optional multilingual CTranslate2 model (e.g. NLLB-200 distilled, int8) that
+# translates any pair in one pass. Expected layout:
+#   Modes/Models/multilingual/model.bin, sentencepiece.model, languages.json
+MULTILINGUAL_DIR = os.path.join(BASE_DIR, "Models", "multilingual")
+
+# Language tokens used by NLLB-style models when languages.json is missing
+DEFAULT_LANGUAGE_TOKENS = {
+    "tl": "tgl_Latn",
+    "en": "eng_Latn",
+    "ja": "jpn_Jpan",
+    "ko": "kor_Hang",
+    "zh": "zho_Hans",
+}
+
+_lock = threading.Lock()
+_paths = {}
+
+
+class MultilingualModel:
+    """One CTranslate2 model that covers every language pair directly."""
+
+    def __init__(self, model_dir):
+        import ctranslate2
+        import sentencepiece
+
+        self.translator = ctranslate2.Translator(model_dir, device="cpu", compute_type="int8")
+        self.tokenizer = sentencepiece.SentencePieceProcessor(
+            model_file=os.path.join(model_dir, "sentencepiece.model")
+        )
+        languages_path = os.path.join(model_dir, "languages.json")
+        if os.path.exists(languages_path):
+            with open(languages_path, "r") as f:
+                self.language_tokens = json.load(f)
+        else:
+            self.language_tokens = DEFAULT_LANGUAGE_TOKENS
+
+    def translate(self, text, from_code, to_code):
+        tokens = [self.language_tokens[from_code]] + self.tokenizer.encode(text, out_type=str) + ["</s>"]
+        results = self.translator.translate_batch(
+            [tokens],
+            target_prefix=[[self.language_tokens[to_code]]],
+            beam_size=2,
+        )
+        output = results[0].hypotheses[0][1:]  # Drop the target language token
+        return self.tokenizer.decode(output)
+
+
+class TranslationPath:
+    """A chain of direct translation hops, e.g. tl -> ja or tl -> en -> ja."""
+
+    def __init__(self, codes, kind, hops):
+        self.codes = codes
+        self.kind = kind    # "direct", "multilingual" or "pivot"
+        self.hops = hops    # callables text -> text
+
+    def translate(self, text):
+        for hop in self.hops:
+            text = hop(text)
+        return text.strip()
+
+    def __repr__(self):
+        return f"{self.kind}:{'->'.join(self.codes)}"
+
+
+class ArgosModel:
+    """An installed Argos package loaded straight into CTranslate2 with int8 weights.
+
+    Argos' own loader keeps every model it has touched resident for the life of
+    the process; loading it ourselves lets the model manager unload it again.
+    """
+
+    def __init__(self, package_path):
+        import ctranslate2
+        import sentencepiece
+
+        self.translator = ctranslate2.Translator(
+            os.path.join(package_path, "model"), device="cpu", compute_type="int8"
+        )
+        self.tokenizer = sentencepiece.SentencePieceProcessor(
+            model_file=os.path.join(package_path, "sentencepiece.model")
+        )
+
+    def translate(self, text):
+        tokens = self.tokenizer.encode(text, out_type=str)
+        results = self.translator.translate_batch([tokens], beam_size=2)
+        return self.tokenizer.decode(results[0].hypotheses[0])
+
+
+def multilingual_installed():
+    return os.path.exists(os.path.join(MULTILINGUAL_DIR, "model.bin"))
+
+
+def multilingual_supports(from_code, to_code):
+    languages_path = os.path.join(MULTILINGUAL_DIR, "languages.json")
+    if os.path.exists(languages_path):
+        with open(languages_path, "r") as f:
+            language_tokens = json.load(f)
+    else:
+        language_tokens = DEFAULT_LANGUAGE_TOKENS
+    return from_code in language_tokens and to_code in language_tokens
+
+
+def multilingual_hop(from_code, to_code):
+    def hop(text):
+        with models.use("multilingual", lambda: MultilingualModel(MULTILINGUAL_DIR), path=MULTILINGUAL_DIR) as model:
+            return model.translate(text, from_code, to_code)
+    return hop
+
+
+def installed_packages():
+    return {(p.from_code, p.to_code): str(p.package_path) for p in argostranslate.package.get_installed_packages()}
+
+
+def installed_pairs():
+    """Directly installed Argos language pairs as {from_code: {to_code, ...}}."""
+    pairs = {}
+    for from_code, to_code in installed_packages():
+        pairs.setdefault(from_code, set()).add(to_code)
+    return pairs
+
+
+def shortest_codes(pairs, from_code, to_code):
+    """Breadth-first search over installed pairs; returns the language codes on the path."""
+    queue = deque([[from_code]])
+    seen = {from_code}
+    while queue:
+        codes = queue.popleft()
+        if codes[-1] == to_code:
+            return codes
+        for next_code in sorted(pairs.get(codes[-1], ())):
+            if next_code not in seen:
+                seen.add(next_code)
+                queue.append(codes + [next_code])
+    return None
+
+
+def argos_hop(from_code, to_code):
+    package_path = installed_packages()[(from_code, to_code)]
+    if not os.path.exists(os.path.join(package_path, "sentencepiece.model")):
+        # Older BPE packages: let Argos load them (kept resident, not managed)
+        languages = {lang.code: lang for lang in argostranslate.translate.get_installed_languages()}
+        return languages[from_code].get_translation(languages[to_code]).translate
+
+    def hop(text):
+        with models.use(f"argos:{from_code}->{to_code}", lambda: ArgosModel(package_path), path=package_path) as model:
+            return model.translate(text)
+    return hop
+
+
+def available_paths(from_code, to_code):
+    """Every way we can translate this pair offline, shortest first."""
+    paths = []
+    pairs = installed_pairs()
+
+    if to_code in pairs.get(from_code, ()):
+        paths.append(TranslationPath([from_code, to_code], "direct", [argos_hop(from_code, to_code)]))
+
+    if multilingual_installed() and multilingual_supports(from_code, to_code):
+        paths.append(TranslationPath([from_code, to_code], "multilingual", [multilingual_hop(from_code, to_code)]))
+
+    if from_code != "en" and to_code != "en" and "en" in pairs.get(from_code, ()) and to_code in pairs.get("en", ()):
+        paths.append(TranslationPath(
+            [from_code, "en", to_code], "pivot",
+            [argos_hop(from_code, "en"), argos_hop("en", to_code)]
+        ))
+
+    if not paths:
+        codes = shortest_codes(pairs, from_code, to_code)
+        if codes:
+            hops = [argos_hop(a, b) for a, b in zip(codes, codes[1:])]
+            paths.append(TranslationPath(codes, "pivot", hops))
+    return paths
+
+
+def get_path(from_code, to_code):
+    with _lock:
+        if (from_code, to_code) not in _paths:
+            paths = available_paths(from_code, to_code)
+            if not paths:
+                raise LookupError(f"No offline translation installed for {from_code} -> {to_code}")
+            _paths[(from_code, to_code)] = paths[0]
+            print(f"Offline translation {from_code}->{to_code} using {paths[0]}")
+        return _paths[(from_code, to_code)]
+
+
+def offline_translate(text, from_code, to_code):
+    return get_path(from_code, to_code).translate(text)
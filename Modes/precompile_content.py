@@ -0,0 +1,160 @@
+"""Build translations, romanizations and TTS audio for all learning content ahead of time.
+
+Usage:
+    python3 Modes/precompile_content.py [--workers N] [--languages ja ko zh] [--force] [--prune]
+
+Content is every drill word and phrase (Modes/Drills/randword.txt and
+randphrase.txt): the Filipino prompt's audio, plus its translation,
+romanization and audio in each language, which is what the drills read
+from the store. Items are spread over a process pool, one worker per core
+by default, and each result is written to the content store
+(content_store.py) as soon as it is done, so an interrupted run resumes
+where it stopped. Items are keyed by a hash of
+their text and direction: a rerun only builds what is new or changed, and
+--prune removes entries for content that no longer exists.
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from content_store import ContentStore, content_key, audio_path
+
+# ===============================
+# CONFIGURATION
+# ===============================
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DRILL_LISTS = [os.path.join(BASE_DIR, "Drills", name) for name in ("randword.txt", "randphrase.txt")]
+LANGUAGES = ["ja", "ko", "zh"]
+
+worker = None   # TranslatorWorker, imported in each pool process
+
+
+# ===============================
+# CONTENT
+# ===============================
+
+def drill_prompts():
+    prompts = []
+    for path in DRILL_LISTS:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f.read().splitlines():
+                # Extra "|"-separated fields are accepted answers ("ja=ichi"), not prompts
+                prompt = line.split("|")[0].strip()
+                if prompt and prompt not in prompts:
+                    prompts.append(prompt)
+    return prompts
+
+
+def collect_jobs(languages):
+    """(key, text, source, target) for everything the store should hold, without duplicates."""
+    jobs = {}
+
+    def add(text, source, target):
+        key = content_key(text, source, target)
+        jobs.setdefault(key, (key, text.strip(), source, target))
+
+    for prompt in drill_prompts():
+        add(prompt, "tl", "tl")
+        for lang in languages:
+            add(prompt, "tl", lang)
+    return list(jobs.values())
+
+
+# ===============================
+# WORKERS
+# ===============================
+
+def init_worker():
+    global worker
+    sys.path.append(os.path.join(BASE_DIR, "Translation"))
+    import TranslatorWorker
+    worker = TranslatorWorker
+    # Spans still go to the shared stats file, but not to the live GUI's event log
+    worker.timings.log = None
+
+
+def build_entry(job):
+    key, text, source, target = job
+    entry = {"key": key, "text": text, "source": source, "target": target,
+             "translation": None, "romanized": None, "audio": None, "error": None}
+    try:
+        spoken = text
+        if source != target:
+            spoken = worker.router.translate(text, source, target)
+            if not spoken or spoken.startswith("Argos chain failed"):
+                raise RuntimeError(spoken or "no translation")
+            entry["translation"] = spoken
+            entry["romanized"] = worker.romanize_translation(spoken, target)
+
+        path = audio_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp.wav"
+        try:
+            worker.SYNTHESIZERS[target](spoken, tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        entry["audio"] = path
+    except Exception as e:
+        entry["error"] = str(e)
+    return entry
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--languages", nargs="+", default=LANGUAGES, choices=LANGUAGES)
+    parser.add_argument("--force", action="store_true", help="Rebuild entries that are already complete")
+    parser.add_argument("--prune", action="store_true", help="Remove entries for content that no longer exists")
+    args = parser.parse_args()
+
+    store = ContentStore()
+    jobs = collect_jobs(args.languages)
+    if args.prune:
+        stale = store.keys() - {job[0] for job in jobs}
+        store.delete(stale)
+        print(f"🧹 Removed {len(stale)} stale entries")
+
+    done = set() if args.force else store.complete_keys()
+    pending = [job for job in jobs if job[0] not in done]
+    print(f"{len(jobs)} items, {len(jobs) - len(pending)} up to date, {len(pending)} to build "
+          f"on {args.workers} workers")
+    if not pending:
+        store.close()
+        return
+
+    started = time.perf_counter()
+    failed = 0
+    pool = ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker)
+    try:
+        futures = [pool.submit(build_entry, job) for job in pending]
+        for i, future in enumerate(as_completed(futures), start=1):
+            entry = future.result()
+            if entry["error"]:
+                failed += 1
+                print(f"[!] {entry['source']}->{entry['target']} {entry['text']}: {entry['error']}")
+                continue
+            # Only this process writes to the store; a finished item is never built again
+            store.put(entry["key"], entry["source"], entry["target"], entry["text"],
+                      entry["translation"], entry["romanized"], entry["audio"])
+            print(f"[{i}/{len(pending)}] {entry['source']}->{entry['target']} {entry['text']}")
+    except KeyboardInterrupt:
+        print("Interrupted; finished items are saved, rerun to continue.")
+        pool.shutdown(wait=False, cancel_futures=True)
+        store.close()
+        return
+    pool.shutdown()
+    store.close()
+
+    elapsed = time.perf_counter() - started
+    print(f"✅ {len(pending) - failed}/{len(pending)} built in {elapsed:.1f} s"
+          + (f", {failed} failed (rerun to retry)" if failed else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+import os
+import signal
+import subprocess
+import threading
+
+from event_log import EventTail
+
+# ===============================
+# CONFIGURATION
+# ===============================
+
+AUDIO_BLOCK = 0.05   # Seconds of audio per read/write, i.e. how quickly a stop is noticed
+CONTROL_POLL = 0.05
+
+
+class Cancelled(Exception):
+    """Raised inside a recording, recognition or playback stage once a stop was requested."""
+
+
+class StopSignal:
+    """Cooperative cancellation shared by every stage of a worker.
+
+    Stages record, play and run external tools (whisper-cli, open_jtalk, sox,
+    espeak-ng) through this object instead of sounddevice/subprocess directly.
+    request() then interrupts them mid-stream: audio streams are closed within
+    one block, child processes are killed and callbacks such as pyttsx3's
+    engine.stop run, so the audio device is free as soon as request() returns
+    and the stage unwinds with Cancelled.
+    """
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.lock = threading.Lock()
+        self.processes = set()
+        self.callbacks = []
+
+    def requested(self):
+        return self.event.is_set()
+
+    def check(self):
+        if self.event.is_set():
+            raise Cancelled()
+
+    def request(self):
+        self.event.set()
+        with self.lock:
+            processes = list(self.processes)
+            callbacks = list(self.callbacks)
+        for process in processes:
+            try:
+                process.kill()
+            except OSError:
+                pass
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"[!] Stop callback failed: {e}")
+
+    def reset(self):
+        self.event.clear()
+
+    def on_stop(self, callback):
+        with self.lock:
+            self.callbacks.append(callback)
+
+    def sleep(self, seconds):
+        if self.event.wait(seconds):
+            raise Cancelled()
+
+    def install_signal_handlers(self):
+        """Turn SIGTERM into a cooperative stop followed by a normal exit."""
+        def handle(signum, frame):
+            self.request()
+            raise SystemExit(0)
+        signal.signal(signal.SIGTERM, handle)
+
+    # ===============================
+    # INTERRUPTIBLE STAGES
+    # ===============================
+
+    def run(self, args, input=None, capture_output=False, text=False, check=False):
+        """subprocess.run() that is killed when a stop is requested."""
+        self.check()
+        pipe = subprocess.PIPE if capture_output else None
+        process = subprocess.Popen(
+            args, stdin=subprocess.PIPE if input is not None else None,
+            stdout=pipe, stderr=pipe, text=text
+        )
+        with self.lock:
+            self.processes.add(process)
+        try:
+            stdout, stderr = process.communicate(input)
+        finally:
+            with self.lock:
+                self.processes.discard(process)
+        self.check()
+        if check and process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, args, stdout, stderr)
+        return subprocess.CompletedProcess(args, process.returncode, stdout, stderr)
+
+    def record(self, duration, samplerate, on_block=None):
+        """Record int16 mono audio, shaped like sd.rec(); stops within one block.
+
+        Reads from the process's shared input stream (see audio_device.py), so
+        back-to-back recordings have no gap and the first one has pre-roll.
+        on_block(data) sees every block as it arrives, e.g. for streaming recognition.
+        """
+        import numpy as np
+        from audio_device import device
+
+        if samplerate != device.samplerate:
+            raise ValueError(f"The input stream runs at {device.samplerate} Hz, not {samplerate} Hz")
+        self.check()
+        remaining = int(duration * samplerate)
+        block = int(AUDIO_BLOCK * samplerate)
+        chunks = []
+        device.reader.begin()
+        while remaining > 0:
+            self.check()
+            data = device.reader.read(min(block, remaining)).reshape(-1, 1)
+            chunks.append(data)
+            if on_block:
+                on_block(data)
+            remaining -= len(data)
+        return np.concatenate(chunks)
+
+    def play(self, samples, samplerate):
+        """Play int16 mono audio on the shared output stream; stops within one block."""
+        from audio_device import device
+
+        self.check()
+        if len(samples) == 0:
+            return
+        block = int(AUDIO_BLOCK * samplerate)
+        for start in range(0, len(samples), block):
+            self.check()
+            stream = device.write(samples[start:start + block], samplerate)
+        # write() returns once the last block is queued; wait until it has been heard
+        self.sleep(stream.latency)
+
+    def play_file(self, path):
+        """Play a WAV file (e.g. from open_jtalk or espeak-ng) on the shared output stream."""
+        import soundfile as sf
+
+        samples, samplerate = sf.read(path, dtype="int16")
+        if samples.ndim > 1:
+            samples = samples[:, 0]
+        self.play(samples, samplerate)
+
+
+def watch_for_stop(log_path, stop_signal):
+    """Request a stop when a "control" event with command=stop for this process appears in the log."""
+    def watch():
+        tail = EventTail(log_path)
+        while not stop_signal.requested():
+            for event in tail.poll():
+                if event.get("type") == "control" and event.get("command") == "stop" \
+                        and event.get("target_pid") in (None, os.getpid()):
+                    stop_signal.request()
+                    return
+            stop_signal.event.wait(CONTROL_POLL)
+
+    thread = threading.Thread(target=watch, daemon=True)
+    thread.start()
+    return thread
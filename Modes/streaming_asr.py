@@ -0,0 +1,193 @@
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from collections import deque
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from model_manager import models
+
+# ===============================
+# CONFIGURATION
+# ===============================
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+VOSK_DIR = os.path.join(BASE_DIR, "Translation", "Vosk")
+VOSK_LANGUAGES = {"tl": "Filipino", "ja": "Japanese", "ko": "Korean", "zh": "Chinese"}
+
+PARTIAL_INTERVAL = 0.2   # Minimum seconds between interim hypotheses sent to the GUI
+
+# The drills grade with their own full pass (denoise + Vosk, whisper), so their live
+# preview decodes every answer twice; DRILL_PREVIEW=0 records without it on slow machines
+DRILL_PREVIEW = os.environ.get("DRILL_PREVIEW") != "0"
+
+# A word is stable once this many partials in a row agree on it (and everything before it)
+STABLE_PARTIALS = 3
+MIN_CLAUSE_WORDS = 3     # Never commit a clause shorter than this...
+MAX_CLAUSE_WORDS = 8     # ...and commit a long run of stable words even without a boundary
+
+# Words that start a new clause; Vosk emits no punctuation, so these mark the boundaries
+CLAUSE_MARKERS = {
+    "tl": {"at", "pero", "ngunit", "subalit", "kasi", "dahil", "kaya", "kung", "kapag",
+           "para", "habang", "saka", "tapos"},
+}
+
+
+def vosk_model_path(lang):
+    """Installed Vosk model for a language, e.g. Vosk/Filipino/vosk-model-tl-ph-generic-0.6, or None."""
+    language_dir = os.path.join(VOSK_DIR, VOSK_LANGUAGES.get(lang, ""))
+    if not os.path.isdir(language_dir):
+        return None
+    for name in sorted(os.listdir(language_dir)):
+        if name.startswith("vosk-model"):
+            return os.path.join(language_dir, name)
+    return None
+
+
+def load_vosk_model(path):
+    from vosk import Model
+    return Model(path)
+
+
+class StreamingRecognizer:
+    """Runs Vosk on audio blocks while they are still being recorded.
+
+    feed() only queues the block; a background thread decodes, so a slow
+    decode never makes the microphone stream overflow. on_partial(text) gets
+    the current hypothesis whenever it changes (at most every PARTIAL_INTERVAL
+    seconds). on_segment(text) gets each stretch of speech that will not
+    change any more, so it can be translated straight away: the rest of a
+    segment Vosk commits at a pause, and clauses committed mid-sentence once
+    the last STABLE_PARTIALS partials agree on them up to a clause boundary.
+    """
+
+    def __init__(self, model, samplerate, on_partial=None, on_segment=None, lang=None):
+        from vosk import KaldiRecognizer
+
+        self.recognizer = KaldiRecognizer(model, samplerate)
+        self.on_partial = on_partial
+        self.on_segment = on_segment
+        self.markers = CLAUSE_MARKERS.get(lang, set())
+        self.blocks = queue.Queue()
+        self.segments = []
+        self.partial = ""
+        self.history = deque(maxlen=STABLE_PARTIALS)
+        self.committed = 0  # Words of the current Vosk segment already passed to on_segment
+        self.last_published = ""
+        self.published_at = 0.0
+        self.thread = threading.Thread(target=self._decode_loop, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def feed(self, block):
+        self.blocks.put(block.tobytes())
+
+    def finish(self):
+        """Decode what is left and return the full transcript."""
+        self.blocks.put(None)
+        self.thread.join()
+        self._end_segment(json.loads(self.recognizer.FinalResult()).get("text", ""))
+        return self.text()
+
+    def text(self):
+        return " ".join(self.segments + [self.partial]).strip()
+
+    def _decode_loop(self):
+        while True:
+            data = self.blocks.get()
+            if data is None:
+                return
+            try:
+                if self.recognizer.AcceptWaveform(data):
+                    self._end_segment(json.loads(self.recognizer.Result()).get("text", ""))
+                    self._publish(force=True)
+                else:
+                    self._update_partial(json.loads(self.recognizer.PartialResult()).get("partial", "").split())
+                    self._publish()
+            except Exception as e:
+                print(f"[!] Streaming recognition failed: {e}")
+
+    def _update_partial(self, words):
+        self.history.append(words)
+        if len(self.history) == STABLE_PARTIALS:
+            stable = stable_prefix(self.history)
+            end = clause_end(stable, self.committed, self.markers)
+            if end:
+                self._commit(stable[self.committed:end])
+                self.committed = end
+        self.partial = " ".join(words[self.committed:])
+
+    def _end_segment(self, text):
+        # Vosk may still revise words at a pause; the words already committed are kept as they were
+        self._commit(text.split()[self.committed:])
+        self.committed = 0
+        self.history.clear()
+        self.partial = ""
+
+    def _commit(self, words):
+        if words:
+            text = " ".join(words)
+            self.segments.append(text)
+            if self.on_segment:
+                self.on_segment(text)
+
+    def _publish(self, force=False):
+        text = self.text()
+        now = time.monotonic()
+        if not self.on_partial or not text or text == self.last_published:
+            return
+        if not force and now - self.published_at < PARTIAL_INTERVAL:
+            return
+        self.last_published = text
+        self.published_at = now
+        self.on_partial(text)
+
+
+def stable_prefix(hypotheses):
+    """Words every hypothesis agrees on, from the start."""
+    prefix = []
+    for words in zip(*hypotheses):
+        if any(word != words[0] for word in words):
+            break
+        prefix.append(words[0])
+    return prefix
+
+
+def clause_end(words, start, markers):
+    """End of the last complete clause in words[start:], or None if there is none yet.
+
+    A clause ends right before a marker word, or after MAX_CLAUSE_WORDS stable words.
+    """
+    end = None
+    for i in range(start + MIN_CLAUSE_WORDS, len(words)):
+        if words[i] in markers:
+            end = i
+    if end is None and len(words) - start >= MAX_CLAUSE_WORDS:
+        end = len(words)
+    return end
+
+
+def record_streaming(stop_signal, duration, samplerate, lang, on_partial, on_segment=None, on_final=None):
+    """Record like stop_signal.record(), reporting interim hypotheses while the speaker talks.
+
+    on_final(text) gets the full transcript once recording ends. Falls back
+    to a plain recording, without calling on_final, when no Vosk model is
+    installed for lang or when there is nobody to report to.
+    """
+    path = vosk_model_path(lang)
+    if path is None or not (on_partial or on_segment or on_final):
+        return stop_signal.record(duration, samplerate)
+
+    with models.use(f"vosk:{lang}", lambda: load_vosk_model(path), path=path) as model:
+        stream = StreamingRecognizer(model, samplerate, on_partial, on_segment, lang).start()
+        try:
+            return stop_signal.record(duration, samplerate, on_block=stream.feed)
+        finally:
+            text = stream.finish()
+            if on_final:
+                on_final(text)
@@ -0,0 +1,108 @@
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# ===============================
+# CONFIGURATION
+# ===============================
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATS_PATH = os.path.join(BASE_DIR, "logs", "stage_timings.json")
+
+SAMPLES_KEPT = 50          # Rolling window per stage
+STATS_SAVE_INTERVAL = 2.0  # Seconds between writes of the stats file
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def read_stats(stats_path=STATS_PATH):
+    try:
+        with open(stats_path, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+class Timings:
+    """Times the stages of a worker (denoise, vosk, whisper, google, argos, tts, ...).
+
+    Each finished span is appended to the worker's event log as a "span"
+    event and added to a rolling window per stage. Last/p50/p95 per stage go
+    to a small stats file shared by all app processes, keyed
+    "<component>/<stage>", which the GUI's debug overlay shows. Spans that
+    raise (e.g. cancelled by a stop) are not recorded.
+    """
+
+    def __init__(self, component, log=None, stats_path=STATS_PATH):
+        self.component = component
+        self.log = log
+        self.stats_path = stats_path
+        self.lock = threading.Lock()
+        self.samples = {}   # stage -> deque of ms
+        self.counts = {}
+        self.last_saved = 0.0
+        atexit.register(self.save_stats, force=True)
+
+    @contextmanager
+    def span(self, stage, **fields):
+        started = time.perf_counter()
+        yield
+        self.record(stage, time.perf_counter() - started, **fields)
+
+    def timed(self, stage):
+        """Decorator form of span()."""
+        def decorate(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.span(stage):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def record(self, stage, seconds, **fields):
+        ms = round(seconds * 1000, 1)
+        with self.lock:
+            self.samples.setdefault(stage, deque(maxlen=SAMPLES_KEPT)).append(ms)
+            self.counts[stage] = self.counts.get(stage, 0) + 1
+        if self.log:
+            self.log.append("span", component=self.component, stage=stage, ms=ms, **fields)
+        self.save_stats()
+
+    def save_stats(self, force=False):
+        now = time.monotonic()
+        if not force and now - self.last_saved < STATS_SAVE_INTERVAL:
+            return
+        self.last_saved = now
+        with self.lock:
+            ours = {
+                f"{self.component}/{stage}": {
+                    "last_ms": samples[-1],
+                    "p50_ms": percentile(samples, 0.5),
+                    "p95_ms": percentile(samples, 0.95),
+                    "count": self.counts[stage],
+                    "updated": time.time(),
+                }
+                for stage, samples in self.samples.items()
+            }
+        if not ours:
+            return
+
+        # Other processes' stages are kept; last writer wins for our own
+        stats = read_stats(self.stats_path)
+        stats.update(ours)
+        try:
+            os.makedirs(os.path.dirname(self.stats_path), exist_ok=True)
+            tmp_path = f"{self.stats_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(stats, f, indent=2)
+            os.replace(tmp_path, self.stats_path)
+        except OSError as e:
+            print(f"[!] Could not save stage timings: {e}")
@@ -0,0 +1,211 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+# ===============================
+# CONFIGURATION
+# ===============================
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATS_PATH = os.path.join(BASE_DIR, "logs", "translation_router_stats.json")
+
+LATENCY_BUDGET = 4.0      # Every engine is racing by this point
+HARD_TIMEOUT = 20.0       # Give up entirely after this long
+MIN_HEDGE_DELAY = 0.3     # Never start the backup engine sooner than this...
+MAX_HEDGE_DELAY = 1.5     # ...or later than this
+SAMPLES_KEPT = 50
+CACHE_SIZE = 256          # Recent translations kept, so re-translating a clause costs nothing
+STATS_SAVE_INTERVAL = 10.0
+
+
+def is_acceptable(result):
+    return bool(result) and not result.startswith("Argos chain failed")
+
+
+class EngineStats:
+    def __init__(self, samples=None, successes=0, failures=0, cancelled=0):
+        self.samples = deque(samples or [], maxlen=SAMPLES_KEPT)
+        self.recent = deque(maxlen=SAMPLES_KEPT)  # Recent outcomes, so old outages stop counting
+        self.successes = successes
+        self.failures = failures
+        self.cancelled = cancelled
+
+    def record(self, latency, ok):
+        self.samples.append(latency)
+        self.recent.append(ok)
+        if ok:
+            self.successes += 1
+        else:
+            self.failures += 1
+
+    def percentile(self, fraction):
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def failure_rate(self):
+        if not self.recent:
+            return 0.0
+        return self.recent.count(False) / len(self.recent)
+
+    def to_dict(self):
+        return {
+            "samples": list(self.samples),
+            "successes": self.successes,
+            "failures": self.failures,
+            "cancelled": self.cancelled,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+        }
+
+
+class TranslationRouter:
+    """Races translation engines and returns the first acceptable result.
+
+    Engines are tried in order of preference. The first one starts right away;
+    the others are started as a hedge once the preferred engine has taken longer
+    than its own recent p90 latency (or immediately if it has been failing).
+    Losing engines are cancelled if they have not started yet; ones that are
+    already running cannot be interrupted, so their results are simply dropped.
+
+    Acceptable results are cached by text and arguments, so the same clause
+    translated again (e.g. once mid-utterance and again in the final
+    transcript) is answered without running any engine.
+    """
+
+    def __init__(self, engines, budget=LATENCY_BUDGET, stats_path=STATS_PATH):
+        self.engines = engines  # list of (name, fn(text, *args) -> str)
+        self.budget = budget
+        self.stats_path = stats_path
+        self.executor = ThreadPoolExecutor(max_workers=len(engines) * 2)
+        self.lock = threading.Lock()
+        self.stats = {name: EngineStats() for name, _ in engines}
+        self.last_saved = 0.0
+        self.cache = OrderedDict()
+        self.load_stats()
+
+    def translate(self, text, *args):
+        key = (text.strip(), *args)
+        with self.lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                return self.cache[key]
+
+        result = self._race(text, *args)
+        if is_acceptable(result):
+            with self.lock:
+                self.cache[key] = result
+                if len(self.cache) > CACHE_SIZE:
+                    self.cache.popitem(last=False)
+        return result
+
+    def _race(self, text, *args):
+        started = time.monotonic()
+        pending = {}
+        last_result = ""
+
+        def launch(name, fn):
+            future = self.executor.submit(self._timed, name, fn, text, *args)
+            pending[future] = name
+
+        order = self.engines
+        launch(*order[0])
+        backups = list(order[1:])
+        hedge_at = started + self.hedge_delay(order[0][0])
+
+        while pending or backups:
+            now = time.monotonic()
+            if backups and (now >= hedge_at or not pending):
+                for engine in backups:
+                    launch(*engine)
+                backups = []
+
+            if not pending:
+                break
+
+            wait_until = hedge_at if backups else started + HARD_TIMEOUT
+            done, _ = wait(list(pending), timeout=max(0.0, wait_until - now), return_when=FIRST_COMPLETED)
+
+            for future in done:
+                name = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"⚠️ {name} translation error: {e}")
+                    continue
+                last_result = result or last_result
+                if is_acceptable(result):
+                    self._cancel(pending)
+                    self.save_stats()
+                    return result.strip()
+
+            if time.monotonic() - started > HARD_TIMEOUT:
+                self._cancel(pending)
+                break
+
+        self.save_stats()
+        return last_result
+
+    def hedge_delay(self, name):
+        stats = self.stats[name]
+        if stats.failure_rate() > 0.5:
+            return 0.0
+        p90 = stats.percentile(0.9)
+        if p90 is None:
+            return MIN_HEDGE_DELAY
+        return max(MIN_HEDGE_DELAY, min(MAX_HEDGE_DELAY, p90, self.budget))
+
+    def _timed(self, name, fn, text, *args):
+        started = time.monotonic()
+        ok = False
+        try:
+            result = fn(text, *args)
+            ok = is_acceptable(result)
+            return result
+        finally:
+            with self.lock:
+                self.stats[name].record(time.monotonic() - started, ok)
+
+    def _cancel(self, pending):
+        for future, name in pending.items():
+            if future.cancel():
+                with self.lock:
+                    self.stats[name].cancelled += 1
+
+    # ===============================
+    # STATS PERSISTENCE
+    # ===============================
+
+    def load_stats(self):
+        try:
+            with open(self.stats_path, "r") as f:
+                saved = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        for name, data in saved.items():
+            if name in self.stats:
+                self.stats[name] = EngineStats(
+                    data.get("samples"), data.get("successes", 0),
+                    data.get("failures", 0), data.get("cancelled", 0)
+                )
+
+    def save_stats(self, force=False):
+        now = time.monotonic()
+        if not force and now - self.last_saved < STATS_SAVE_INTERVAL:
+            return
+        self.last_saved = now
+        with self.lock:
+            data = {name: stats.to_dict() for name, stats in self.stats.items()}
+        try:
+            os.makedirs(os.path.dirname(self.stats_path), exist_ok=True)
+            # Drills, the worker and batch runs all save here; each writes its own temp file
+            tmp_path = f"{self.stats_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.stats_path)
+        except OSError as e:
+            print(f"[!] Could not save translation stats: {e}")
@@ -0,0 +1,147 @@
+import atexit
+import json
+import os
+import time
+
+# ===============================
+# CONFIGURATION
+# ===============================
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SUMMARY_PATH = os.path.join(BASE_DIR, "logs", "ui_watchdog.json")
+
+HEARTBEAT_MS = 100     # How often the event loop is asked to run the lag probe
+DEFAULT_THRESHOLD_MS = 50
+TOP_SHOWN = 10
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def scheduled_call(callit):
+    """The (func, args) that tkinter's after() wrapper will call, read from its closure."""
+    cells = dict(zip(callit.__code__.co_freevars, callit.__closure__ or ()))
+    func = cells["func"].cell_contents if "func" in cells else callit
+    args = cells["args"].cell_contents if "args" in cells else ()
+    return func, args
+
+
+def callback_name(widget, func):
+    """e.g. JapTranslate.check_translator_output for self.every(250, self.check_translator_output)."""
+    args = ()
+    if getattr(func, "__qualname__", "").endswith("after.<locals>.callit"):
+        func, args = scheduled_call(func)
+    # UITimers runs every periodic callback through _tick(timer); name the callback itself
+    if args and isinstance(args[0], dict) and callable(args[0].get("callback")):
+        func = args[0]["callback"]
+    owner = getattr(func, "__self__", None)
+    if owner is not None:
+        return f"{type(owner).__name__}.{func.__name__}"
+    return getattr(func, "__qualname__", None) or f"{type(widget).__name__}.{type(func).__name__}"
+
+
+class UIWatchdog:
+    """Measures how long the Tk main loop is blocked, and by what.
+
+    Every Python callback Tk runs (after() timers, bindings, button commands)
+    is timed; one taking longer than threshold_ms is reported as it happens,
+    named by frame class and method. A heartbeat scheduled every HEARTBEAT_MS
+    measures event-loop lag, i.e. how late Tk gets round to anything at all.
+    Given the GUI's UITimers, the heartbeat runs as one of them, so it stops
+    with the others while they are suspended. A summary goes to
+    Modes/logs/ui_watchdog.json and stdout at exit.
+    """
+
+    def __init__(self, threshold_ms=DEFAULT_THRESHOLD_MS, summary_path=SUMMARY_PATH):
+        self.threshold_ms = threshold_ms
+        self.summary_path = summary_path
+        self.callbacks = {}   # name -> {"calls", "total_ms", "max_ms", "slow"}
+        self.lags = []
+        self.root = None
+        self.timers = None
+        self.expected = None
+        self.started = time.monotonic()
+
+    def install(self, root, timers=None):
+        import tkinter
+
+        self.root = root
+        self.timers = timers
+        original_call = tkinter.CallWrapper.__call__
+        watchdog = self
+
+        def timed_call(wrapper, *args):
+            started = time.perf_counter()
+            try:
+                return original_call(wrapper, *args)
+            finally:
+                watchdog.record(callback_name(wrapper.widget, wrapper.func), time.perf_counter() - started)
+
+        tkinter.CallWrapper.__call__ = timed_call
+        atexit.register(self.write_summary)
+        if timers is not None:
+            timers.every(root, HEARTBEAT_MS, self.heartbeat)
+        else:
+            self.heartbeat()
+        print(f"UI watchdog on, reporting callbacks over {self.threshold_ms} ms")
+
+    def heartbeat(self):
+        now = time.monotonic()
+        # A beat due before the timers were last resumed was suspended, not late
+        resumed_at = getattr(self.timers, "resumed_at", 0.0)
+        if self.expected is not None and self.expected > resumed_at:
+            self.lags.append(max(0.0, (now - self.expected) * 1000))
+        self.expected = now + HEARTBEAT_MS / 1000
+        if self.timers is None:
+            self.root.after(HEARTBEAT_MS, self.heartbeat)
+
+    def record(self, name, seconds):
+        ms = seconds * 1000
+        stats = self.callbacks.setdefault(name, {"calls": 0, "total_ms": 0.0, "max_ms": 0.0, "slow": 0})
+        stats["calls"] += 1
+        stats["total_ms"] += ms
+        stats["max_ms"] = max(stats["max_ms"], ms)
+        if ms > self.threshold_ms:
+            stats["slow"] += 1
+            print(f"[!] UI blocked {ms:.0f} ms in {name}")
+
+    def summary(self):
+        callbacks = sorted(self.callbacks.items(), key=lambda item: item[1]["max_ms"], reverse=True)
+        return {
+            "seconds": round(time.monotonic() - self.started, 1),
+            "threshold_ms": self.threshold_ms,
+            "lag_p50_ms": round(percentile(self.lags, 0.5), 1) if self.lags else None,
+            "lag_p95_ms": round(percentile(self.lags, 0.95), 1) if self.lags else None,
+            "lag_max_ms": round(max(self.lags), 1) if self.lags else None,
+            "callbacks": [
+                {"name": name, "calls": s["calls"], "slow": s["slow"],
+                 "mean_ms": round(s["total_ms"] / s["calls"], 1), "max_ms": round(s["max_ms"], 1)}
+                for name, s in callbacks
+            ],
+        }
+
+    def write_summary(self):
+        summary = self.summary()
+        try:
+            os.makedirs(os.path.dirname(self.summary_path), exist_ok=True)
+            with open(self.summary_path, "w") as f:
+                json.dump(summary, f, indent=2)
+        except OSError as e:
+            print(f"[!] Could not write UI watchdog summary: {e}")
+
+        print(f"UI watchdog: event-loop lag p50 {summary['lag_p50_ms']} ms, p95 {summary['lag_p95_ms']} ms, "
+              f"max {summary['lag_max_ms']} ms over {summary['seconds']} s")
+        for entry in summary["callbacks"][:TOP_SHOWN]:
+            print(f"  {entry['name']:<48} max {entry['max_ms']:>7} ms  mean {entry['mean_ms']:>6} ms  "
+                  f"{entry['slow']}/{entry['calls']} slow")
+
+
+def install_from_env(root, timers=None):
+    """Install the watchdog when UI_WATCHDOG=1; UI_WATCHDOG_MS sets the threshold."""
+    if os.environ.get("UI_WATCHDOG") != "1":
+        return None
+    watchdog = UIWatchdog(float(os.environ.get("UI_WATCHDOG_MS", DEFAULT_THRESHOLD_MS)))
+    watchdog.install(root, timers)
+    return watchdog
@@ -0,0 +1,147 @@
+import getpass
+import mmap
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from event_log import EventLog, SYSTEM_LOG
+from model_manager import models, preferred_variant
+
+# ===============================
+# CONFIGURATION
+# ===============================
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+USER = getpass.getuser()
+
+VOSK_MODEL_PATH = os.path.join(BASE_DIR, "Translation", "Vosk", "Filipino", "vosk-model-tl-ph-generic-0.6")
+WHISPER_BIN = os.path.join("/", "home", USER, "whisper.cpp", "build", "bin", "whisper-cli")
+WHISPER_MODEL_PATH = preferred_variant(os.path.join("/", "home", USER, "whisper.cpp", "models", "ggml-base.bin"))
+
+WARMUP_PAIRS = [("tl", "ja"), ("tl", "ko"), ("tl", "zh"), ("ja", "tl"), ("ko", "tl"), ("zh", "tl")]
+WARMUP_TEXT = {"tl": "Magandang umaga", "ja": "おはよう", "ko": "안녕하세요", "zh": "你好"}
+SAMPLERATE = 16000
+SILENCE = bytes(SAMPLERATE * 2)  # One second of 16-bit mono silence
+
+system_log = EventLog(SYSTEM_LOG)
+
+
+# ===============================
+# PAGE CACHE
+# ===============================
+
+def touch_pages(path):
+    """Map every file under path and read one byte per page so it sits in the page cache.
+
+    Later loads (in this or any other process) then read from RAM instead of the SD card.
+    """
+    files = [path] if os.path.isfile(path) else [
+        os.path.join(root, name) for root, _, names in os.walk(path) for name in names
+    ]
+    touched = 0
+    for file_path in files:
+        size = os.path.getsize(file_path)
+        if size == 0:
+            continue
+        with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mapped, "madvise"):
+                mapped.madvise(mmap.MADV_WILLNEED)
+            for offset in range(0, size, mmap.PAGESIZE):
+                mapped[offset]
+        touched += size
+    return touched
+
+
+# ===============================
+# DUMMY INFERENCE
+# ===============================
+
+def warm_recognizer(model):
+    """Run one second of silence through a Vosk model to initialise its decoder."""
+    from vosk import KaldiRecognizer
+
+    recognizer = KaldiRecognizer(model, SAMPLERATE)
+    recognizer.AcceptWaveform(SILENCE)
+    recognizer.FinalResult()
+
+
+def warm_whisper(model_path=WHISPER_MODEL_PATH, lang="ja"):
+    with tempfile.NamedTemporaryFile(suffix=".wav") as tmp_wav:
+        with wave.open(tmp_wav.name, "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(SAMPLERATE)
+            wf.writeframes(SILENCE)
+        subprocess.run(
+            [WHISPER_BIN, "-m", model_path, "-l", lang, "--no-timestamps", "-f", tmp_wav.name],
+            capture_output=True, text=True, timeout=120
+        )
+
+
+def warm_translation(from_code, to_code):
+    """Translate a short phrase offline so the CTranslate2 model is loaded and initialised."""
+    from offline_translation import offline_translate
+
+    try:
+        offline_translate(WARMUP_TEXT[from_code], from_code, to_code)
+    except Exception as e:
+        print(f"[!] Warm-up of {from_code}->{to_code} failed: {e}")
+
+
+# ===============================
+# BOOT-TIME SERVICE
+# ===============================
+
+def warmup_steps():
+    steps = []
+    if os.path.exists(VOSK_MODEL_PATH):
+        def vosk_step():
+            from vosk import Model
+            touch_pages(VOSK_MODEL_PATH)
+            # Already resident when running inside the model host
+            warm_recognizer(models.get("vosk:tl", lambda: Model(VOSK_MODEL_PATH), path=VOSK_MODEL_PATH))
+        steps.append(("vosk", vosk_step))
+
+    if os.path.exists(WHISPER_MODEL_PATH) and os.path.exists(WHISPER_BIN):
+        def whisper_step():
+            touch_pages(WHISPER_MODEL_PATH)
+            warm_whisper()
+        steps.append(("whisper", whisper_step))
+
+    try:
+        from offline_translation import available_paths
+        for from_code, to_code in WARMUP_PAIRS:
+            paths = available_paths(from_code, to_code)
+            if paths:
+                steps.append((f"argos:{from_code}->{to_code}", lambda path=paths[0]: path.translate(WARMUP_TEXT[path.codes[0]])))
+    except Exception as e:
+        print(f"[!] Could not list offline translation models: {e}")
+    return steps
+
+
+def run_warmup():
+    steps = warmup_steps()
+    system_log.append("warmup", state="started", models=[name for name, _ in steps])
+
+    ready, failed = [], []
+    for name, step in steps:
+        started = time.monotonic()
+        try:
+            step()
+            ready.append(name)
+            system_log.append("warmup", state="ready", model=name, seconds=round(time.monotonic() - started, 2))
+        except Exception as e:
+            failed.append(name)
+            print(f"[!] Warm-up of {name} failed: {e}")
+            system_log.append("warmup", state="failed", model=name, error=str(e))
+
+    system_log.append("warmup", state="done", ready=ready, failed=failed)
+
+
+if __name__ == "__main__":
+    run_warmup()
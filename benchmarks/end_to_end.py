@@ -0,0 +1,214 @@
+"""Time the translator end to end on recorded WAV fixtures instead of a live microphone.
+
+Usage:
+    python3 benchmarks/end_to_end.py [--directions tl-ja ja-tl ...] [--fixtures DIR] [--repeat N]
+                                     [--engines google argos] [--output results.json]
+                                     [--baseline results.json] [--tolerance 0.25]
+    python3 benchmarks/end_to_end.py --make-fixtures [--limit 10]
+
+Fixtures are 16 kHz mono WAVs under <fixtures>/<source language>/, e.g.
+benchmarks/fixtures/tl/kumusta.wav, each optionally with a .txt holding what is said.
+--make-fixtures renders them with gTTS from the drill word lists (needs internet).
+
+Each fixture goes through the same stages as the translation worker:
+transcribe -> translate -> romanize -> TTS synthesis, with playback stubbed out.
+Wall time (p50/p95) and CPU time (this process and its children, e.g.
+whisper-cli and open_jtalk) are reported per stage and direction. With
+--baseline, a stage whose p95 grew by more than --tolerance exits with status 1.
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT_DIR, "Modes"))
+sys.path.append(os.path.join(ROOT_DIR, "Modes", "Translation"))
+
+DRILLS_DIR = os.path.join(ROOT_DIR, "Modes", "Drills")
+FIXTURES_DIR = os.path.join(ROOT_DIR, "benchmarks", "fixtures")
+WORD_LISTS = ["randword.txt", "randphrase.txt"]
+DIRECTIONS = ["tl-ja", "tl-ko", "tl-zh", "ja-tl", "ko-tl", "zh-tl"]
+STAGES = ["transcribe", "translate", "romanize", "tts"]
+GTTS_CODES = {"zh": "zh-CN"}
+SAMPLERATE = 16000
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def cpu_seconds():
+    """CPU time of this process (all threads) plus its finished children."""
+    times = os.times()
+    return time.process_time() + times.children_user + times.children_system
+
+
+def load_fixtures(fixtures_dir, lang):
+    import numpy as np
+    import soundfile as sf
+
+    lang_dir = os.path.join(fixtures_dir, lang)
+    if not os.path.isdir(lang_dir):
+        return []
+    fixtures = []
+    for name in sorted(os.listdir(lang_dir)):
+        if not name.endswith(".wav"):
+            continue
+        audio, samplerate = sf.read(os.path.join(lang_dir, name), dtype="int16")
+        if audio.ndim > 1:
+            audio = audio[:, 0]
+        if samplerate != SAMPLERATE:
+            positions = np.arange(0, len(audio), samplerate / SAMPLERATE)
+            audio = np.interp(positions, np.arange(len(audio)), audio).astype(np.int16)
+        fixtures.append((name, audio.reshape(-1, 1)))  # Shaped like a recording
+    return fixtures
+
+
+def load_items(limit):
+    items = []
+    for name in WORD_LISTS:
+        with open(os.path.join(DRILLS_DIR, name), "r", encoding="utf-8") as f:
+            for line in f.read().splitlines():
+                text = line.split("|")[0].strip()
+                if text and text not in items:
+                    items.append(text)
+    return items[:limit]
+
+
+def make_fixtures(router, fixtures_dir, limit):
+    """Render the drill items, and their translations, as speech fixtures for every source language."""
+    import numpy as np
+    import soundfile as sf
+    from gtts import gTTS
+    from pydub import AudioSegment
+
+    items = load_items(limit)
+    for lang in sorted({direction.split("-")[0] for direction in DIRECTIONS}):
+        lang_dir = os.path.join(fixtures_dir, lang)
+        os.makedirs(lang_dir, exist_ok=True)
+        for i, item in enumerate(items, start=1):
+            text = item if lang == "tl" else router.translate(item, "tl", lang)
+            audio_bytes = io.BytesIO()
+            gTTS(text=text, lang=GTTS_CODES.get(lang, lang)).write_to_fp(audio_bytes)
+            audio_bytes.seek(0)
+            audio = AudioSegment.from_file(audio_bytes, format="mp3").set_frame_rate(SAMPLERATE).set_channels(1)
+            base = os.path.join(lang_dir, f"{i:03d}")
+            sf.write(base + ".wav", np.array(audio.get_array_of_samples(), dtype=np.int16), SAMPLERATE)
+            with open(base + ".txt", "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+            print(f"{lang}  {base}.wav  {text}")
+
+
+def bench_direction(worker, router, direction, fixtures, repeat):
+    source, target = direction.split("-")
+    route = worker.Direction(source, target)
+    timings = {stage: {"wall": [], "cpu": []} for stage in STAGES}
+
+    def timed(stage, fn, *args):
+        started, started_cpu = time.perf_counter(), cpu_seconds()
+        result = fn(*args)
+        timings[stage]["wall"].append(time.perf_counter() - started)
+        timings[stage]["cpu"].append(cpu_seconds() - started_cpu)
+        return result
+
+    route.warm_up()
+    for _ in range(repeat):
+        router.cache.clear()  # Every run pays for its translations
+        for name, audio in fixtures:
+            transcription = timed("transcribe", route.transcribe, audio.copy())
+            if not transcription:
+                print(f"[!] {direction} {name}: nothing recognized")
+                continue
+            translated = timed("translate", router.translate, transcription, source, target)
+            timed("romanize", worker.romanize_translation, translated, target)
+            timed("tts", worker.SPEAKERS[target], translated)
+
+    results = []
+    for stage in STAGES:
+        wall, cpu = timings[stage]["wall"], timings[stage]["cpu"]
+        if not wall:
+            continue
+        results.append({
+            "direction": direction,
+            "stage": stage,
+            "runs": len(wall),
+            "p50_ms": round(percentile(wall, 0.5) * 1000, 1),
+            "p95_ms": round(percentile(wall, 0.95) * 1000, 1),
+            "cpu_ms": round(sum(cpu) / len(cpu) * 1000, 1),
+        })
+    return results
+
+
+def regressions(results, baseline_path, tolerance):
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {(r["direction"], r["stage"]): r for r in json.load(f)}
+    found = []
+    for result in results:
+        before = baseline.get((result["direction"], result["stage"]))
+        if before and result["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+            found.append(f"{result['direction']} {result['stage']}: p95 {before['p95_ms']} -> {result['p95_ms']} ms")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--directions", nargs="+", default=DIRECTIONS)
+    parser.add_argument("--fixtures", default=FIXTURES_DIR)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--engines", nargs="+", default=["google", "argos"])
+    parser.add_argument("--output")
+    parser.add_argument("--baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--make-fixtures", action="store_true")
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    import TranslatorWorker as worker
+    from translation_router import TranslationRouter
+
+    # Spans still go to the shared stats file, but not to the live GUI's event log
+    worker.timings.log = None
+
+    # A private router, so the benchmark neither uses nor skews the live hedge statistics
+    engines = {"google": worker.google_translate, "argos": worker.argos_translate_chain}
+    stats_path = os.path.join(tempfile.mkdtemp(), "router_stats.json")
+    router = TranslationRouter([(name, engines[name]) for name in args.engines], stats_path=stats_path)
+
+    if args.make_fixtures:
+        make_fixtures(router, args.fixtures, args.limit)
+        return
+
+    # Playback is stubbed: TTS still renders (gTTS fetch, open_jtalk, espeak-ng), nothing is heard
+    worker.stop_signal.play = lambda samples, samplerate: None
+    worker.stop_signal.play_file = lambda path: None
+
+    results = []
+    for direction in args.directions:
+        fixtures = load_fixtures(args.fixtures, direction.split("-")[0])
+        if not fixtures:
+            print(f"[!] No fixtures for {direction} in {args.fixtures}")
+            continue
+        for result in bench_direction(worker, router, direction, fixtures, args.repeat):
+            results.append(result)
+            print(f"{direction}  {result['stage']:<10} p50 {result['p50_ms']:>8} ms  p95 {result['p95_ms']:>8} ms  "
+                  f"cpu {result['cpu_ms']:>8} ms  ({result['runs']} runs)")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        found = regressions(results, args.baseline, args.tolerance)
+        for line in found:
+            print(f"[!] Regression: {line}")
+        if found:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
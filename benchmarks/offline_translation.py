@@ -0,0 +1,131 @@
+"""Compare pivot (tl -> en -> xx) and direct offline translation on the drill word lists.
+
+Usage:
+    python3 benchmarks/offline_translation.py [--langs ja ko zh] [--references refs.jsonl] [--output results.json]
+
+refs.jsonl holds one {"text": ..., "lang": ..., "translation": ...} object per line.
+Without references, quality is reported as chrF agreement with the pivot output.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT_DIR, "Modes"))
+
+from offline_translation import available_paths
+
+DRILLS_DIR = os.path.join(ROOT_DIR, "Modes", "Drills")
+WORD_LISTS = ["randword.txt", "randphrase.txt"]
+
+
+def load_items():
+    items = []
+    for name in WORD_LISTS:
+        with open(os.path.join(DRILLS_DIR, name), "r", encoding="utf-8") as f:
+            for line in f.read().splitlines():
+                text = line.split("|")[0].strip()
+                if text and text not in items:
+                    items.append(text)
+    return items
+
+
+def load_references(path):
+    references = {}
+    if path:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                entry = json.loads(line)
+                references[(entry["text"], entry["lang"])] = entry["translation"]
+    return references
+
+
+def char_ngrams(text, n):
+    text = "".join(text.split())
+    return Counter(text[i:i + n] for i in range(len(text) - n + 1))
+
+
+def chrf(hypothesis, reference, max_n=6, beta=2.0):
+    """Character n-gram F-score (chrF), 0-100."""
+    precisions, recalls = [], []
+    for n in range(1, max_n + 1):
+        hyp, ref = char_ngrams(hypothesis, n), char_ngrams(reference, n)
+        if not hyp or not ref:
+            continue
+        overlap = sum((hyp & ref).values())
+        precisions.append(overlap / sum(hyp.values()))
+        recalls.append(overlap / sum(ref.values()))
+    if not precisions:
+        return 0.0
+    precision = sum(precisions) / len(precisions)
+    recall = sum(recalls) / len(recalls)
+    if precision + recall == 0:
+        return 0.0
+    return 100 * (1 + beta ** 2) * precision * recall / (beta ** 2 * precision + recall)
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def bench_path(path, items):
+    path.translate(items[0])  # Warm-up: model load and first allocation
+    outputs, latencies = {}, []
+    for text in items:
+        started = time.perf_counter()
+        outputs[text] = path.translate(text)
+        latencies.append(time.perf_counter() - started)
+    return outputs, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--langs", nargs="+", default=["ja", "ko", "zh"])
+    parser.add_argument("--references")
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    items = load_items()
+    references = load_references(args.references)
+    results = []
+
+    for lang in args.langs:
+        paths = available_paths("tl", lang)
+        if not paths:
+            print(f"[!] No offline models installed for tl -> {lang}")
+            continue
+
+        runs = {repr(path): bench_path(path, items) for path in paths}
+        pivot_outputs = next((outputs for name, (outputs, _) in runs.items() if name.startswith("pivot")), None)
+
+        for name, (outputs, latencies) in runs.items():
+            scores = []
+            for text, output in outputs.items():
+                reference = references.get((text, lang)) or (pivot_outputs or {}).get(text)
+                if reference is not None:
+                    scores.append(chrf(output, reference))
+            result = {
+                "lang": lang,
+                "path": name,
+                "items": len(items),
+                "p50_ms": round(percentile(latencies, 0.5) * 1000, 1),
+                "p95_ms": round(percentile(latencies, 0.95) * 1000, 1),
+                "total_s": round(sum(latencies), 2),
+                "chrf": round(sum(scores) / len(scores), 1) if scores else None,
+                "chrf_against": "references" if references else "pivot",
+            }
+            results.append(result)
+            print(f"{lang}  {name:<24} p50 {result['p50_ms']:>8} ms  p95 {result['p95_ms']:>8} ms  "
+                  f"total {result['total_s']:>7} s  chrF {result['chrf']} ({result['chrf_against']})")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
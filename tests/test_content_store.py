@@ -0,0 +1,25 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Modes"))
+
+import content_store
+import precompile_content
+from content_store import ContentStore
+
+
+def test_chinese_drill_finds_precompiled_item(tmp_path, monkeypatch):
+    monkeypatch.setattr(content_store, "AUDIO_DIR", str(tmp_path / "audio"))
+    store = ContentStore(str(tmp_path / "content.db"))
+
+    # Stored the way precompile_content.py builds it...
+    prompt = precompile_content.drill_prompts()[0]
+    key, text, source, target = next(job for job in precompile_content.collect_jobs(["zh"])
+                                     if job[1] == prompt and job[3] == "zh")
+    store.put(key, source, target, text, translation="你好", romanized="ni hao")
+
+    # ...and looked up the way ChinDrill.translate_text asks for it
+    entry = store.get(prompt, "tl", "zh-CN")
+    assert entry is not None
+    assert entry["translation"] == "你好"
+    store.close()
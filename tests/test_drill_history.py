@@ -0,0 +1,32 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Modes", "Drills"))
+
+from drill_history import DrillHistory, read_source
+
+
+def test_editing_accepted_answers_keeps_history(tmp_path):
+    words = tmp_path / "randword.txt"
+    words.write_text("isa|ja=uno\ndalawa\n", encoding="utf-8")
+    history = DrillHistory(str(tmp_path / "history.db"))
+    history.sync_source("ja", "word", str(words))
+    history.record_answer("ja", "word", "isa", "ichi", "ichi", "ichi", 1.0, True)
+
+    words.write_text("isa|ja=uno|ja=ichi\ndalawa\n", encoding="utf-8")
+    os.utime(words, (os.path.getmtime(words) + 10,) * 2)
+    history.sync_source("ja", "word", str(words))
+
+    reps, answers = history.conn.execute(
+        "SELECT reps, (SELECT COUNT(*) FROM answers WHERE item_id = items.id) FROM items WHERE prompt = 'isa'"
+    ).fetchone()
+    assert (reps, answers) == (1, 1)
+    history.close()
+
+
+def test_accepted_answers_are_per_language(tmp_path):
+    words = tmp_path / "randword.txt"
+    words.write_text("isa|ja=ichi|ko=hana\ndalawa\n", encoding="utf-8")
+
+    assert read_source(str(words), "ja") == {"isa": ["ichi"], "dalawa": []}
+    assert read_source(str(words), "zh") == {"isa": [], "dalawa": []}